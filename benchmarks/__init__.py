@@ -0,0 +1 @@
+"""Benchmarks of the integration, run as scripts with the repository root on PYTHONPATH."""
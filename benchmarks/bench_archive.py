@@ -0,0 +1,64 @@
+"""Benchmark of month-long calendar range queries against a year of archived schedules."""
+
+from datetime import datetime, timedelta
+import tempfile
+import time
+from zoneinfo import ZoneInfo
+
+from custom_components.lviv_poweroff.archive import ScheduleArchive
+from custom_components.lviv_poweroff.const import PowerOffGroup
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+
+TZ = ZoneInfo("Europe/Kyiv")
+DAYS = 365
+# Every day is published twice as "tomorrow" and once more as a corrected "today"
+VERSIONS_PER_DAY = 3
+QUERIES = 200
+
+
+def day_periods(day: datetime, shift: int) -> list[PowerOffPeriod]:
+    return [
+        PowerOffPeriod(day + timedelta(hours=hour, minutes=shift), day + timedelta(hours=hour + 3, minutes=shift))
+        for hour in (0, 7, 14, 20)
+    ]
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = ScheduleArchive(f"{tmp}/archive.db", retention_days=DAYS + 30, compact_after_days=7)
+        start = datetime(2025, 1, 1, tzinfo=TZ)
+
+        started = time.perf_counter()
+        for offset in range(DAYS):
+            day = start + timedelta(days=offset)
+            for version in range(VERSIONS_PER_DAY):
+                schedule = {
+                    group.value: day_periods(day, version * 30) + day_periods(day + timedelta(days=1), version * 30)
+                    for group in PowerOffGroup
+                }
+                archive.record(schedule, day, day + timedelta(days=2), day + timedelta(hours=version))
+        record_s = time.perf_counter() - started
+        print(f"recorded {DAYS * VERSIONS_PER_DAY * len(PowerOffGroup)} versions in {record_s:.1f} s")
+
+        query_start = start + timedelta(days=DAYS // 2)
+        query_end = query_start + timedelta(days=31)
+        started = time.perf_counter()
+        for _ in range(QUERIES):
+            periods = archive.periods_between("3.1", query_start, query_end, TZ)
+        query_ms = (time.perf_counter() - started) / QUERIES * 1000
+        print(f"month range query: {len(periods)} periods in {query_ms:.2f} ms")
+
+        started = time.perf_counter()
+        removed = archive.compact(start + timedelta(days=DAYS + 1))
+        print(f"compaction removed {removed} versions in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+        started = time.perf_counter()
+        for _ in range(QUERIES):
+            periods = archive.periods_between("3.1", query_start, query_end, TZ)
+        query_ms = (time.perf_counter() - started) / QUERIES * 1000
+        print(f"month range query after compaction: {len(periods)} periods in {query_ms:.2f} ms")
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
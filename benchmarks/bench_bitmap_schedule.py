@@ -0,0 +1,77 @@
+"""Memory and query benchmark of GroupSchedule bitmaps vs PowerOffPeriod lists for all groups."""
+
+from datetime import datetime, timedelta
+import random
+import timeit
+import tracemalloc
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.lviv_poweroff.bitmap_schedule import GroupSchedule
+from custom_components.lviv_poweroff.const import PowerOffGroup
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.period_index import PowerOffPeriodIndex
+from custom_components.lviv_poweroff.timebase import TimeBase
+
+TZ = dt_util.get_time_zone("Europe/Kyiv")
+TIME_BASE = TimeBase(TZ)
+START = datetime(2026, 1, 1, tzinfo=TZ)
+NUMBER = 20000
+
+
+def make_periods(days: int, rnd: random.Random) -> list[PowerOffPeriod]:
+    """Up to four outages a day on half-hour boundaries."""
+    periods = []
+    for day in range(days):
+        for slot in sorted(rnd.sample(range(0, 48, 6), rnd.randrange(0, 5))):
+            start = START + timedelta(days=day, minutes=30 * slot)
+            periods.append(PowerOffPeriod(start, start + timedelta(minutes=30 * rnd.randrange(2, 7))))
+    return periods
+
+
+def measure(build) -> tuple[object, int]:
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main() -> None:
+    for days in (30, 365):
+        rnd = random.Random(days)
+        periods = {group: make_periods(days, rnd) for group in PowerOffGroup}
+        periods_count = sum(len(p) for p in periods.values())
+
+        lists, lists_size = measure(lambda: {g: make_periods(days, random.Random(days)) for g in PowerOffGroup})
+        bitmaps, bitmaps_size = measure(
+            lambda: {g: GroupSchedule.from_periods(p, TIME_BASE) for g, p in periods.items()}
+        )
+        print(f"{days} days x {len(PowerOffGroup)} groups, {periods_count} periods")
+        print(f"  memory: period lists {lists_size / 1024:.0f} KiB, bitmaps {bitmaps_size / 1024:.0f} KiB")
+
+        schedule = bitmaps[PowerOffGroup.OneOne]
+        index = PowerOffPeriodIndex(periods[PowerOffGroup.OneOne])
+        at = START + timedelta(days=days // 2, hours=13, minutes=17)
+        end = at + timedelta(hours=12)
+
+        def linear_minutes() -> int:
+            return sum(
+                max((min(p.end_datetime, end) - max(p.start_datetime, at)) // timedelta(minutes=1), 0)
+                for p in index.periods
+            )
+
+        schedule.minutes_off(at, end)  # build prefix sums once
+        cases = {
+            "is_off": (lambda: index.period_at(at), lambda: schedule.is_off(at)),
+            "minutes_off": (linear_minutes, lambda: schedule.minutes_off(at, end)),
+            "next_transition": (lambda: index.next_transition(at), lambda: schedule.next_transition(at)),
+        }
+        for name, (baseline, bitmap) in cases.items():
+            baseline_us = timeit.timeit(baseline, number=NUMBER) / NUMBER * 1e6
+            bitmap_us = timeit.timeit(bitmap, number=NUMBER) / NUMBER * 1e6
+            print(f"  {name:>15}: periods {baseline_us:8.2f} us, bitmap {bitmap_us:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
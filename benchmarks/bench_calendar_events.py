@@ -0,0 +1,99 @@
+"""Benchmark of many dashboard clients polling the calendar: events built per request vs shared cached events.
+
+Every client reads the current event and the events of the visible week,
+like the calendar card does on each refresh.
+"""
+
+from datetime import datetime, timedelta
+import random
+import time
+import tracemalloc
+from zoneinfo import ZoneInfo
+
+from homeassistant.components.calendar import CalendarEvent
+
+from custom_components.lviv_poweroff.const import STATE_OFF
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.period_index import PowerOffPeriodIndex
+
+TZ = ZoneInfo("Europe/Kyiv")
+START = datetime(2026, 2, 1, tzinfo=TZ)
+CLIENTS = 200
+POLLS = 20
+
+
+def make_index() -> PowerOffPeriodIndex:
+    """Three outages a day over a month."""
+    rng = random.Random(1)
+    periods = []
+    for day in range(31):
+        for slot in range(3):
+            start = START + timedelta(days=day, hours=slot * 8 + rng.randrange(0, 4))
+            periods.append(PowerOffPeriod(start, start + timedelta(hours=rng.randrange(1, 4))))
+    return PowerOffPeriodIndex(periods)
+
+
+def make_event(period: PowerOffPeriod) -> CalendarEvent:
+    return CalendarEvent(start=period.start_datetime, end=period.end_datetime, summary=STATE_OFF)
+
+
+class PerRequest:
+    """The previous coordinator: a new CalendarEvent for every matching period of every call."""
+
+    def __init__(self, index: PowerOffPeriodIndex) -> None:
+        self.index = index
+
+    def event_at(self, at: datetime) -> CalendarEvent | None:
+        period = self.index.period_at(at)
+        return None if period is None else make_event(period)
+
+    def events_between(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        return [make_event(period) for period in self.index.periods_between(start, end)]
+
+
+class Cached:
+    """The current coordinator: events built once per schedule change, sliced per call."""
+
+    def __init__(self, index: PowerOffPeriodIndex) -> None:
+        self.index = index
+        self.events = tuple(make_event(period) for period in index.periods)
+
+    def event_at(self, at: datetime) -> CalendarEvent | None:
+        i = self.index.position_at(at)
+        return None if i is None else self.events[i]
+
+    def events_between(self, start: datetime, end: datetime) -> list[CalendarEvent]:
+        return list(self.events[self.index.positions_between(start, end)])
+
+
+def poll(calendar, now: datetime, responses: list) -> None:
+    week_start = now - timedelta(days=now.weekday())
+    for _ in range(CLIENTS):
+        responses.append((calendar.event_at(now), calendar.events_between(week_start, week_start + timedelta(days=7))))
+
+
+def main() -> None:
+    index = make_index()
+    now = START + timedelta(days=12, hours=9, minutes=30)
+    print(f"{CLIENTS} clients x {POLLS} polls, {len(index)} periods in the schedule")
+    print(f"{'strategy':>12} {'us/request':>10} {'KiB/request':>11} {'blocks/request':>14}")
+    for name, calendar in (("per request", PerRequest(index)), ("cached", Cached(index))):
+        started = time.perf_counter()
+        for _ in range(POLLS):
+            poll(calendar, now, [])
+        elapsed_us = (time.perf_counter() - started) * 1e6 / (CLIENTS * POLLS)
+
+        # Responses are kept alive to count what every request allocates
+        responses: list = []
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        poll(calendar, now, responses)
+        stats = tracemalloc.take_snapshot().compare_to(before, "filename")
+        tracemalloc.stop()
+        size = sum(stat.size_diff for stat in stats) / CLIENTS / 1024
+        blocks = sum(stat.count_diff for stat in stats) / CLIENTS
+        print(f"{name:>12} {elapsed_us:>10.1f} {size:>11.2f} {blocks:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark of Energy UA page parsing: full BeautifulSoup tree vs the scale_hours scoped single pass.
+
+The fixture pages are used as they are and with today's and tomorrow's
+scale_hours blocks from the stand-in added, like the current site has them.
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+import re
+import time
+import tracemalloc
+from zoneinfo import ZoneInfo
+
+from bs4 import BeautifulSoup
+
+from custom_components.lviv_poweroff.energyua_scrapper import EnergyUaScrapper
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.intervals import normalize_periods
+from tests.standin_server import StandInConfig, StandInServer
+
+TESTS = Path(__file__).parent.parent / "tests"
+PAGES = ("energyua_11_page.html", "energyua_12_page.html")
+TZ = ZoneInfo("Europe/Kyiv")
+TODAY = date(2024, 2, 9)
+NUMBER = 50
+
+
+def legacy_parse(scrapper: EnergyUaScrapper, content: str, today: date) -> list[PowerOffPeriod]:
+    """The previous parse: the whole page as a tree, then nested finds per day and hour."""
+    soup = BeautifulSoup(content, "html.parser")
+    results = []
+    scale_hours = soup.find_all("div", class_="scale_hours")
+    for offset, block in enumerate(scale_hours[:2]):
+        day = today + timedelta(days=offset)
+        for item in block.find_all("div", class_="scale_hours_el"):
+            if item.find("span", class_="hour_active"):
+                start = int(item.find("i", class_="hour_info_from").text.split(":")[0])
+                end = int(item.find("i", class_="hour_info_to").text.split(":")[0])
+                end = end if end > start else end + 24
+                results.append(
+                    PowerOffPeriod(
+                        scrapper.time_base.at_minutes(day, start * 60), scrapper.time_base.at_minutes(day, end * 60)
+                    )
+                )
+    return normalize_periods(results)
+
+
+def scoped_parse(scrapper: EnergyUaScrapper, content: str, today: date) -> list[PowerOffPeriod]:
+    return scrapper.parse_page(content, today)
+
+
+def measure(parse, scrapper: EnergyUaScrapper, content: str) -> tuple[float, float]:
+    """Mean parse time in ms and peak traced memory in KiB."""
+    started = time.perf_counter()
+    for _ in range(NUMBER):
+        parse(scrapper, content, TODAY)
+    elapsed_ms = (time.perf_counter() - started) * 1000 / NUMBER
+    tracemalloc.start()
+    parse(scrapper, content, TODAY)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024
+
+
+def main() -> None:
+    scrapper = EnergyUaScrapper("1.2", TZ)
+    blocks = re.search(r'<div class="scale_hours">.*</div>', StandInServer(StandInConfig(seed=7)).energyua_page("1.2"))
+    print(f"{'page':>32} {'periods':>7} {'tree ms':>8} {'tree KiB':>9} {'scoped ms':>9} {'scoped KiB':>10}")
+    for name in PAGES:
+        page = (TESTS / name).read_text(encoding="utf-8")
+        for label, content in (
+            (name, page),
+            (f"{name} + schedule", page.replace("</body>", blocks.group(0) + "</body>")),
+        ):
+            expected = legacy_parse(scrapper, content, TODAY)
+            assert scoped_parse(scrapper, content, TODAY) == expected
+            tree_ms, tree_kib = measure(legacy_parse, scrapper, content)
+            scoped_ms, scoped_kib = measure(scoped_parse, scrapper, content)
+            print(
+                f"{label:>32} {len(expected):>7} {tree_ms:>8.2f} {tree_kib:>9.0f} {scoped_ms:>9.2f} {scoped_kib:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
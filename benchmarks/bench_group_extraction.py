@@ -0,0 +1,70 @@
+"""Benchmark of LOE group extraction: per-group regex + strptime vs the single-pass extractor."""
+
+from datetime import date, datetime, timedelta
+import json
+from pathlib import Path
+import re
+import timeit
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.lviv_poweroff.const import PowerOffGroup
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.html_text import extract_text_stream
+from custom_components.lviv_poweroff.loe_scrapper import DATE_PATTERN, extract_day_periods
+from custom_components.lviv_poweroff.timebase import TimeBase
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "loe_menus_page.json"
+TZ = dt_util.get_time_zone("Europe/Kyiv")
+NUMBER = 300
+
+
+def per_group_periods(date_str: str, text: str, group: str) -> list[PowerOffPeriod]:
+    """The previous extraction path: one dynamic regex and strptime per bound for each group."""
+    periods = []
+    group_match = re.search(rf"Група {re.escape(group)}\. Електроенергії немає з (.*?)\.", text)
+    if group_match:
+        for r in group_match.group(1).split(", "):
+            times = re.findall(r"(\d{2}:\d{2})", r)
+            if len(times) == 2:
+                start_str, end_str = times
+                start_dt = datetime.strptime(f"{date_str} {start_str}", "%d.%m.%Y %H:%M").replace(tzinfo=TZ)
+                if end_str == "24:00":
+                    end_dt = datetime.strptime(f"{date_str} 00:00", "%d.%m.%Y %H:%M").replace(tzinfo=TZ) + timedelta(
+                        days=1
+                    )
+                else:
+                    end_dt = datetime.strptime(f"{date_str} {end_str}", "%d.%m.%Y %H:%M").replace(tzinfo=TZ)
+                periods.append(PowerOffPeriod(start_dt, end_dt))
+    return periods
+
+
+def main() -> None:
+    data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    texts = [extract_text_stream(item["rawHtml"]) for item in data["hydra:member"][0]["menuItems"][:2]]
+    days = []
+    for text in texts:
+        match = DATE_PATTERN.search(text)
+        days.append((match.group(0)[3:], date(int(match.group(3)), int(match.group(2)), int(match.group(1))), text))
+
+    def legacy() -> None:
+        for date_str, _, text in days:
+            for group in PowerOffGroup:
+                per_group_periods(date_str, text, group)
+
+    time_base = TimeBase(TZ)
+
+    def single_pass() -> None:
+        for _, day, text in days:
+            extract_day_periods(day, text, time_base)
+
+    groups = len(days) * len(PowerOffGroup)
+    print(f"{'path':>12} {'groups/s':>10} {'speedup':>8}")
+    legacy_rate = groups * NUMBER / timeit.timeit(legacy, number=NUMBER)
+    single_rate = groups * NUMBER / timeit.timeit(single_pass, number=NUMBER)
+    print(f"{'per-group':>12} {legacy_rate:>10.0f} {1:>7.1f}x")
+    print(f"{'single-pass':>12} {single_rate:>10.0f} {single_rate / legacy_rate:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Benchmark of the html_text backends on the recorded LOE rawHtml items."""
+
+import json
+from pathlib import Path
+import timeit
+
+from custom_components.lviv_poweroff.html_text import TEXT_EXTRACTORS, extract_text_bs4, get_text_extractor
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "loe_menus_page.json"
+NUMBER = 500
+
+
+def main() -> None:
+    data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    items = [item["rawHtml"] for item in data["hydra:member"][0]["menuItems"]]
+
+    reference_us = None
+    print(f"{'backend':>8} {'us/item':>9} {'speedup':>8}")
+    for name in ("bs4", *(name for name in TEXT_EXTRACTORS if name != "bs4")):
+        extractor = get_text_extractor(name)
+        if name != "bs4" and extractor is extract_text_bs4:
+            print(f"{name:>8} {'n/a':>9} (not installed)")
+            continue
+        seconds = timeit.timeit(lambda: [extractor(html) for html in items], number=NUMBER)
+        per_item_us = seconds / NUMBER / len(items) * 1e6
+        reference_us = reference_us or per_item_us
+        print(f"{name:>8} {per_item_us:>9.1f} {reference_us / per_item_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
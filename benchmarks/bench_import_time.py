@@ -0,0 +1,99 @@
+"""Benchmark of the integration import time with a recorded budget, in the style of ``python -X importtime``.
+
+The modules Home Assistant has already loaded when it sets the integration up
+are imported first, so only the cost added by the integration is measured.
+Exits with status 1 when the cost exceeds IMPORT_BUDGET_MS or a deferred
+dependency is imported eagerly.
+
+    PYTHONPATH=. python benchmarks/bench_import_time.py
+"""
+
+from dataclasses import dataclass, field
+import os
+import subprocess
+import sys
+
+# Loaded by Home Assistant before any integration is set up
+PRELOADED_MODULES = (
+    "aiohttp",
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.components.calendar",
+    "homeassistant.components.sensor",
+    "homeassistant.helpers.aiohttp_client",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.storage",
+    "homeassistant.helpers.update_coordinator",
+)
+# The integration and the platforms Home Assistant imports on setup
+INTEGRATION_MODULES = (
+    "custom_components.lviv_poweroff",
+    "custom_components.lviv_poweroff.calendar",
+    "custom_components.lviv_poweroff.sensor",
+    "custom_components.lviv_poweroff.config_flow",
+    "custom_components.lviv_poweroff.diagnostics",
+)
+# Imported on first use only: the Energy UA parser and the archive database
+DEFERRED_MODULES = ("bs4", "lxml", "sqlite3")
+
+# Recorded at 43 ms on a developer machine, 72 ms before bs4 and sqlite3 were deferred
+IMPORT_BUDGET_MS = 65.0
+RUNS = 5
+
+
+@dataclass
+class ImportReport:
+    """Import cost of the integration measured in a fresh interpreter."""
+
+    total_ms: float
+    modules_ms: dict[str, float] = field(default_factory=dict)
+    deferred_loaded: list[str] = field(default_factory=list)
+
+
+def measure_import() -> ImportReport:
+    """Import the integration in a fresh interpreter and parse its -X importtime output."""
+    code = (
+        f"import importlib, sys\n"
+        f"for name in {PRELOADED_MODULES!r}: importlib.import_module(name)\n"
+        f"print('--- integration ---', file=sys.stderr, flush=True)\n"
+        f"for name in {INTEGRATION_MODULES!r}: importlib.import_module(name)\n"
+        f"print(','.join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(path or os.curdir for path in sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+
+    report = ImportReport(0.0, deferred_loaded=[name for name in result.stdout.strip().split(",") if name])
+    _, _, integration = result.stderr.partition("--- integration ---")
+    for line in integration.splitlines():
+        # "import time: self [us] | cumulative | imported package", nesting indents the name
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if name.strip().startswith("custom_components."):
+            report.modules_ms[name.strip()] = int(self_us) / 1000
+        if not name.startswith("  "):
+            report.total_ms += int(cumulative_us) / 1000
+    return report
+
+
+def measure_best(runs: int = RUNS) -> ImportReport:
+    """The fastest of several measurements, the others being disturbed by the machine."""
+    return min((measure_import() for _ in range(runs)), key=lambda report: report.total_ms)
+
+
+def main() -> None:
+    report = measure_best()
+    for name, self_ms in sorted(report.modules_ms.items(), key=lambda item: -item[1]):
+        print(f"{self_ms:>8.2f} ms  {name}")
+    print(f"{report.total_ms:>8.2f} ms  total, budget {IMPORT_BUDGET_MS:.0f} ms")
+    if report.deferred_loaded:
+        print(f"Deferred modules imported eagerly: {', '.join(report.deferred_loaded)}")
+    if report.total_ms > IMPORT_BUDGET_MS or report.deferred_loaded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark of the refresh instrumentation overhead, disabled and enabled."""
+
+import json
+from pathlib import Path
+import timeit
+from zoneinfo import ZoneInfo
+
+from custom_components.lviv_poweroff.instrumentation import Instrumentation
+from custom_components.lviv_poweroff.loe_scrapper import MENU_ITEM_NAMES, LoeScrapper
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "loe_menus_page.json"
+TZ = ZoneInfo("Europe/Kyiv")
+NUMBER = 200_000
+PARSES = 500
+
+
+def main() -> None:
+    for enabled in (False, True):
+        instrumentation = Instrumentation(enabled=enabled)
+
+        def timed() -> None:
+            with instrumentation.span("phase"):
+                pass
+
+        span_ns = timeit.timeit(timed, number=NUMBER) / NUMBER * 1e9
+        print(f"span {'enabled' if enabled else 'disabled':>8}: {span_ns:.0f} ns")
+
+    menu = json.loads(FIXTURE.read_text(encoding="utf-8"))["hydra:member"][0]
+    items = [item for item in menu["menuItems"] if item["name"] in MENU_ITEM_NAMES]
+    for enabled in (False, True):
+        scrapper = LoeScrapper(None, TZ, instrumentation=Instrumentation(enabled=enabled))
+
+        def parse(scrapper: LoeScrapper = scrapper) -> None:
+            # Every parse starts cold, parsed items are not reused
+            scrapper.invalidate_cache()
+            scrapper._parse_menu_items(items)
+
+        parse_us = timeit.timeit(parse, number=PARSES) / PARSES * 1e6
+        print(f"menu parse, instrumentation {'enabled' if enabled else 'disabled':>8}: {parse_us:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark of normalize_periods against the merge loops the scrappers used before."""
+
+from datetime import datetime, timedelta
+import random
+import timeit
+from zoneinfo import ZoneInfo
+
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.intervals import normalize_periods
+
+TZ = ZoneInfo("Europe/Kyiv")
+NUMBER = 20
+
+
+def make_periods(count: int) -> list[PowerOffPeriod]:
+    """Half hour aligned periods over a month, shuffled, with overlaps and adjacency."""
+    rng = random.Random(count)
+    base = datetime(2026, 1, 1, tzinfo=TZ)
+    periods = []
+    for _ in range(count):
+        start = base + timedelta(minutes=30 * rng.randrange(0, 31 * 48))
+        periods.append(PowerOffPeriod(start, start + timedelta(minutes=30 * rng.randrange(1, 9))))
+    return periods
+
+
+def legacy_adjacent_merge(raw_periods: list[PowerOffPeriod]) -> list[PowerOffPeriod]:
+    """LoeScrapper._merge_periods: adjacency only, overlaps are kept."""
+    raw_periods.sort(key=lambda x: x.start_datetime)
+    merged_periods = []
+    current = raw_periods[0]
+    for nxt in raw_periods[1:]:
+        if current.end_datetime == nxt.start_datetime:
+            current.end_datetime = nxt.end_datetime
+        else:
+            merged_periods.append(current)
+            current = nxt
+    merged_periods.append(current)
+    return merged_periods
+
+
+def legacy_overlap_merge(periods: list[PowerOffPeriod]) -> list[PowerOffPeriod]:
+    """EnergyUaScrapper.merge_periods: overlaps merged by mutating the input."""
+    periods.sort(key=lambda x: x.start_datetime)
+    merged_periods = [periods[0]]
+    for current in periods[1:]:
+        last = merged_periods[-1]
+        if current.start_datetime <= last.end_datetime:
+            last.end_datetime = max(last.end_datetime, current.end_datetime)
+            continue
+        merged_periods.append(current)
+    return merged_periods
+
+
+def main() -> None:
+    print(f"{'periods':>7} {'normalize ms':>12} {'result':>6} {'legacy LOE ms':>13} {'result':>6} {'legacy UA ms':>12}")
+    for count in (100, 1000, 10000, 100000):
+        periods = make_periods(count)
+
+        def copies() -> list[PowerOffPeriod]:
+            # The legacy merges mutate their input, so each run gets fresh objects
+            return [PowerOffPeriod(p.start_datetime, p.end_datetime) for p in periods]
+
+        copy_ms = timeit.timeit(copies, number=NUMBER) / NUMBER * 1000
+        normalize_ms = timeit.timeit(lambda: normalize_periods(periods), number=NUMBER) / NUMBER * 1000
+        loe_ms = timeit.timeit(lambda: legacy_adjacent_merge(copies()), number=NUMBER) / NUMBER * 1000 - copy_ms
+        ua_ms = timeit.timeit(lambda: legacy_overlap_merge(copies()), number=NUMBER) / NUMBER * 1000 - copy_ms
+        print(
+            f"{count:>7} {normalize_ms:>12.2f} {len(normalize_periods(periods)):>6} {loe_ms:>13.2f} "
+            f"{len(legacy_adjacent_merge(copies())):>6} {ua_ms:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
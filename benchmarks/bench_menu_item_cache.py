@@ -0,0 +1,43 @@
+"""Benchmark of parsing the LOE menu items when all, one or none of them changed since the last poll."""
+
+import json
+from pathlib import Path
+import timeit
+from zoneinfo import ZoneInfo
+
+from custom_components.lviv_poweroff.loe_scrapper import MENU_ITEM_NAMES, LoeScrapper
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "loe_menus_page.json"
+TZ = ZoneInfo("Europe/Kyiv")
+PARSES = 500
+
+
+def main() -> None:
+    menu = json.loads(FIXTURE.read_text(encoding="utf-8"))["hydra:member"][0]
+    items = [item for item in menu["menuItems"] if item["name"] in MENU_ITEM_NAMES]
+    scrapper = LoeScrapper(None, TZ)
+    expected = scrapper._parse_menu_items(items)
+    # Tomorrow's schedule is republished with a different "as of" time
+    versions = [
+        [items[0], {**items[1], "rawHtml": items[1]["rawHtml"].replace("19:40", f"{i % 60:02d}:{i // 60 % 60:02d}")}]
+        for i in range(PARSES)
+    ]
+    assert scrapper._parse_menu_items(versions[0]) == expected
+
+    def all_changed() -> None:
+        scrapper.invalidate_cache()
+        scrapper._parse_menu_items(items)
+
+    changed = iter(versions * 3)
+    cases = {
+        "all items changed": all_changed,
+        "one item changed": lambda: scrapper._parse_menu_items(next(changed)),
+        "no item changed": lambda: scrapper._parse_menu_items(items),
+    }
+    for name, parse in cases.items():
+        parse_us = timeit.timeit(parse, number=PARSES) / PARSES * 1e6
+        print(f"{name:>17}: {parse_us:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
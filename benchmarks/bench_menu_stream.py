@@ -0,0 +1,73 @@
+"""Benchmark of peak memory while decoding growing LOE menus responses: full json.loads vs streaming scan."""
+
+import json
+from pathlib import Path
+import time
+import tracemalloc
+
+from custom_components.lviv_poweroff.const import RESPONSE_CHUNK_SIZE
+from custom_components.lviv_poweroff.loe_scrapper import DATED_ITEM_PATTERN, MENU_ITEM_NAMES
+from custom_components.lviv_poweroff.menu_stream import MenuItemsScanner
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "loe_menus_page.json"
+# Size of a synthetic history item, like an archived day of the LOE page
+HISTORY_HTML_SIZE = 20 * 1024
+
+
+def make_payload(history_items: int) -> bytes:
+    """The fixture response with history items added to the first and later members."""
+    data = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    first = data["hydra:member"][0]
+    history_html = "<p>Графік погодинних відключень</p>" * (HISTORY_HTML_SIZE // 40)
+    archive = [
+        {"@id": f"/api/menu_items/{i}", "name": "Archive", "rawHtml": history_html} for i in range(history_items)
+    ]
+    first["menuItems"] = [*first["menuItems"], *archive[: history_items // 4]]
+    data["hydra:member"].extend(
+        {"@id": f"/api/menus/{i}", "name": "History", "menuItems": archive[i : i + 10]}
+        for i in range(0, history_items, 10)
+    )
+    return json.dumps(data, ensure_ascii=False).encode()
+
+
+def full_decode(body: bytes) -> list:
+    data = json.loads(body)
+    return [item for item in data["hydra:member"][0]["menuItems"] if item["name"] in MENU_ITEM_NAMES]
+
+
+def streamed_decode(body: bytes) -> list:
+    scanner = MenuItemsScanner(MENU_ITEM_NAMES, DATED_ITEM_PATTERN)
+    # The response body itself is never held, only one chunk at a time
+    view = memoryview(body)
+    for i in range(0, len(body), RESPONSE_CHUNK_SIZE):
+        if scanner.feed(bytes(view[i : i + RESPONSE_CHUNK_SIZE])):
+            break
+    return scanner.items
+
+
+def measure(decode, body: bytes) -> tuple[float, float]:
+    """Peak traced memory of a decode in MiB and its untraced duration in ms."""
+    started = time.perf_counter()
+    decode(body)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    tracemalloc.start()
+    decode(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024, elapsed_ms
+
+
+def main() -> None:
+    print(f"{'payload MiB':>11} {'full peak MiB':>13} {'full ms':>8} {'stream peak MiB':>15} {'stream ms':>9}")
+    for history_items in (0, 50, 200, 800, 3200):
+        body = make_payload(history_items)
+        assert full_decode(body) == streamed_decode(body)
+        full_peak, full_ms = measure(full_decode, body)
+        stream_peak, stream_ms = measure(streamed_decode, body)
+        print(
+            f"{len(body) / 1024 / 1024:>11.1f} {full_peak:>13.2f} {full_ms:>8.1f} {stream_peak:>15.2f} {stream_ms:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Micro-benchmark of coordinator period lookups: linear scan vs PowerOffPeriodIndex."""
+
+from datetime import datetime, timedelta
+import timeit
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.period_index import PowerOffPeriodIndex
+
+TZ = dt_util.get_time_zone("Europe/Kyiv")
+NUMBER = 2000
+
+
+def make_periods(weeks: int) -> list[PowerOffPeriod]:
+    """Four 3.5 hour outages a day, like a heavy LOE schedule."""
+    start = datetime(2026, 1, 5, tzinfo=TZ)
+    periods = []
+    for day in range(weeks * 7):
+        for hour in (0, 7, 14, 20):
+            begin = start + timedelta(days=day, hours=hour)
+            periods.append(PowerOffPeriod(begin, begin + timedelta(hours=3, minutes=30)))
+    return periods
+
+
+def linear_event_at(periods: list[PowerOffPeriod], at: datetime) -> PowerOffPeriod | None:
+    for period in periods:
+        if period.start_datetime <= at <= period.end_datetime:
+            return period
+    return None
+
+
+def linear_next_poweron(periods: list[PowerOffPeriod], now: datetime) -> datetime | None:
+    until = now + timedelta(hours=24)
+    events = [p for p in periods if now <= p.start_datetime <= until or now <= p.end_datetime <= until]
+    for dt in sorted(p.end_datetime for p in events):
+        if dt > now:
+            return dt
+    return None
+
+
+def main() -> None:
+    print(f"{'weeks':>5} {'periods':>7} {'query':>12} {'linear us':>10} {'index us':>9} {'speedup':>8}")
+    for weeks in (1, 4, 12, 52):
+        periods = make_periods(weeks)
+        index = PowerOffPeriodIndex(periods)
+        now = periods[len(periods) // 2].start_datetime + timedelta(hours=1)
+
+        cases = {
+            "event_at": (lambda: linear_event_at(periods, now), lambda: index.period_at(now)),
+            "next_poweron": (
+                lambda: linear_next_poweron(periods, now),
+                lambda: index.next_end(now, now + timedelta(hours=24)),
+            ),
+        }
+        for name, (linear, indexed) in cases.items():
+            linear_us = timeit.timeit(linear, number=NUMBER) / NUMBER * 1e6
+            index_us = timeit.timeit(indexed, number=NUMBER) / NUMBER * 1e6
+            print(
+                f"{weeks:>5} {len(periods):>7} {name:>12} {linear_us:>10.2f} {index_us:>9.2f} "
+                f"{linear_us / index_us:>7.1f}x"
+            )
+
+    build_us = timeit.timeit(lambda: PowerOffPeriodIndex(make_periods(4)), number=200) / 200 * 1e6
+    print(f"index build (4 weeks, incl. list creation): {build_us:.1f} us per refresh")
+
+
+if __name__ == "__main__":
+    main()
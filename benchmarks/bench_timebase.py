@@ -0,0 +1,56 @@
+"""Benchmark of building the aware bounds of parsed periods: strptime, the datetime constructor and TimeBase."""
+
+from datetime import date, datetime
+import timeit
+from zoneinfo import ZoneInfo
+
+from custom_components.lviv_poweroff.timebase import TimeBase
+
+TZ = ZoneInfo("Europe/Kyiv")
+DAY = date(2026, 3, 29)
+# Half hour bounds of a day, as they appear in the LOE texts
+BOUNDS = [f"{minute // 60:02d}:{minute % 60:02d}" for minute in range(0, 24 * 60, 30)]
+NUMBER = 2000
+
+
+def with_strptime() -> None:
+    for hhmm in BOUNDS:
+        datetime.strptime(f"29.03.2026 {hhmm}", "%d.%m.%Y %H:%M").replace(tzinfo=TZ)
+
+
+def with_constructor() -> None:
+    for hhmm in BOUNDS:
+        datetime(DAY.year, DAY.month, DAY.day, int(hhmm[:2]), int(hhmm[3:]), tzinfo=TZ)
+
+
+def with_cold_time_base() -> None:
+    time_base = TimeBase(TZ)
+    for hhmm in BOUNDS:
+        time_base.at(DAY, hhmm)
+
+
+WARM = TimeBase(TZ)
+
+
+def with_warm_time_base() -> None:
+    for hhmm in BOUNDS:
+        WARM.at(DAY, hhmm)
+
+
+def main() -> None:
+    print(f"Bounds of {DAY}, a daylight saving time change day in {TZ}")
+    print(f"{'path':>16} {'ns/bound':>9} {'speedup':>8}")
+    baseline = None
+    for name, build in (
+        ("strptime", with_strptime),
+        ("constructor", with_constructor),
+        ("TimeBase cold", with_cold_time_base),
+        ("TimeBase warm", with_warm_time_base),
+    ):
+        per_bound = timeit.timeit(build, number=NUMBER) / NUMBER / len(BOUNDS) * 1e9
+        baseline = baseline or per_bound
+        print(f"{name:>16} {per_bound:>9.0f} {baseline / per_bound:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""Load and soak harness polling the local LOE/Energy UA stand-in from many simulated installs.
+
+Every install runs the real LvivPowerOffHub and a coordinator per group on a
+minimal Home Assistant stand-in with its own connection pool, so the hedged
+fetch, the circuit breaker, the adaptive polling and the archive all take part.
+Time is compressed by ``--speed`` so hours of polling fit in minutes. The
+stand-in upstreams run in a separate process so their work does not show up in
+the measured event loop and RSS.
+
+    PYTHONPATH=. python benchmarks/soak.py --installs 100 --duration 600 --speed 60
+"""
+
+import argparse
+import asyncio
+from dataclasses import asdict
+from datetime import datetime, timedelta
+import multiprocessing
+import os
+import random
+import resource
+import statistics
+import tempfile
+import time
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import aiohttp
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.lviv_poweroff import energyua_scrapper, loe_scrapper
+from custom_components.lviv_poweroff.circuit_breaker import CircuitBreaker
+from custom_components.lviv_poweroff.const import DOMAIN, HEDGE_DELAY, KEEPALIVE_TIMEOUT, PowerOffGroup
+from custom_components.lviv_poweroff.hub import LvivPowerOffHub
+from custom_components.lviv_poweroff.instrumentation import Instrumentation
+from custom_components.lviv_poweroff.polling import AdaptivePollScheduler
+from tests.hass_standin import HassStandIn, add_coordinator, patch_hub
+from tests.standin_server import StandInConfig, StandInServer
+
+TZ = ZoneInfo("Europe/Kyiv")
+# Sleeps longer than this over the expected wake up count as event loop blocking
+LAG_PROBE_INTERVAL = 0.05
+LAG_THRESHOLD = 0.005
+
+
+class SimulatedClock:
+    """Wall and monotonic clocks running `speed` times faster than real time."""
+
+    def __init__(self, speed: float) -> None:
+        self.speed = speed
+        self.start = datetime.now(TZ)
+        self._started = time.monotonic()
+
+    def monotonic(self) -> float:
+        return self._started + (time.monotonic() - self._started) * self.speed
+
+    def now(self) -> datetime:
+        return self.start + timedelta(seconds=(time.monotonic() - self._started) * self.speed)
+
+
+class CompressedLoop:
+    """Event loop proxy firing the timers of the Home Assistant helpers `speed` times sooner."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, speed: float) -> None:
+        self._loop = loop
+        self.speed = speed
+
+    def __getattr__(self, name: str):
+        return getattr(self._loop, name)
+
+    def call_at(self, when: float, callback, *args, context=None) -> asyncio.TimerHandle:
+        now = self._loop.time()
+        return self._loop.call_at(now + (when - now) / self.speed, callback, *args, context=context)
+
+    def call_later(self, delay: float, callback, *args, context=None) -> asyncio.TimerHandle:
+        return self._loop.call_later(delay / self.speed, callback, *args, context=context)
+
+
+class RefreshTimings(Instrumentation):
+    """Instrumentation also keeping every hub fetch latency for the report."""
+
+    def __init__(self, latencies: list[float]) -> None:
+        super().__init__(enabled=True)
+        self._latencies = latencies
+
+    def record(self, name: str, value_ms: float) -> None:
+        super().record(name, value_ms)
+        if name == "hub.fetch":
+            self._latencies.append(value_ms)
+
+
+class Install:
+    """One simulated Home Assistant install with the hub and the coordinators of its groups."""
+
+    def __init__(
+        self,
+        index: int,
+        groups: list[str],
+        hedge_delay: float | None,
+        config_dir: str,
+        clock: SimulatedClock,
+        latencies: list[float],
+    ) -> None:
+        connector = aiohttp.TCPConnector(keepalive_timeout=KEEPALIVE_TIMEOUT)
+        loop = CompressedLoop(asyncio.get_running_loop(), clock.speed)
+        self.hass = HassStandIn(config_dir, aiohttp.ClientSession(connector=connector), loop)  # type: ignore[arg-type]
+        self.hub = LvivPowerOffHub(self.hass)  # type: ignore[arg-type]
+        self.hass.data[DOMAIN] = self.hub
+        self.hub.fetcher.hedge_delay = hedge_delay
+        self.hub.poll_scheduler = AdaptivePollScheduler(rng=random.Random(index))
+        self.hub.breaker = CircuitBreaker(clock=clock.monotonic)
+        self.hub.instrumentation = self.hub.api.instrumentation = RefreshTimings(latencies)
+        self.coordinators = [add_coordinator(self.hass, self.hub, group) for group in groups]
+
+    @property
+    def changes(self) -> int:
+        return sum(coordinator.update_stats.notified for coordinator in self.coordinators)
+
+    async def start(self) -> None:
+        # Installs start spread over the first poll interval like restarts in the wild,
+        # the hub polls on its own from the first refresh on
+        await asyncio.sleep(random.uniform(0, 1))
+        for coordinator in self.coordinators:
+            await coordinator.async_refresh()
+
+    async def close(self) -> None:
+        for coordinator in self.coordinators:
+            await coordinator.async_shutdown()
+        await self.hub.async_shutdown()
+        await self.hass.async_block_till_done()
+        await self.hass.session.close()
+
+
+class LoopMonitor:
+    """Measures how long the event loop is blocked past its scheduled wake ups."""
+
+    def __init__(self) -> None:
+        self.blocked = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+
+    async def run(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            lag = time.perf_counter() - started - LAG_PROBE_INTERVAL
+            if lag > LAG_THRESHOLD:
+                self.blocked += lag
+                self.stalls += 1
+                self.max_lag = max(self.max_lag, lag)
+
+
+def rss_mib() -> float:
+    """Current resident set size, or the peak one where /proc is not available."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def serve_standin(config: StandInConfig, conn) -> None:
+    """Run the stand-in in a child process until the parent asks for its counters."""
+
+    async def serve() -> None:
+        server = StandInServer(config)
+        await server.start()
+        conn.send((server.loe_url, server.energyua_url))
+        await asyncio.get_running_loop().run_in_executor(None, conn.recv)
+        conn.send((dict(server.requests), dict(server.responses)))
+        await server.close()
+
+    asyncio.run(serve())
+
+
+def percentile(values: list[float], pct: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[pct - 1]
+
+
+async def soak(args: argparse.Namespace, loe_url: str, energyua_url: str) -> dict:
+    loe_scrapper.URL = loe_url
+    energyua_scrapper.URL = energyua_url
+    groups = [group.value for group in PowerOffGroup]
+    clock = SimulatedClock(args.speed)
+    stop = asyncio.Event()
+    monitor = LoopMonitor()
+    latencies: list[float] = []
+
+    with tempfile.TemporaryDirectory() as config_root, patch_hub(), patch.object(dt_util, "now", clock.now):
+        rss_start = rss_mib()
+        installs = []
+        for i in range(args.installs):
+            config_dir = os.path.join(config_root, str(i))
+            os.makedirs(config_dir)
+            group = groups[i % len(groups)]
+            installs.append(Install(i, [group], args.hedge_delay, config_dir, clock, latencies))
+
+        monitor_task = asyncio.create_task(monitor.run(stop))
+        await asyncio.gather(*(install.start() for install in installs))
+        started = time.monotonic()
+        while (elapsed := time.monotonic() - started) < args.duration:
+            await asyncio.sleep(min(args.report_every, args.duration - elapsed))
+            print(
+                f"[{time.monotonic() - started:7.0f}s, simulated {clock.now():%d.%m %H:%M}] "
+                f"refreshes {len(latencies)}, p50 {percentile(latencies, 50):.1f} ms, "
+                f"p99 {percentile(latencies, 99):.1f} ms, loop blocked {monitor.blocked:.2f} s, "
+                f"rss {rss_mib():.1f} MiB",
+                flush=True,
+            )
+        stop.set()
+        await monitor_task
+        rss_end = rss_mib()
+        for install in installs:
+            await install.close()
+
+    sources: dict[str, dict] = {}
+    for install in installs:
+        for name, stats in install.hub.fetcher.stats.items():
+            totals = sources.setdefault(name, {"requests": 0, "wins": 0, "failures": 0, "cancelled": 0})
+            for key in totals:
+                totals[key] += getattr(stats, key)
+    cache: dict[str, int] = {}
+    for install in installs:
+        for key, value in asdict(install.hub.api.cache_stats).items():
+            cache[key] = cache.get(key, 0) + value
+
+    return {
+        "refreshes": len(latencies),
+        "schedule changes seen": sum(install.changes for install in installs),
+        "refresh p50 ms": round(percentile(latencies, 50), 1),
+        "refresh p99 ms": round(percentile(latencies, 99), 1),
+        "loop blocked s": round(monitor.blocked, 3),
+        "loop stalls": monitor.stalls,
+        "loop max lag ms": round(monitor.max_lag * 1000, 1),
+        "rss start MiB": round(rss_start, 1),
+        "rss end MiB": round(rss_end, 1),
+        "rss growth MiB": round(rss_end - rss_start, 1),
+        "sources": sources,
+        "loe cache": cache,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--installs", type=int, default=50, help="number of simulated installs")
+    parser.add_argument("--duration", type=float, default=60, help="real seconds to run")
+    parser.add_argument("--speed", type=float, default=60, help="simulated seconds per real second")
+    parser.add_argument("--report-every", type=float, default=10, help="real seconds between progress lines")
+    parser.add_argument("--hedge-delay", type=float, default=HEDGE_DELAY, help="hedge delay in real seconds")
+    parser.add_argument("--loe-latency", type=float, default=0.05)
+    parser.add_argument("--energyua-latency", type=float, default=0.05)
+    parser.add_argument("--latency-jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--history-items", type=int, default=50, help="archive items padding the LOE response")
+    parser.add_argument(
+        "--change-every", type=float, default=3 * 3600, help="simulated seconds between schedule changes"
+    )
+    args = parser.parse_args()
+
+    config = StandInConfig(
+        loe_latency=args.loe_latency,
+        energyua_latency=args.energyua_latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        history_items=args.history_items,
+        change_every=args.change_every / args.speed,
+    )
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=serve_standin, args=(config, child), daemon=True)
+    process.start()
+    loe_url, energyua_url = parent.recv()
+
+    report = asyncio.run(soak(args, loe_url, energyua_url))
+    parent.send("stop")
+    server_requests, server_responses = parent.recv()
+    process.join()
+
+    report["server requests"] = server_requests
+    report["server responses"] = server_responses
+    width = max(map(len, report))
+    for key, value in report.items():
+        print(f"{key:>{width}}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,32 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 
+from .const import DOMAIN
 from .coordinator import LvivPowerOffCoordinator
+from .hub import LvivPowerOffHub
+from .profiling import async_register_services, async_unregister_services
 
 PLATFORMS: list[Platform] = [Platform.CALENDAR, Platform.SENSOR]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Lviv Power Offline from a config entry."""
-    coordinator = LvivPowerOffCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = LvivPowerOffHub(hass)
+        async_register_services(hass)
+    hub: LvivPowerOffHub = hass.data[DOMAIN]
+
+    coordinator = LvivPowerOffCoordinator(hass, entry, hub)
+    # Subscribe first so the hub knows the group before its first fetch
+    coordinator.async_subscribe_to_hub()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        await coordinator.async_shutdown()
+        await _async_release_hub(hass)
+        raise
 
     entry.runtime_data = coordinator
 
@@ -25,4 +41,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.async_shutdown()
+        await _async_release_hub(hass)
+
+    return unload_ok
+
+
+async def _async_release_hub(hass: HomeAssistant) -> None:
+    """Stop the shared hub and remove the services once no entry uses them."""
+    hub: LvivPowerOffHub = hass.data[DOMAIN]
+    if not hub.has_subscribers:
+        await hub.async_shutdown()
+        hass.data.pop(DOMAIN)
+        async_unregister_services(hass)
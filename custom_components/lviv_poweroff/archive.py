@@ -0,0 +1,174 @@
+"""Provides the ScheduleArchive class keeping every published schedule version in SQLite."""
+
+from datetime import datetime
+import hashlib
+import threading
+from typing import TYPE_CHECKING
+
+from .entities import PowerOffPeriod
+
+if TYPE_CHECKING:
+    import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY,
+    grp TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    covers_from INTEGER NOT NULL,
+    covers_to INTEGER NOT NULL,
+    recorded_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS versions_grp_covers ON versions (grp, covers_from);
+CREATE TABLE IF NOT EXISTS periods (
+    version_id INTEGER NOT NULL REFERENCES versions (id) ON DELETE CASCADE,
+    grp TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    end INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS periods_grp_start ON periods (grp, start);
+CREATE INDEX IF NOT EXISTS periods_version ON periods (version_id);
+"""
+
+# A period belongs to the schedule when the newest version covering its start contains it
+EFFECTIVE_PERIODS_QUERY = """
+SELECT p.start, p.end FROM periods p
+WHERE p.grp = :grp AND p.start < :end AND p.start >= :start - :max_length AND p.end > :start
+AND p.version_id = (
+    SELECT MAX(v.id) FROM versions v
+    WHERE v.grp = p.grp AND v.covers_from <= p.start AND v.covers_from > p.start - :max_length
+    AND v.covers_to > p.start
+)
+ORDER BY p.start
+"""
+
+# Longest period or version coverage considered when looking back from a range
+MAX_PERIOD_SECONDS = 7 * 24 * 3600
+
+
+def fingerprint_periods(periods: list[PowerOffPeriod]) -> str:
+    """Get a stable digest of a group schedule."""
+    digest = hashlib.blake2b(digest_size=16)
+    for period in periods:
+        digest.update(f"{int(period.start_datetime.timestamp())}-{int(period.end_datetime.timestamp())};".encode())
+    return digest.hexdigest()
+
+
+class ScheduleArchive:
+    """Append-only archive of the schedule versions published for every group.
+
+    Every call is blocking and meant to run in the executor. Versions fully
+    superseded by newer ones are compacted away after a grace period and
+    everything older than the retention is dropped.
+    """
+
+    def __init__(self, path: str, retention_days: int, compact_after_days: int) -> None:
+        """Initialize the archive stored at the given path."""
+        self.path = path
+        self.retention = retention_days * 24 * 3600
+        self.compact_after = compact_after_days * 24 * 3600
+        self._lock = threading.Lock()
+        self._conn: "sqlite3.Connection | None" = None
+
+    def _connect(self) -> "sqlite3.Connection":
+        if self._conn is None:
+            # Imported here, in the executor, to keep it out of the integration import
+            import sqlite3
+
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def record(
+        self,
+        schedule: dict[str, list[PowerOffPeriod]],
+        covers_from: datetime,
+        covers_to: datetime,
+        recorded_at: datetime,
+    ) -> int:
+        """Record the schedule of every group that changed since its last version.
+
+        Returns the number of new versions.
+        """
+        recorded = 0
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for group, periods in schedule.items():
+                    fingerprint = fingerprint_periods(periods)
+                    last = conn.execute(
+                        "SELECT fingerprint, covers_from, covers_to FROM versions WHERE grp = ? ORDER BY id DESC LIMIT 1",
+                        (group,),
+                    ).fetchone()
+                    covers = (int(covers_from.timestamp()), int(covers_to.timestamp()))
+                    if last is not None and last == (fingerprint, *covers):
+                        continue
+                    cursor = conn.execute(
+                        "INSERT INTO versions (grp, fingerprint, covers_from, covers_to, recorded_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (group, fingerprint, *covers, int(recorded_at.timestamp())),
+                    )
+                    conn.executemany(
+                        "INSERT INTO periods (version_id, grp, start, end) VALUES (?, ?, ?, ?)",
+                        (
+                            (
+                                cursor.lastrowid,
+                                group,
+                                int(p.start_datetime.timestamp()),
+                                int(p.end_datetime.timestamp()),
+                            )
+                            for p in periods
+                        ),
+                    )
+                    recorded += 1
+        return recorded
+
+    def periods_between(self, group: str, start: datetime, end: datetime, tzinfo) -> list[PowerOffPeriod]:
+        """Get the effective archived periods of a group overlapping the range."""
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    EFFECTIVE_PERIODS_QUERY,
+                    {
+                        "grp": group,
+                        "start": int(start.timestamp()),
+                        "end": int(end.timestamp()),
+                        "max_length": MAX_PERIOD_SECONDS,
+                    },
+                )
+                .fetchall()
+            )
+        return [
+            PowerOffPeriod(datetime.fromtimestamp(start_ts, tzinfo), datetime.fromtimestamp(end_ts, tzinfo))
+            for start_ts, end_ts in rows
+        ]
+
+    def compact(self, now: datetime) -> int:
+        """Drop expired and superseded versions, returns the number of removed versions."""
+        now_ts = int(now.timestamp())
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                expired = conn.execute("DELETE FROM versions WHERE covers_to < ?", (now_ts - self.retention,))
+                superseded = conn.execute(
+                    """
+                    DELETE FROM versions WHERE recorded_at < :cutoff AND EXISTS (
+                        SELECT 1 FROM versions newer
+                        WHERE newer.grp = versions.grp AND newer.id > versions.id
+                        AND newer.covers_from <= versions.covers_from AND newer.covers_to >= versions.covers_to
+                    )
+                    """,
+                    {"cutoff": now_ts - self.compact_after},
+                )
+                removed = expired.rowcount + superseded.rowcount
+        return removed
@@ -0,0 +1,185 @@
+"""Provides compact bitmap representations of power off schedules."""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
+from itertools import accumulate
+
+from .entities import PowerOffPeriod
+from .timebase import TimeBase
+
+MINUTE = timedelta(minutes=1)
+
+
+class DaySchedule:
+    """Power off minutes of one local day stored as a bit mask.
+
+    Bit ``m`` is set when the power is off during the ``m``-th minute elapsed
+    since local midnight, so a day has 1380 or 1500 bits when the clocks are
+    switched and every bit is one real minute. Prefix sums for window queries
+    are built lazily.
+    """
+
+    __slots__ = ("day", "midnight", "length", "tzinfo", "bits", "_prefix")
+
+    def __init__(self, day: date, time_base: TimeBase, bits: int = 0) -> None:
+        """Initialize the day schedule from its bit mask."""
+        self.day = day
+        self.midnight = time_base.midnight(day).astimezone(UTC)
+        self.length = (time_base.midnight(day + timedelta(days=1)) - self.midnight) // MINUTE
+        self.tzinfo = time_base.tzinfo
+        self.bits = bits & ((1 << self.length) - 1)
+        self._prefix: array | None = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DaySchedule):
+            return NotImplemented
+        return self.day == other.day and self.length == other.length and self.bits == other.bits
+
+    def __hash__(self) -> int:
+        return hash((self.day, self.bits))
+
+    def __repr__(self) -> str:
+        return f"DaySchedule({self.day}, {self.minutes_off()} minutes off)"
+
+    @classmethod
+    def from_periods(cls, day: date, periods: Iterable[PowerOffPeriod], time_base: TimeBase) -> "DaySchedule":
+        """Build the schedule of a day from periods, clipping them to the day."""
+        schedule = cls(day, time_base)
+        bits = 0
+        for period in periods:
+            start = schedule.minute_of(period.start_datetime)
+            end = schedule.minute_of(period.end_datetime)
+            if end > start:
+                bits |= ((1 << (end - start)) - 1) << start
+        schedule.bits = bits
+        return schedule
+
+    def to_periods(self) -> list[PowerOffPeriod]:
+        """Convert the schedule back to sorted, merged periods."""
+        periods = []
+        bits = self.bits
+        while bits:
+            start = (bits & -bits).bit_length() - 1
+            shifted = bits >> start
+            length = (shifted ^ (shifted + 1)).bit_length() - 1
+            periods.append(PowerOffPeriod(self.datetime_at(start), self.datetime_at(start + length)))
+            bits &= ~(((1 << length) - 1) << start)
+        return periods
+
+    def minute_of(self, at: datetime) -> int:
+        """Get the minutes elapsed from midnight to `at`, clipped to the [0, length] range of the day."""
+        return min(max((at - self.midnight) // MINUTE, 0), self.length)
+
+    def datetime_at(self, minute: int) -> datetime:
+        """Get the local moment `minute` minutes after midnight."""
+        return (self.midnight + minute * MINUTE).astimezone(self.tzinfo)
+
+    def is_off(self, minute: int) -> bool:
+        """Return True if the power is off during the given minute of the day."""
+        return bool(self.bits >> minute & 1)
+
+    def minutes_off(self, start: int = 0, end: int | None = None) -> int:
+        """Count the minutes without power in the [start, end) minute window, the whole day by default."""
+        if self._prefix is None:
+            self._prefix = array("H", accumulate((self.bits >> m & 1 for m in range(self.length)), initial=0))
+        start = min(max(start, 0), self.length)
+        end = self.length if end is None else min(max(end, start), self.length)
+        return self._prefix[end] - self._prefix[start]
+
+    def next_transition(self, minute: int) -> int | None:
+        """Get the first minute boundary after `minute` where the power state changes.
+
+        The power is assumed to be on before and after the day, so a day ending
+        without power reports a transition at its length.
+        """
+        transitions = self.bits ^ (self.bits << 1)
+        rest = transitions >> (minute + 1)
+        if not rest:
+            return None
+        return minute + (rest & -rest).bit_length()
+
+
+class GroupSchedule:
+    """Power off schedule of a group over many days, one DaySchedule per day."""
+
+    __slots__ = ("days", "time_base", "_dates")
+
+    def __init__(self, days: Iterable[DaySchedule], time_base: TimeBase) -> None:
+        """Initialize the group schedule from its days."""
+        self.days: dict[date, DaySchedule] = {day.day: day for day in days}
+        self.time_base = time_base
+        self._dates = sorted(self.days)
+
+    @classmethod
+    def from_periods(cls, periods: Iterable[PowerOffPeriod], time_base: TimeBase) -> "GroupSchedule":
+        """Build the schedule from periods, splitting them at local midnight."""
+        tzinfo = time_base.tzinfo
+        by_day: dict[date, list[PowerOffPeriod]] = {}
+        for period in periods:
+            day = period.start_datetime.astimezone(tzinfo).date()
+            last = (period.end_datetime - MINUTE).astimezone(tzinfo).date()
+            while day <= last:
+                by_day.setdefault(day, []).append(period)
+                day += timedelta(days=1)
+        return cls(
+            (DaySchedule.from_periods(day, day_periods, time_base) for day, day_periods in by_day.items()), time_base
+        )
+
+    def to_periods(self) -> list[PowerOffPeriod]:
+        """Convert the schedule back to sorted periods, joined across midnight."""
+        periods: list[PowerOffPeriod] = []
+        for day in self._dates:
+            for period in self.days[day].to_periods():
+                if periods and periods[-1].end_datetime == period.start_datetime:
+                    periods[-1] = PowerOffPeriod(periods[-1].start_datetime, period.end_datetime)
+                else:
+                    periods.append(period)
+        return periods
+
+    def is_off(self, at: datetime) -> bool:
+        """Return True if the power is off at the given moment."""
+        day = self.days.get(self.time_base.today(at))
+        return day is not None and day.is_off(day.minute_of(at))
+
+    def minutes_off(self, start: datetime, end: datetime) -> int:
+        """Count the minutes without power between two moments."""
+        total = 0
+        day = self.time_base.today(start)
+        last = self.time_base.today(end)
+        while day <= last:
+            if (schedule := self.days.get(day)) is not None:
+                total += schedule.minutes_off(schedule.minute_of(start), schedule.minute_of(end))
+            day += timedelta(days=1)
+        return total
+
+    def minutes_off_on(self, day: date) -> int:
+        """Count the minutes without power on a local day."""
+        schedule = self.days.get(day)
+        return 0 if schedule is None else schedule.minutes_off()
+
+    def next_transition(self, after: datetime) -> datetime | None:
+        """Get the first moment after `after` where the power state changes."""
+        local_day = self.time_base.today(after)
+        for i in range(bisect_left(self._dates, local_day), len(self._dates)):
+            day = self._dates[i]
+            schedule = self.days[day]
+            transition = schedule.next_transition(schedule.minute_of(after) if day == local_day else -1)
+            # A day ending without power continues into an outage starting at midnight
+            while transition is not None:
+                if transition == schedule.length and self._is_off_at_midnight(day + timedelta(days=1)):
+                    break
+                if transition == 0 and self._is_off_before_midnight(day):
+                    transition = schedule.next_transition(0)
+                    continue
+                return schedule.datetime_at(transition)
+        return None
+
+    def _is_off_at_midnight(self, day: date) -> bool:
+        schedule = self.days.get(day)
+        return schedule is not None and schedule.is_off(0)
+
+    def _is_off_before_midnight(self, day: date) -> bool:
+        schedule = self.days.get(day - timedelta(days=1))
+        return schedule is not None and schedule.is_off(schedule.length - 1)
@@ -41,9 +41,7 @@ class LvivPowerOffCalendar(CoordinatorEntity[LvivPowerOffCoordinator], CalendarE
             key="calendar",
             name="Lviv PowerOff Calendar",
         )
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}-" f"{coordinator.group}-" f"{self.entity_description.key}"
-        )
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{coordinator.group}-{self.entity_description.key}"
 
     @property
     def event(self) -> CalendarEvent | None:
@@ -60,4 +58,4 @@ class LvivPowerOffCalendar(CoordinatorEntity[LvivPowerOffCoordinator], CalendarE
     ) -> list[CalendarEvent]:
         """Return calendar events within a datetime range."""
         LOGGER.debug('Getting all events between "%s" -> "%s"', start_date, end_date)
-        return self.coordinator.get_events_between(start_date, end_date)
+        return await self.coordinator.async_get_events_between(start_date, end_date)
@@ -0,0 +1,89 @@
+"""Provides the CircuitBreaker class backing off from failing schedule sources."""
+
+from collections.abc import Callable
+import random
+import time
+from typing import Any
+
+from .const import BACKOFF_JITTER, BACKOFF_MAX, BACKOFF_MIN
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitBreaker:
+    """Domain-wide gate in front of the upstream schedule sources.
+
+    A failed fetch opens the breaker for an exponentially growing, jittered
+    backoff. Once it has passed the breaker is half open and lets exactly one
+    probe through, every other caller is turned away until the probe either
+    closes the breaker again or reopens it with a longer backoff.
+    """
+
+    def __init__(
+        self,
+        min_backoff: float = BACKOFF_MIN,
+        max_backoff: float = BACKOFF_MAX,
+        jitter: float = BACKOFF_JITTER,
+        rng: random.Random | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self._clock = clock
+        self.failures = 0
+        self.rejected = 0
+        self._retry_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Current state of the breaker."""
+        if not self.failures:
+            return CLOSED
+        return OPEN if self._probing or self._clock() < self._retry_at else HALF_OPEN
+
+    def retry_in(self) -> float:
+        """Get the seconds until the next request is let through."""
+        return max(0.0, self._retry_at - self._clock()) if self.failures else 0.0
+
+    def acquire(self) -> bool:
+        """Return True if a request may be made now, claiming the probe when half open."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def release(self) -> None:
+        """Give up a claimed probe without a result, e.g. when it was cancelled."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self._retry_at = 0.0
+        self._probing = False
+
+    def record_failure(self) -> float:
+        """Open the breaker, returns the backoff in seconds."""
+        self.failures += 1
+        self._probing = False
+        backoff = min(self.min_backoff * 2 ** (self.failures - 1), self.max_backoff)
+        backoff *= 1 + self._rng.uniform(-self.jitter, self.jitter)
+        self._retry_at = self._clock() + backoff
+        return backoff
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "retry_in": round(self.retry_in(), 1),
+        }
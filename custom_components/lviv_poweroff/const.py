@@ -8,6 +8,52 @@ POWEROFF_GROUP_CONF = "poweroff_group"
 
 UPDATE_INTERVAL = 600
 
+# Adaptive polling: fast while a change is expected, exponential backoff while stable
+POLL_INTERVAL_MIN = 120
+POLL_INTERVAL_AWAITING = 300
+POLL_INTERVAL_MAX = 1800
+POLL_JITTER = 0.1
+# Tomorrow's schedule is usually published in the afternoon or evening
+PUBLICATION_START_HOUR = 15
+
+# Upstream outages: failed fetches back off exponentially from the minimum to the maximum, with jitter
+BACKOFF_MIN = 60
+BACKOFF_MAX = POLL_INTERVAL_MAX
+BACKOFF_JITTER = 0.2
+# Deadlines of a single upstream request in seconds
+REQUEST_TIMEOUT = 30
+CONNECT_TIMEOUT = 10
+
+# Keep pooled connections alive between polls so they skip the TCP/TLS handshake
+KEEPALIVE_TIMEOUT = UPDATE_INTERVAL + 30
+DNS_CACHE_TTL = 3600
+
+# LOE responses are rejected when the first menu, the only one used, is not complete within this size
+MAX_RESPONSE_SIZE = 8 * 1024 * 1024
+RESPONSE_CHUNK_SIZE = 64 * 1024
+# Menu items whose parsed periods are kept, more than the days ever published at once
+MENU_ITEM_CACHE_SIZE = 8
+
+# Seconds to wait for the LOE API before racing Energy UA against it, None disables hedging
+HEDGE_DELAY: float | None = 10.0
+
+STORAGE_KEY = f"{DOMAIN}.schedule"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+# Schedule history kept in SQLite inside the config directory
+ARCHIVE_FILE = f"{DOMAIN}_archive.db"
+ARCHIVE_RETENTION_DAYS = 400
+# Superseded schedule versions are kept this long before compaction
+ARCHIVE_COMPACT_AFTER_DAYS = 7
+
+# Profiling of a refresh, reports are written to the config directory
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+PROFILE_FILE_PREFIX = f"{DOMAIN}_profile"
+PROFILE_TOP_DEFAULT = 30
+# Frames kept per allocation traced by tracemalloc
+TRACEMALLOC_FRAMES = 10
+
 STATE_ON = "Power ON"
 STATE_OFF = "Power OFF"
 
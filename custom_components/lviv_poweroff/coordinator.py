@@ -1,46 +1,78 @@
 """Provides the LvivPowerOffCoordinator class for polling power off periods."""
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
 
 from homeassistant.components.calendar import CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, POWEROFF_GROUP_CONF, UPDATE_INTERVAL, PowerOffGroup, STATE_ON, STATE_OFF
-from .loe_scrapper import LoeScrapper
+from .const import DOMAIN, POWEROFF_GROUP_CONF, PowerOffGroup, STATE_ON, STATE_OFF
 from .entities import PowerOffPeriod
+from .hub import LvivPowerOffHub
+from .period_index import PowerOffPeriodIndex
 
 LOGGER = logging.getLogger(__name__)
 
 TIMEFRAME_TO_CHECK = timedelta(hours=24)
+# Calendar ranges whose archived events are kept between schedule changes
+HISTORY_RANGES_TO_KEEP = 16
+
+
+@dataclass
+class UpdateStats:
+    """Counters of hub updates pushed to or withheld from the entities."""
+
+    notified: int = 0
+    skipped: int = 0
+
+
+def periods_fingerprint(periods: list[PowerOffPeriod]) -> tuple[tuple[int, int], ...]:
+    """Get a cheap structural fingerprint of a schedule as epoch second pairs."""
+    return tuple((int(p.start_datetime.timestamp()), int(p.end_datetime.timestamp())) for p in periods)
 
 
 class LvivPowerOffCoordinator(DataUpdateCoordinator):
-    """Coordinates the polling of power off periods."""
+    """Coordinates the power off periods of a single group.
+
+    Polling is done by the shared LvivPowerOffHub, the coordinator only picks
+    its group out of every hub update. Entities are written only when the group
+    schedule changes or a period boundary is crossed. Calendar events are built
+    once per schedule change and the same instances are handed to every reader.
+    """
 
     config_entry: ConfigEntry
 
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, hub: LvivPowerOffHub) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
         )
         self.hass = hass
         self.config_entry = config_entry
         self.group: PowerOffGroup = config_entry.data[POWEROFF_GROUP_CONF]
-        self.api = LoeScrapper(self.group, dt_util.get_default_time_zone())
+        self.hub = hub
         self.periods: list[PowerOffPeriod] = []
+        self._index = PowerOffPeriodIndex(())
+        self._events: tuple[CalendarEvent, ...] = ()
+        self._history: dict[tuple[datetime, datetime], tuple[CalendarEvent, ...]] = {}
+        self._fingerprint: tuple[tuple[int, int], ...] | None = None
+        self.update_stats = UpdateStats()
+        self._unsub_hub: CALLBACK_TYPE | None = None
+        self._unsub_transition: CALLBACK_TYPE | None = None
 
     async def _async_update_data(self) -> dict:
-        """Fetch power off periods from scrapper."""
+        """Fetch power off periods from the hub."""
         try:
-            await self._fetch_periods()
+            with self.hub.instrumentation.span("coordinator.update"):
+                await self._fetch_periods()
             return {}  # noqa: TRY300
         except Exception as err:
             LOGGER.exception("Cannot obtain power offs periods for group %s", self.group)
@@ -49,24 +81,89 @@ class LvivPowerOffCoordinator(DataUpdateCoordinator):
 
     async def _fetch_periods(self) -> None:
         LOGGER.debug("Fetching power off periods for group %s", self.group)
-        self.periods = await self.api.get_power_off_periods()
+        await self.hub.async_ensure_data()
+        self._set_periods(self.hub.get_periods(self.group))
+
+    def _set_periods(self, periods: list[PowerOffPeriod]) -> None:
+        """Store new periods and rebuild the lookup index once."""
+        self.periods = periods
+        with self.hub.instrumentation.span("coordinator.index"):
+            self._index = PowerOffPeriodIndex(periods)
+            self._events = tuple(
+                self._get_calendar_event(p.start_datetime, p.end_datetime) for p in self._index.periods
+            )
+            self._history.clear()
+        self._fingerprint = periods_fingerprint(periods)
+        self._schedule_transition()
+
+    @callback
+    def _schedule_transition(self) -> None:
+        """Schedule a state update at the next period boundary."""
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+            self._unsub_transition = None
+
+        now = dt_util.now()
+        transition = self._index.next_transition(now)
+        # Next power on/off sensors look 24 hours ahead, so a boundary entering that window is a transition too
+        entering = self._index.next_transition(now + TIMEFRAME_TO_CHECK)
+        if entering is not None:
+            entering -= TIMEFRAME_TO_CHECK
+            transition = entering if transition is None else min(transition, entering)
+        if transition is not None:
+            LOGGER.debug("Next power state transition for group %s at %s", self.group, transition)
+            self._unsub_transition = async_track_point_in_time(self.hass, self._handle_transition, transition)
+
+    @callback
+    def _handle_transition(self, _now: datetime) -> None:
+        """Push the new power state to the entities at a period boundary."""
+        self._unsub_transition = None
+        self.async_update_listeners()
+        self._schedule_transition()
+
+    @callback
+    def async_subscribe_to_hub(self) -> None:
+        """Start receiving schedule updates from the hub."""
+        if self._unsub_hub is None:
+            self._unsub_hub = self.hub.async_subscribe(self.group, self._handle_hub_update)
+
+    @callback
+    def _handle_hub_update(self) -> None:
+        """Pick the group periods out of a hub update."""
+        if not self.hub.last_update_success:
+            if self.hub.data is not None:
+                # The hub keeps the last good schedule while the sources are failing
+                LOGGER.debug("Serving the last known schedule of group %s: %s", self.group, self.hub.last_exception)
+                return
+            self.async_set_update_error(self.hub.last_exception or UpdateFailed("Power offs not polled"))
+            return
+        periods = self.hub.get_periods(self.group)
+        if self.last_update_success and periods_fingerprint(periods) == self._fingerprint:
+            self.update_stats.skipped += 1
+            LOGGER.debug(
+                "Schedule of group %s unchanged, skipped %s entity updates", self.group, self.update_stats.skipped
+            )
+            return
+        self.update_stats.notified += 1
+        self._set_periods(periods)
+        self.async_set_updated_data({})
+
+    async def async_shutdown(self) -> None:
+        """Unsubscribe from the hub and cancel any scheduled work."""
+        if self._unsub_hub is not None:
+            self._unsub_hub()
+            self._unsub_hub = None
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+            self._unsub_transition = None
+        await super().async_shutdown()
 
     def _get_next_power_change_dt(self, on: bool) -> datetime | None:
         """Get the next power on/off."""
         now = dt_util.now()
-        events = self.get_events_between(
-            now,
-            now + TIMEFRAME_TO_CHECK,
-        )
         if on:
-            dts = sorted(event.end for event in events)
-        else:
-            dts = sorted(event.start for event in events)
-        LOGGER.debug("Next dts: %s", dts)
-        for dt in dts:
-            if dt > now:
-                return dt  # type: ignore
-        return None
+            return self._index.next_end(now, now + TIMEFRAME_TO_CHECK)
+        return self._index.next_start(now, now + TIMEFRAME_TO_CHECK)
 
     @property
     def next_poweroff(self) -> datetime | None:
@@ -91,22 +188,49 @@ class LvivPowerOffCoordinator(DataUpdateCoordinator):
 
     def get_event_at(self, at: datetime) -> CalendarEvent | None:
         """Get the current event."""
-        for period in self.periods:
-            if period.start_datetime <= at <= period.end_datetime:
-                return self._get_calendar_event(period.start_datetime, period.end_datetime)
-        return None
+        i = self._index.position_at(at)
+        return None if i is None else self._events[i]
 
     def get_events_between(
         self,
         start_date: datetime,
         end_date: datetime,
     ) -> list[CalendarEvent]:
-        """Get all events."""
-        events = []
-        for period in self.periods:
-            if start_date <= period.start_datetime <= end_date or start_date <= period.end_datetime <= end_date:
-                events.append(self._get_calendar_event(period.start_datetime, period.end_datetime))
-        return events
+        """Get all events overlapping the range."""
+        return list(self._events[self._index.positions_between(start_date, end_date)])
+
+    async def async_get_events_between(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Get all events overlapping the range, including the archived history.
+
+        The current schedule supersedes the archive from its first day on, so
+        only the history before it is read from the archive, once per range.
+        """
+        schedule_start = self.hub.schedule_start(dt_util.now())
+        if start_date >= schedule_start:
+            return self.get_events_between(start_date, end_date)
+
+        history_end = min(end_date, schedule_start)
+        key = (start_date, history_end)
+        history = self._history.get(key)
+        if history is None:
+            archived = await self.hub.async_get_archived_periods(self.group, start_date, history_end)
+            index = PowerOffPeriodIndex(
+                PowerOffPeriod(period.start_datetime, min(period.end_datetime, schedule_start))
+                for period in archived
+                if period.start_datetime < schedule_start
+            )
+            history = tuple(
+                self._get_calendar_event(period.start_datetime, period.end_datetime)
+                for period in index.periods_between(start_date, history_end)
+            )
+            if len(self._history) >= HISTORY_RANGES_TO_KEEP:
+                del self._history[next(iter(self._history))]
+            self._history[key] = history
+        return [*history, *self._events[self._index.positions_between(start_date, end_date)]]
 
     def _get_calendar_event(self, start: datetime, end: datetime) -> CalendarEvent:
         return CalendarEvent(
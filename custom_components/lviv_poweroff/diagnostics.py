@@ -0,0 +1,45 @@
+"""Provides diagnostics for the Lviv PowerOff integration."""
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .coordinator import LvivPowerOffCoordinator
+
+# Number of the latest poll interval decisions included
+POLL_DECISIONS = 20
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: ConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: LvivPowerOffCoordinator = entry.runtime_data
+    hub = coordinator.hub
+    return {
+        "group": coordinator.group,
+        "periods": [
+            {"start": period.start_datetime.isoformat(), "end": period.end_datetime.isoformat()}
+            for period in coordinator.periods
+        ],
+        "entity_updates": asdict(coordinator.update_stats),
+        "hub": {
+            "last_update_success": hub.last_update_success,
+            "update_interval": str(hub.update_interval),
+            "breaker": hub.breaker.as_dict(),
+            "schedule_days": sorted(day.isoformat() for day in hub.schedule_days),
+            "loe_cache": asdict(hub.api.cache_stats),
+            "sources": {
+                name: {**asdict(stats), "avg_latency_ms": stats.avg_latency_ms, "win_rate": stats.win_rate}
+                for name, stats in hub.fetcher.stats.items()
+            },
+            "poll_decisions": [
+                {"at": decision.at.isoformat(), "interval": str(decision.interval), "reason": decision.reason}
+                for decision in list(hub.poll_scheduler.decisions)[-POLL_DECISIONS:]
+            ],
+        },
+        "instrumentation": hub.instrumentation.as_dict(),
+    }
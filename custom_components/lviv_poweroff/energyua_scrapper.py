@@ -1,98 +1,107 @@
 """Provides classes for scraping power off periods from the Energy UA website."""
 
 import aiohttp
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
-from .const import PowerOffGroup
+from collections.abc import Callable
+from datetime import date, timedelta
+from functools import cache
+from typing import TYPE_CHECKING
 from .entities import PowerOffPeriod
+from .http_client import HttpScrapper
+from .intervals import normalize_periods
+from .timebase import TimeBase
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 URL = "https://lviv.energy-ua.info/grupa/{}"
-USER_AGENT = (
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-)
+# Only today's and tomorrow's blocks of hourly cells are used
+DAYS_SHOWN = 2
+
+
+@cache
+def load_parser() -> Callable[[str], "BeautifulSoup"]:
+    """Import BeautifulSoup, which is deferred until Energy UA is first scraped.
+
+    Returns a function parsing only the scale_hours blocks of a page, the rest
+    of the page is tokenized but never built into the tree. The import takes
+    longer than the rest of the integration, so callers on the event loop
+    should run this in an executor before the first parse.
+    """
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    strainer = SoupStrainer("div", class_="scale_hours")
+
+    def parse(content: str) -> BeautifulSoup:
+        return BeautifulSoup(content, "html.parser", parse_only=strainer)
 
+    return parse
 
-class EnergyUaScrapper:
+
+class EnergyUaScrapper(HttpScrapper):
     """Class for scraping power off periods from the Energy UA website."""
 
-    def __init__(self, group: PowerOffGroup, tzinfo) -> None:
+    def __init__(self, group: str, tzinfo, session: aiohttp.ClientSession | None = None) -> None:
         """Initialize the EnergyUaScrapper object."""
+        super().__init__(session)
         self.group = group
         self.tzinfo = tzinfo
+        self.time_base = TimeBase(tzinfo)
 
     async def validate(self) -> bool:
-        async with (
-            aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as session,
-            session.get(URL.format(self.group)) as response,
-        ):
+        async with self._get(URL.format(self.group)) as response:
             return response.status == 200
 
-    @staticmethod
-    def merge_periods(periods: list[PowerOffPeriod]) -> list[PowerOffPeriod]:
-        if not periods:
-            return []
+    async def get_power_off_periods(self) -> list[PowerOffPeriod]:
+        async with self._get(URL.format(self.group)) as response:
+            self._check_status(response)
+            content = await response.text()
+        # The page shows the days of the configured time zone, not of the host
+        return self.parse_page(content, self.time_base.today())
+
+    def parse_page(self, content: str, today: date) -> list[PowerOffPeriod]:
+        """Parse the periods of the page showing today and tomorrow."""
+        results = []
+        for day_offset, start_hour, end_hour in _active_hours(load_parser()(content)):
+            day = today + timedelta(days=day_offset)
+            results.append(
+                PowerOffPeriod(
+                    self.time_base.at_minutes(day, start_hour * 60), self.time_base.at_minutes(day, end_hour * 60)
+                )
+            )
+        # Hourly cells are joined into outages, across midnight too
+        return normalize_periods(results)
 
-        periods.sort(key=lambda x: x.start_datetime)
-        merged_periods = [periods[0]]
 
-        for current in periods[1:]:
-            last = merged_periods[-1]
-            # Overlapping or contiguous periods
-            if current.start_datetime <= last.end_datetime:
-                last.end_datetime = max(last.end_datetime, current.end_datetime)
-                continue
-            merged_periods.append(current)
+def _active_hours(soup: "BeautifulSoup") -> list[tuple[int, int, int]]:
+    """Get the day offset, start and end hour of the active cells in one pass over the tags."""
+    cells: list[tuple[int, list]] = []
+    day = -1
+    cell: list | None = None
+    for tag in soup.find_all(("div", "span", "i")):
+        classes = tag.get("class") or ()
+        if tag.name == "div":
+            if "scale_hours" in classes:
+                day += 1
+                cell = None
+                if day == DAYS_SHOWN:
+                    break
+            elif "scale_hours_el" in classes:
+                # [active, start text, end text]
+                cell = [False, None, None]
+                cells.append((day, cell))
+        elif cell is not None:
+            if "hour_active" in classes:
+                cell[0] = True
+            elif "hour_info_from" in classes:
+                cell[1] = tag.get_text()
+            elif "hour_info_to" in classes:
+                cell[2] = tag.get_text()
+    return [(day, *_parse_hours(start, end)) for day, (active, start, end) in cells if active]
 
-        return merged_periods
 
-    async def get_power_off_periods(self) -> list[PowerOffPeriod]:
-        async with (
-            aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as session,
-            session.get(URL.format(self.group)) as response,
-        ):
-            content = await response.text()
-            soup = BeautifulSoup(content, "html.parser")
-            results = []
-            scale_hours = soup.find_all("div", class_="scale_hours")
-
-            # Today's schedule
-            if len(scale_hours) > 0:
-                today = datetime.now().date()
-                scale_hours_el = scale_hours[0].find_all("div", class_="scale_hours_el")
-                for item in scale_hours_el:
-                    if item.find("span", class_="hour_active"):
-                        start_hour, end_hour = self._parse_item(item)
-                        start_datetime = datetime.combine(today, datetime.min.time().replace(hour=start_hour)).replace(
-                            tzinfo=self.tzinfo
-                        )
-                        end_datetime = datetime.combine(today, datetime.min.time().replace(hour=end_hour)).replace(
-                            tzinfo=self.tzinfo
-                        )
-                        results.append(PowerOffPeriod(start_datetime, end_datetime))
-                results = self.merge_periods(results)
-
-            # Tomorrow's schedule
-            if len(scale_hours) > 1:
-                tomorrow = datetime.now().date() + timedelta(days=1)
-                tomorrow_results = []
-                scale_hours_el_tomorrow = scale_hours[1].find_all("div", class_="scale_hours_el")
-                for item in scale_hours_el_tomorrow:
-                    if item.find("span", class_="hour_active"):
-                        start_hour, end_hour = self._parse_item(item)
-                        start_datetime = datetime.combine(
-                            tomorrow, datetime.min.time().replace(hour=start_hour)
-                        ).replace(tzinfo=self.tzinfo)
-                        end_datetime = datetime.combine(tomorrow, datetime.min.time().replace(hour=end_hour)).replace(
-                            tzinfo=self.tzinfo
-                        )
-                        tomorrow_results.append(PowerOffPeriod(start_datetime, end_datetime))
-                results += self.merge_periods(tomorrow_results)
-
-            return results
-
-    def _parse_item(self, item: BeautifulSoup) -> tuple[int, int]:
-        start_hour = item.find("i", class_="hour_info_from")
-        end_hour = item.find("i", class_="hour_info_to")
-        if start_hour and end_hour:
-            return int(start_hour.text.split(":")[0]), int(end_hour.text.split(":")[0])
-        raise ValueError(f"Time period not found in the input string: {item.text}")
+def _parse_hours(start_text: str | None, end_text: str | None) -> tuple[int, int]:
+    if start_text is None or end_text is None:
+        raise ValueError(f"Time period not found in the hour cell: {start_text} - {end_text}")
+    start, end = int(start_text.split(":")[0]), int(end_text.split(":")[0])
+    # The last hour of the day ends at 00:00 or 24:00
+    return start, end if end > start else end + 24
@@ -0,0 +1,143 @@
+"""Provides the HedgedFetcher class racing a backup source against a slow primary one."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import logging
+import time
+from typing import TypeGuard
+
+from .entities import PowerOffPeriod
+
+_LOGGER = logging.getLogger(__name__)
+
+Schedule = dict[str, list[PowerOffPeriod]]
+ScheduleSource = Callable[[], Awaitable[Schedule]]
+
+
+class ScheduleFetchError(Exception):
+    """Raised when no source returned a usable schedule, names the failure of each source."""
+
+    def __init__(self, errors: dict[str, Exception]) -> None:
+        """Initialize the error from the failures by source name."""
+        super().__init__("; ".join(f"{name}: {error}" for name, error in errors.items()) or "no source was asked")
+        self.errors = errors
+
+
+@dataclass
+class SourceStats:
+    """Latency and win statistics of a schedule source."""
+
+    requests: int = 0
+    wins: int = 0
+    failures: int = 0
+    cancelled: int = 0
+    last_latency_ms: float | None = None
+    total_latency_ms: float = 0.0
+    completed: int = 0
+
+    @property
+    def avg_latency_ms(self) -> float | None:
+        """Average latency of the completed requests."""
+        return self.total_latency_ms / self.completed if self.completed else None
+
+    @property
+    def win_rate(self) -> float | None:
+        """Share of requests whose result was used."""
+        return self.wins / self.requests if self.requests else None
+
+
+def is_valid_schedule(schedule: Schedule | None) -> TypeGuard[Schedule]:
+    """Return True if a source returned a usable, well-formed schedule."""
+    if not schedule:
+        return False
+    return all(period.start_datetime < period.end_datetime for periods in schedule.values() for period in periods)
+
+
+class HedgedFetcher:
+    """Fetches the schedule from the primary source, hedging with a secondary one.
+
+    The secondary source is started when the primary one has not answered within
+    ``hedge_delay`` seconds or has failed. The first valid schedule wins and the
+    other request is cancelled. If neither succeeds, ScheduleFetchError is
+    raised. A ``hedge_delay`` of None disables hedging. The name of the source
+    of the last fetched schedule is kept in ``winner``.
+    """
+
+    def __init__(
+        self,
+        primary: tuple[str, ScheduleSource],
+        secondary: tuple[str, ScheduleSource],
+        hedge_delay: float | None,
+    ) -> None:
+        """Initialize the fetcher with named sources."""
+        self.primary = primary
+        self.secondary = secondary
+        self.hedge_delay = hedge_delay
+        self.stats: dict[str, SourceStats] = {primary[0]: SourceStats(), secondary[0]: SourceStats()}
+        self.winner: str | None = None
+
+    async def fetch(self) -> Schedule:
+        """Fetch the schedule, raises ScheduleFetchError if every source failed."""
+        self.winner = None
+        errors: dict[str, Exception] = {}
+        primary = asyncio.create_task(self._timed(*self.primary, errors))
+        if self.hedge_delay is None:
+            result = await primary
+            if is_valid_schedule(result):
+                return self._accept(self.primary[0], result)
+            raise ScheduleFetchError(errors)
+
+        pending: dict[asyncio.Task, str] = {primary: self.primary[0]}
+        done, _ = await asyncio.wait(pending, timeout=self.hedge_delay)
+        secondary_started = False
+        if not done:
+            _LOGGER.debug("%s is slow, hedging with %s", self.primary[0], self.secondary[0])
+            pending[asyncio.create_task(self._timed(*self.secondary, errors))] = self.secondary[0]
+            secondary_started = True
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = pending.pop(task)
+                    result = task.result()
+                    if is_valid_schedule(result):
+                        return self._accept(name, result)
+                if not secondary_started:
+                    # The primary source failed before the hedge delay, fall back right away
+                    pending[asyncio.create_task(self._timed(*self.secondary, errors))] = self.secondary[0]
+                    secondary_started = True
+            raise ScheduleFetchError(errors)
+        finally:
+            for task, name in pending.items():
+                task.cancel()
+                self.stats[name].cancelled += 1
+
+    def _accept(self, name: str, result: Schedule) -> Schedule:
+        self.stats[name].wins += 1
+        self.winner = name
+        return result
+
+    async def _timed(self, name: str, source: ScheduleSource, errors: dict[str, Exception]) -> Schedule | None:
+        """Run a source, recording its latency and collecting its errors."""
+        stats = self.stats[name]
+        stats.requests += 1
+        started = time.perf_counter()
+        try:
+            result = await source()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.warning("Fetching power off periods from %s failed: %s", name, err)
+            stats.failures += 1
+            errors[name] = err
+            return None
+        latency_ms = (time.perf_counter() - started) * 1000
+        stats.last_latency_ms = latency_ms
+        stats.total_latency_ms += latency_ms
+        stats.completed += 1
+        if not is_valid_schedule(result):
+            stats.failures += 1
+            errors[name] = ValueError("no usable schedule returned")
+        return result
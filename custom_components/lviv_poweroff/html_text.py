@@ -0,0 +1,80 @@
+"""Provides text extraction backends for the LOE schedule HTML."""
+
+from collections.abc import Callable
+from html.parser import HTMLParser
+
+TextExtractor = Callable[[str], str]
+
+# Text of these elements is not part of BeautifulSoup's get_text()
+SKIPPED_TAGS = frozenset({"script", "style", "template"})
+
+
+class _TextCollector(HTMLParser):
+    """Streaming html.parser handler collecting text nodes without building a tree."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def extract_text_stream(html: str) -> str:
+    """Extract the text of an HTML fragment with a streaming html.parser handler."""
+    collector = _TextCollector()
+    collector.feed(html)
+    collector.close()
+    return "".join(collector.parts)
+
+
+def extract_text_bs4(html: str) -> str:
+    """Extract the text of an HTML fragment with BeautifulSoup, the reference backend."""
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, "html.parser").get_text()
+
+
+def extract_text_lxml(html: str) -> str:
+    """Extract the text of an HTML fragment with lxml."""
+    from lxml import html as lxml_html
+
+    if not html.strip():
+        return ""
+    root = lxml_html.fromstring(html)
+    for element in list(root.iter(*SKIPPED_TAGS)):
+        if element is not root:
+            element.drop_tree()
+    return root.text_content()
+
+
+TEXT_EXTRACTORS: dict[str, TextExtractor] = {
+    "stream": extract_text_stream,
+    "lxml": extract_text_lxml,
+    "bs4": extract_text_bs4,
+}
+DEFAULT_TEXT_EXTRACTOR = "stream"
+
+
+def get_text_extractor(name: str = DEFAULT_TEXT_EXTRACTOR) -> TextExtractor:
+    """Get a text extraction backend by name.
+
+    Falls back to BeautifulSoup when the requested backend is unknown or not
+    installed.
+    """
+    extractor = TEXT_EXTRACTORS.get(name, extract_text_bs4)
+    try:
+        extractor("")
+    except ImportError:
+        return extract_text_bs4
+    return extractor
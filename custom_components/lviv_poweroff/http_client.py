@@ -0,0 +1,56 @@
+"""Provides the HttpScrapper base class handling the HTTP session of the scrappers."""
+
+from contextlib import AbstractAsyncContextManager
+
+import aiohttp
+
+from .const import CONNECT_TIMEOUT, DNS_CACHE_TTL, KEEPALIVE_TIMEOUT, REQUEST_TIMEOUT
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+)
+# Deadlines of every request, independent of the timeouts of a shared session
+TIMEOUT = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
+
+
+class HttpScrapper:
+    """Base of the scrappers, requesting pages over a shared or an owned pooled session.
+
+    Pass a shared session (e.g. Home Assistant's client session) to reuse its
+    connection pool, otherwise the scrapper creates and owns a keep-alive one,
+    released by close().
+    """
+
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        """Initialize the scrapper with an optional shared session."""
+        self._session = session
+        self._owns_session = session is None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, creating a pooled keep-alive session if needed."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(keepalive_timeout=KEEPALIVE_TIMEOUT, ttl_dns_cache=DNS_CACHE_TTL)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session if it is owned by the scrapper."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get(
+        self, url: str, headers: dict[str, str] | None = None
+    ) -> AbstractAsyncContextManager[aiohttp.ClientResponse]:
+        """Request a page with the browser User-Agent and the request deadlines."""
+        return self._get_session().get(url, headers={"User-Agent": USER_AGENT, **(headers or {})}, timeout=TIMEOUT)
+
+    @staticmethod
+    def _check_status(response: aiohttp.ClientResponse) -> None:
+        """Raise unless the response is a 200 OK."""
+        # An error page has no schedule and must not pass for a day without outages
+        response.raise_for_status()
+        if response.status != 200:
+            msg = f"Unexpected response status {response.status} from {response.url}"
+            raise ValueError(msg)
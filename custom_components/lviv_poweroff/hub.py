@@ -0,0 +1,334 @@
+"""Provides the LvivPowerOffHub class sharing one LOE schedule fetch across all groups."""
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .archive import ScheduleArchive
+from .circuit_breaker import OPEN, CircuitBreaker
+from .const import (
+    ARCHIVE_COMPACT_AFTER_DAYS,
+    ARCHIVE_FILE,
+    ARCHIVE_RETENTION_DAYS,
+    DOMAIN,
+    HEDGE_DELAY,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    UPDATE_INTERVAL,
+)
+from .entities import PowerOffPeriod
+from .hedged_fetch import HedgedFetcher, Schedule, ScheduleFetchError
+from .instrumentation import Instrumentation
+from .intervals import normalize_periods
+from .loe_scrapper import LoeScrapper
+from .polling import AdaptivePollScheduler
+
+if TYPE_CHECKING:
+    from .energyua_scrapper import EnergyUaScrapper
+
+LOGGER = logging.getLogger(__name__)
+
+
+def serialize_periods(periods: dict[str, list[PowerOffPeriod]]) -> dict[str, Any]:
+    """Serialize the periods of every group as compact [start, end] epoch pairs."""
+    return {
+        "groups": {
+            group: [[int(p.start_datetime.timestamp()), int(p.end_datetime.timestamp())] for p in group_periods]
+            for group, group_periods in periods.items()
+        }
+    }
+
+
+def deserialize_periods(data: dict[str, Any], tzinfo) -> dict[str, list[PowerOffPeriod]]:
+    """Restore the periods of every group serialized by serialize_periods."""
+    return {
+        group: [
+            PowerOffPeriod(datetime.fromtimestamp(start, tzinfo), datetime.fromtimestamp(end, tzinfo))
+            for start, end in group_periods
+        ]
+        for group, group_periods in data["groups"].items()
+    }
+
+
+def hourly_periods(
+    periods: Iterable[PowerOffPeriod], window_start: datetime, window_end: datetime
+) -> list[PowerOffPeriod]:
+    """Widen periods to the whole hours Energy UA shows them in, clipped to the window."""
+    hours = []
+    for period in periods:
+        start = period.start_datetime.replace(minute=0, second=0, microsecond=0)
+        end = period.end_datetime.replace(minute=0, second=0, microsecond=0)
+        if end < period.end_datetime:
+            end += timedelta(hours=1)
+        hours.append(PowerOffPeriod(start, end))
+    return normalize_periods(hours, window_start, window_end)
+
+
+def merge_schedule(current: Schedule, update: Schedule, window_start: datetime, window_end: datetime) -> Schedule:
+    """Replace the periods of the updated groups within the window, keeping the rest of the current schedule."""
+    merged = dict(current)
+    for group, periods in update.items():
+        kept = current.get(group, [])
+        merged[group] = normalize_periods(
+            [
+                *normalize_periods(kept, window_end=window_start),
+                *normalize_periods(kept, window_start=window_end),
+                *periods,
+            ]
+        )
+    return merged
+
+
+class LvivPowerOffHub(DataUpdateCoordinator[dict[str, list[PowerOffPeriod]]]):
+    """Polls the LOE API once per interval for all groups.
+
+    The hub lives in ``hass.data[DOMAIN]`` and is shared by every config entry,
+    so the number of upstream requests does not grow with the number of groups.
+    The interval adapts to the schedule publication pattern after every poll.
+    A slow LOE API is hedged with Energy UA for the subscribed groups. When
+    both fail, the CircuitBreaker backs off and the last good schedule is kept.
+    Energy UA only confirms or patches that schedule, it never replaces it.
+    Every distinct schedule is recorded in the ScheduleArchive for history.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        super().__init__(
+            hass,
+            LOGGER,
+            config_entry=None,
+            name=f"{DOMAIN}_hub",
+            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+        )
+        self.instrumentation = Instrumentation()
+        self.api = LoeScrapper(
+            None,
+            dt_util.get_default_time_zone(),
+            async_get_clientsession(hass),
+            instrumentation=self.instrumentation,
+        )
+        self.fetcher = HedgedFetcher(
+            ("loe", self.api.get_all_power_off_periods),
+            ("energy_ua", self._fetch_energyua_periods),
+            HEDGE_DELAY,
+        )
+        self._energyua: dict[str, "EnergyUaScrapper"] = {}
+        self._energyua_days: frozenset[date] = frozenset()
+        # Days covered by the current schedule, from which it supersedes the archive
+        self.schedule_days: frozenset[date] = frozenset()
+        self._groups: Counter[str] = Counter()
+        self._first_refresh_lock = asyncio.Lock()
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._cache_loaded = False
+        self.poll_scheduler = AdaptivePollScheduler()
+        self.breaker = CircuitBreaker()
+        self.archive = ScheduleArchive(
+            hass.config.path(ARCHIVE_FILE), ARCHIVE_RETENTION_DAYS, ARCHIVE_COMPACT_AFTER_DAYS
+        )
+        self._last_compaction: date | None = None
+        self._archive_tasks: set[asyncio.Future] = set()
+
+    async def _async_update_data(self) -> dict[str, list[PowerOffPeriod]]:
+        """Fetch power off periods of all groups from scrapper."""
+        if not self.breaker.acquire():
+            retry_in = self.breaker.retry_in()
+            self.update_interval = timedelta(seconds=max(retry_in, 1))
+            msg = f"Power off sources are failing, retrying in {retry_in:.0f} s"
+            raise UpdateFailed(msg)
+
+        LOGGER.debug("Fetching power off periods for all groups")
+        try:
+            with self.instrumentation.span("hub.fetch"):
+                periods = await self.fetcher.fetch()
+        except asyncio.CancelledError:
+            self.breaker.release()
+            raise
+        except ScheduleFetchError as err:
+            # Raising keeps the last good schedule, the sources have logged their failures
+            self._back_off()
+            msg = f"Power offs not polled: {err}"
+            raise UpdateFailed(msg) from err
+        except Exception as err:
+            LOGGER.exception("Cannot obtain power offs periods")
+            self._back_off()
+            msg = f"Power offs not polled: {err}"
+            raise UpdateFailed(msg) from err
+        self.breaker.record_success()
+        if self.fetcher.winner == "energy_ua" and self.data is not None:
+            # Past days are left out like LOE leaves them out of its menu, so the set does not grow
+            today = self.api.time_base.today()
+            self.schedule_days = frozenset(day for day in self.schedule_days | self._energyua_days if day >= today)
+        elif self.fetcher.winner == "energy_ua":
+            self.schedule_days = self._energyua_days
+        else:
+            self.schedule_days = self.api.schedule_days
+
+        changed = periods != self.data
+        if changed:
+            self._store.async_delay_save(lambda: serialize_periods(periods), STORAGE_SAVE_DELAY)
+
+        now = dt_util.now()
+        if changed:
+            task = self.hass.async_create_background_task(self._async_archive(periods, now), f"{DOMAIN} archive")
+            self._archive_tasks.add(task)
+            task.add_done_callback(self._archive_tasks.discard)
+        tomorrow_published = now.date() + timedelta(days=1) in self.schedule_days
+        # The very first poll only establishes the baseline schedule
+        self.update_interval = self.poll_scheduler.next_interval(
+            now, changed and self.data is not None, tomorrow_published
+        )
+        LOGGER.debug("Next LOE poll in %s (%s)", self.update_interval, self.poll_scheduler.decisions[-1].reason)
+        return periods
+
+    def _back_off(self) -> None:
+        """Open the breaker and poll again once its backoff has passed."""
+        backoff = self.breaker.record_failure()
+        self.update_interval = timedelta(seconds=backoff)
+        LOGGER.debug("Power off sources failed %s times, next poll in %.0f s", self.breaker.failures, backoff)
+
+    async def _async_archive(self, periods: dict[str, list[PowerOffPeriod]], now: datetime) -> None:
+        """Record a new schedule version and compact the archive once a day."""
+        days = self.schedule_days or frozenset({now.date()})
+        covers_from = self.schedule_start(now)
+        covers_to = self.api.time_base.midnight(max(days) + timedelta(days=1))
+        try:
+            await self.hass.async_add_executor_job(self.archive.record, periods, covers_from, covers_to, now)
+            if self._last_compaction != now.date():
+                self._last_compaction = now.date()
+                removed = await self.hass.async_add_executor_job(self.archive.compact, now)
+                LOGGER.debug("Compacted %s schedule versions from the archive", removed)
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Cannot archive the power off schedule")
+
+    def schedule_start(self, now: datetime) -> datetime:
+        """Get the start of the first day of the current schedule, from which it supersedes the archive."""
+        days = self.schedule_days or frozenset({now.date()})
+        return self.api.time_base.midnight(min(days))
+
+    async def async_get_archived_periods(self, group: str, start: datetime, end: datetime) -> list[PowerOffPeriod]:
+        """Get the archived periods of a group overlapping the range."""
+        try:
+            return await self.hass.async_add_executor_job(
+                self.archive.periods_between, group, start, end, dt_util.get_default_time_zone()
+            )
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Cannot read the power off schedule archive")
+            return []
+
+    async def _fetch_energyua_periods(self) -> dict[str, list[PowerOffPeriod]]:
+        """Fetch power off periods of the subscribed groups from Energy UA."""
+        # Energy UA is only a fallback, its scrapper and parser are imported when first needed
+        from .energyua_scrapper import EnergyUaScrapper, load_parser
+
+        groups = list(self._groups)
+        if not self._energyua:
+            await self.hass.async_add_executor_job(load_parser)
+        for group in groups:
+            if group not in self._energyua:
+                self._energyua[group] = EnergyUaScrapper(
+                    group, dt_util.get_default_time_zone(), async_get_clientsession(self.hass)
+                )
+        results = await asyncio.gather(*(self._energyua[group].get_power_off_periods() for group in groups))
+        return self._reconcile_energyua(dict(zip(groups, results)))
+
+    def _reconcile_energyua(self, update: Schedule) -> Schedule:
+        """Check the Energy UA schedule against the current one and merge it in when they differ.
+
+        Energy UA shows the subscribed groups only and in whole hours, so the
+        current schedule is kept as is while it matches, and a change replaces
+        only the groups and days Energy UA shows.
+        """
+        time_base = self.api.time_base
+        days = {time_base.today()}
+        days.update(time_base.today(period.start_datetime) for periods in update.values() for period in periods)
+        self._energyua_days = frozenset(days)
+        if self.data is None:
+            return update
+
+        window_start = time_base.midnight(min(days))
+        window_end = time_base.midnight(max(days) + timedelta(days=1))
+        if all(
+            hourly_periods(self.data.get(group, []), window_start, window_end)
+            == normalize_periods(periods, window_start, window_end)
+            for group, periods in update.items()
+        ):
+            return self.data
+        LOGGER.debug("Energy UA reports a change of groups %s before LOE", ", ".join(update))
+        return merge_schedule(self.data, update, window_start, window_end)
+
+    async def async_ensure_data(self) -> None:
+        """Make the schedule available, fetching it only when it is not known.
+
+        The schedule persisted by a previous run is served right away and refreshed
+        in the background, so startup does not wait on the LOE API. Entries set up
+        at the same time wait for a single shared request.
+        """
+        async with self._first_refresh_lock:
+            if self.data is None and not self._cache_loaded:
+                self._cache_loaded = True
+                await self._async_load_cache()
+            # Entries waiting for the lock do not repeat a probe that has just failed
+            if self.data is None and self.breaker.state != OPEN:
+                await self.async_refresh()
+        if self.data is None:
+            msg = f"Power offs not polled, retrying in {self.breaker.retry_in():.0f} s"
+            raise UpdateFailed(msg) from self.last_exception
+
+    async def _async_load_cache(self) -> None:
+        """Load the persisted schedule and schedule a background refresh."""
+        try:
+            stored = await self._store.async_load()
+            if stored is None:
+                return
+            self.data = deserialize_periods(stored, dt_util.get_default_time_zone())
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Cannot load the persisted power off schedule")
+            return
+
+        LOGGER.debug("Loaded persisted power off schedule, refreshing in background")
+        self.hass.async_create_background_task(self.async_refresh(), f"{DOMAIN} hub refresh")
+
+    async def async_shutdown(self) -> None:
+        """Stop polling, let a running archive record finish and release the scrappers and the archive."""
+        await super().async_shutdown()
+        await self.api.close()
+        for scrapper in self._energyua.values():
+            await scrapper.close()
+        # A running record would open the archive again once it is closed
+        if self._archive_tasks:
+            await asyncio.gather(*self._archive_tasks, return_exceptions=True)
+        await self.hass.async_add_executor_job(self.archive.close)
+
+    def get_periods(self, group: str) -> list[PowerOffPeriod]:
+        """Get the last known power off periods of a group."""
+        return (self.data or {}).get(group, [])
+
+    @callback
+    def async_subscribe(self, group: str, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Subscribe a group to schedule updates, returns a callback to unsubscribe."""
+        self._groups[group] += 1
+        remove_listener = self.async_add_listener(update_callback)
+
+        @callback
+        def unsubscribe() -> None:
+            remove_listener()
+            self._groups[group] -= 1
+            if not self._groups[group]:
+                del self._groups[group]
+
+        return unsubscribe
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Return True while any group is subscribed to the hub."""
+        return bool(self._groups)
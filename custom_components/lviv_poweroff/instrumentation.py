@@ -0,0 +1,130 @@
+"""Provides the Instrumentation class timing the phases of a schedule refresh."""
+
+from bisect import bisect_left
+from collections import Counter, deque
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+import time
+from typing import Any
+
+# Upper bounds of the histogram buckets in milliseconds
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+HISTOGRAM_SIZE = 200
+
+_DISABLED_SPAN = nullcontext()
+
+
+class RollingHistogram:
+    """Durations of the last HISTOGRAM_SIZE samples of a phase."""
+
+    __slots__ = ("samples",)
+
+    def __init__(self, size: int = HISTOGRAM_SIZE) -> None:
+        """Initialize an empty histogram."""
+        self.samples: deque[float] = deque(maxlen=size)
+
+    def add(self, value_ms: float) -> None:
+        """Add a sample, dropping the oldest one when full."""
+        self.samples.append(value_ms)
+
+    def summary(self) -> dict[str, Any]:
+        """Get the count, percentiles and bucket counts of the samples."""
+        if not self.samples:
+            return {"count": 0}
+        ordered = sorted(self.samples)
+        buckets = [0] * (len(BUCKETS_MS) + 1)
+        for value in ordered:
+            buckets[bisect_left(BUCKETS_MS, value)] += 1
+        labels = [f"<={bound}" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+        return {
+            "count": len(ordered),
+            "last": round(self.samples[-1], 3),
+            "min": round(ordered[0], 3),
+            "p50": round(_percentile(ordered, 50), 3),
+            "p90": round(_percentile(ordered, 90), 3),
+            "p99": round(_percentile(ordered, 99), 3),
+            "max": round(ordered[-1], 3),
+            "buckets": {label: count for label, count in zip(labels, buckets) if count},
+        }
+
+
+class _Span:
+    __slots__ = ("_instrumentation", "_name", "_started")
+
+    def __init__(self, instrumentation: "Instrumentation", name: str) -> None:
+        self._instrumentation = instrumentation
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._instrumentation.record(self._name, (time.perf_counter() - self._started) * 1000)
+
+
+class Instrumentation:
+    """Collects per-phase timings and counters of the refresh pipeline.
+
+    Disabled instrumentation hands out a shared no-op span and ignores counters,
+    so the instrumented code only pays for a method call and an attribute check.
+    It is enabled while anything holding a handle from enable() needs it.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize the instrumentation."""
+        self._users = 1 if enabled else 0
+        self.histograms: dict[str, RollingHistogram] = {}
+        self.last: dict[str, float] = {}
+        self.counters: Counter[str] = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        """Return True while the timings are collected."""
+        return self._users > 0
+
+    def enable(self) -> Callable[[], None]:
+        """Enable the instrumentation, returns a callback releasing it."""
+        self._users += 1
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._users -= 1
+
+        return release
+
+    def span(self, name: str) -> AbstractContextManager[None]:
+        """Time the enclosed block as a sample of the named phase."""
+        if not self._users:
+            return _DISABLED_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, value_ms: float) -> None:
+        """Record a duration of the named phase."""
+        if not self._users:
+            return
+        if (histogram := self.histograms.get(name)) is None:
+            histogram = self.histograms[name] = RollingHistogram()
+        histogram.add(value_ms)
+        self.last[name] = value_ms
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to a counter, e.g. the number of downloaded bytes."""
+        if self._users:
+            self.counters[name] += value
+            self.last[name] = value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get all collected data for diagnostics."""
+        return {
+            "enabled": self.enabled,
+            "phases_ms": {name: histogram.summary() for name, histogram in sorted(self.histograms.items())},
+            "counters": dict(self.counters),
+        }
+
+
+def _percentile(ordered: list[float], pct: int) -> float:
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
@@ -0,0 +1,45 @@
+"""Provides the interval normalization shared by the scrappers and the period index."""
+
+from collections.abc import Iterable
+from datetime import datetime
+from operator import attrgetter
+
+from .entities import PowerOffPeriod
+
+_START = attrgetter("start_datetime")
+
+
+def normalize_periods(
+    periods: Iterable[PowerOffPeriod],
+    window_start: datetime | None = None,
+    window_end: datetime | None = None,
+) -> list[PowerOffPeriod]:
+    """Sort periods and merge the overlapping and adjacent ones.
+
+    Periods are clipped to the optional [window_start, window_end] window and
+    empty ones are dropped. A day ending at 24:00 and the next day starting at
+    00:00 are the same moment, so outages split at midnight are joined. The
+    input is never mutated, the result holds new PowerOffPeriod objects.
+    """
+    merged: list[PowerOffPeriod] = []
+    start: datetime | None = None
+    end: datetime | None = None
+    for period in sorted(periods, key=_START):
+        period_start = period.start_datetime
+        period_end = period.end_datetime
+        if window_start is not None and period_start < window_start:
+            period_start = window_start
+        if window_end is not None and period_end > window_end:
+            period_end = window_end
+        if period_end <= period_start:
+            continue
+        if end is not None and period_start <= end:
+            if period_end > end:
+                end = period_end
+            continue
+        if start is not None and end is not None:
+            merged.append(PowerOffPeriod(start, end))
+        start, end = period_start, period_end
+    if start is not None and end is not None:
+        merged.append(PowerOffPeriod(start, end))
+    return merged
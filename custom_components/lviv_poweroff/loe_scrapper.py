@@ -1,133 +1,309 @@
 """Provides classes for scraping power off periods from the Lvivoblenergo API."""
 
+from collections import OrderedDict
+import hashlib
 import logging
 import re
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
 
 import aiohttp
-from bs4 import BeautifulSoup
 
+from .const import MAX_RESPONSE_SIZE, MENU_ITEM_CACHE_SIZE, RESPONSE_CHUNK_SIZE, PowerOffGroup
 from .entities import PowerOffPeriod
+from .html_text import DEFAULT_TEXT_EXTRACTOR, get_text_extractor
+from .http_client import HttpScrapper
+from .instrumentation import Instrumentation
+from .intervals import normalize_periods
+from .menu_stream import scan_menu_items
+from .timebase import TimeBase
 
 URL = "https://api.loe.lviv.ua/api/menus?page=1&type=photo-grafic"
-USER_AGENT = (
-    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-)
 
 
+# Дата графіка, наприклад "на 09.02.2026"
+DATE_PATTERN = re.compile(r"на (\d{2})\.(\d{2})\.(\d{4})")
+# Рядок "Група <група>. Електроенергії немає з <часи>." для всіх груп за один прохід
+GROUPS_PATTERN = re.compile(r"Група (\d+\.\d+)\. Електроенергії немає з ([^.]*)\.")
+# Проміжок "з 09:00 до 12:30": два часи без коми між ними
+TIME_RANGE_PATTERN = re.compile(r"(\d{2}:\d{2})[^,\d]+(\d{2}:\d{2})")
+# Блоки графіка, що беруться завжди
+MENU_ITEM_NAMES = frozenset({"Today", "Tomorrow"})
+# Решта блоків береться, якщо на початку сирого rawHtml є заголовок з датою "на 09.02.2026",
+# у JSON "на" може бути як у UTF-8, так і екранованим
+DATED_ITEM_PATTERN = re.compile(rb"(?:\xd0\xbd\xd0\xb0|\\u043d\\u0430) \d{2}\.\d{2}\.\d{4}")
+
 _LOGGER = logging.getLogger(__name__)
 
 
-class LoeScrapper:
+@dataclass
+class FetchCacheStats:
+    """Counters of LOE menu polls served without parsing."""
+
+    not_modified: int = 0
+    unchanged_body: int = 0
+    parsed: int = 0
+    items_parsed: int = 0
+    items_reused: int = 0
+
+
+@dataclass(frozen=True)
+class ParsedMenuItem:
+    """Power off periods of every group parsed out of one menu item."""
+
+    day: date | None
+    periods: dict[str, list[PowerOffPeriod]]
+
+
+class MenuItemCache:
+    """LRU cache of parsed menu items keyed on the digest of their rawHtml.
+
+    Usually only one item changes between polls, typically when tomorrow's
+    schedule appears, so the others are not parsed again. Items of days
+    before the first day of the latest response are evicted once they roll
+    off the menu.
+    """
+
+    def __init__(self, size: int = MENU_ITEM_CACHE_SIZE) -> None:
+        """Initialize an empty cache keeping at most `size` items."""
+        self.size = size
+        self._items: OrderedDict[bytes, ParsedMenuItem] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of cached items."""
+        return len(self._items)
+
+    @staticmethod
+    def key(raw_html: str) -> bytes:
+        """Get the cache key of a menu item."""
+        return hashlib.blake2b(raw_html.encode(), digest_size=16).digest()
+
+    def get(self, key: bytes) -> ParsedMenuItem | None:
+        """Get a parsed item, marking it as recently used."""
+        parsed = self._items.get(key)
+        if parsed is not None:
+            self._items.move_to_end(key)
+        return parsed
+
+    def put(self, key: bytes, parsed: ParsedMenuItem) -> None:
+        """Cache a parsed item, evicting the least recently used one when full."""
+        self._items[key] = parsed
+        self._items.move_to_end(key)
+        if len(self._items) > self.size:
+            self._items.popitem(last=False)
+
+    def evict_before(self, day: date) -> None:
+        """Evict the items of the days before `day`."""
+        for key in [key for key, parsed in self._items.items() if parsed.day is not None and parsed.day < day]:
+            del self._items[key]
+
+
+def extract_day_periods(day: date, text: str, time_base: TimeBase) -> dict[str, list[PowerOffPeriod]]:
+    """Extract the power off periods of every group from the text of one day."""
+    periods: dict[str, list[PowerOffPeriod]] = {}
+    # Межі повторюються між групами й опитуваннями, тож TimeBase створює кожну один раз
+    at = time_base.at
+
+    for group_match in GROUPS_PATTERN.finditer(text):
+        group = group_match.group(1)
+        # Як і раніше, береться лише перший рядок групи за день
+        if group in periods:
+            continue
+        periods[group] = [
+            PowerOffPeriod(start_datetime=at(day, start), end_datetime=at(day, end))
+            for start, end in TIME_RANGE_PATTERN.findall(group_match.group(2))
+        ]
+
+    return periods
+
+
+class LoeScrapper(HttpScrapper):
     """Class for scraping power off periods from the Lvivoblenergo API."""
 
-    def __init__(self, group: str, tzinfo) -> None:
-        """Initialize the LoeScrapper object."""
+    def __init__(
+        self,
+        group: str | None,
+        tzinfo,
+        session: aiohttp.ClientSession | None = None,
+        text_extractor: str = DEFAULT_TEXT_EXTRACTOR,
+        max_response_size: int = MAX_RESPONSE_SIZE,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """Initialize the LoeScrapper object.
+
+        The session is shared or owned as described in HttpScrapper. The text
+        extractor names the html_text backend used on the rawHtml blocks.
+        Responses whose first menu takes more than max_response_size bytes are
+        rejected. Phase timings are recorded into the given instrumentation.
+        """
+        super().__init__(session)
         self.group = group
         self.tzinfo = tzinfo
+        self.time_base = TimeBase(tzinfo)
+        self.extract_text = get_text_extractor(text_extractor)
+        self.max_response_size = max_response_size
+        self.instrumentation = instrumentation or Instrumentation()
+        self.cache_stats = FetchCacheStats()
+        # Дні, для яких опубліковано графік в останній відповіді
+        self.schedule_days: frozenset[date] = frozenset()
+        self._periods: dict[str, list[PowerOffPeriod]] | None = None
+        self._menu_digest: bytes | None = None
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._item_cache = MenuItemCache()
 
     async def validate(self) -> bool:
         """Validate that we can connect to the API."""
         try:
-            async with (
-                aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as session,
-                session.get(URL) as response,
-            ):
+            async with self._get(URL) as response:
                 return response.status == 200
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.error("Error validating LOE API: %s", err)
             return False
 
     async def get_power_off_periods(self) -> list[PowerOffPeriod]:
-        """Get power off periods."""
-        try:
-            async with (
-                aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as session,
-                session.get(URL) as response,
-            ):
-                if response.status != 200:
-                    _LOGGER.error("Failed to fetch LOE API: status %s", response.status)
-                    return []
-
-                data = await response.json()
-                menu = None
-
-                if "hydra:member" in data and data["hydra:member"]:
-                    menu = data["hydra:member"][0]
-                elif "menuItems" in data[0]:
-                    menu = data[0]
-                else:
-                    _LOGGER.error("Invalid API response structure")
-                    return []
+        """Get power off periods for the configured group."""
+        if self.group is None:
+            msg = "No group is configured, use get_all_power_off_periods"
+            raise ValueError(msg)
+        periods = await self.get_all_power_off_periods()
+        return periods.get(self.group, [])
 
-                raw_periods = []
+    async def get_all_power_off_periods(self) -> dict[str, list[PowerOffPeriod]]:
+        """Get power off periods for every group from a single API response.
 
-                # 1. Фільтруємо лише актуальні блоки (Today / Tomorrow)
-                items_to_process = [item for item in menu["menuItems"] if item["name"] in ["Today", "Tomorrow"]]
+        The body is scanned as it streams in and only the Today/Tomorrow and other
+        dated items of the first menu are decoded. Unchanged responses, either
+        reported by the server with 304 Not Modified or detected by the digest of
+        those items, return the previously parsed periods. Of a changed response
+        only the items that changed are parsed. Raises when the API cannot be
+        read, so the cause reaches the caller.
+        """
+        headers: dict[str, str] = {}
+        if self._periods is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
 
-                # Регулярний вираз для пошуку конкретної групи
-                # Шукаємо "Група <значення_енуму>. Електроенергії немає з <часи>."
-                group_pattern = rf"Група {re.escape(self.group)}\. Електроенергії немає з (.*?)\."
-                date_pattern = re.compile(r"на (\d{2}\.\d{2}\.\d{4})")
+        with self.instrumentation.span("loe.network"):
+            async with self._get(URL, headers) as response:
+                if response.status == 304 and self._periods is not None:
+                    self.cache_stats.not_modified += 1
+                    self._log_cache_stats()
+                    return self._periods
 
-                for item in items_to_process:
-                    soup = BeautifulSoup(item["rawHtml"], "html.parser")
-                    text = soup.get_text()
+                self._check_status(response)
 
-                    # Витягуємо дату з тексту (наприклад, 09.02.2026)
-                    date_match = date_pattern.search(text)
-                    if not date_match:
-                        continue
-                    date_str = date_match.group(1)
+                scanner, size = await scan_menu_items(
+                    response.content.iter_chunked(RESPONSE_CHUNK_SIZE),
+                    MENU_ITEM_NAMES,
+                    self.max_response_size,
+                    DATED_ITEM_PATTERN,
+                )
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if not response.content.at_eof():
+                    # Решта меню не потрібна, тож з'єднання закривається замість дочитування
+                    response.close()
+        self.instrumentation.count("loe.bytes", size)
 
-                    # Шукаємо рядок з графіком для нашої групи
-                    group_match = re.search(group_pattern, text)
-                    if group_match:
-                        time_ranges = group_match.group(1).split(", ")
+        if not scanner.menu_found:
+            msg = "Invalid LOE API response structure, no menu found"
+            raise ValueError(msg)
 
-                        for r in time_ranges:
-                            times = re.findall(r"(\d{2}:\d{2})", r)
-                            if len(times) == 2:
-                                start_str, end_str = times
+        digest = scanner.digest
+        if digest == self._menu_digest and self._periods is not None:
+            self.cache_stats.unchanged_body += 1
+            self._log_cache_stats()
+            return self._periods
 
-                                start_dt = datetime.strptime(f"{date_str} {start_str}", "%d.%m.%Y %H:%M").replace(
-                                    tzinfo=self.tzinfo
-                                )
+        _LOGGER.debug("Scanned %s bytes of the LOE response, %s menu items kept", size, len(scanner.items))
+        periods = self._parse_menu_items(scanner.items)
 
-                                # Обробка "24:00": перетворюємо на 00:00 наступного дня
-                                if end_str == "24:00":
-                                    end_dt = datetime.strptime(f"{date_str} 00:00", "%d.%m.%Y %H:%M").replace(
-                                        tzinfo=self.tzinfo
-                                    ) + timedelta(days=1)
-                                else:
-                                    end_dt = datetime.strptime(f"{date_str} {end_str}", "%d.%m.%Y %H:%M").replace(
-                                        tzinfo=self.tzinfo
-                                    )
+        self.cache_stats.parsed += 1
+        self._log_cache_stats()
+        self._periods = periods
+        self._menu_digest = digest
+        self._etag = etag
+        self._last_modified = last_modified
+        return periods
 
-                                raw_periods.append(PowerOffPeriod(start_datetime=start_dt, end_datetime=end_dt))
+    def invalidate_cache(self) -> None:
+        """Make the next fetch download and parse the schedule even if it is unchanged."""
+        self._menu_digest = None
+        self._etag = None
+        self._last_modified = None
+        self._item_cache = MenuItemCache()
 
-                # 2. Сортуємо та об'єднуємо суміжні періоди
-                if not raw_periods:
-                    return []
+    def _log_cache_stats(self) -> None:
+        _LOGGER.debug(
+            "LOE menu cache: %s not modified, %s unchanged body, %s parsed",
+            self.cache_stats.not_modified,
+            self.cache_stats.unchanged_body,
+            self.cache_stats.parsed,
+        )
 
-                raw_periods.sort(key=lambda x: x.start_datetime)
+    def _parse_menu_items(self, items_to_process: list[dict[str, Any]]) -> dict[str, list[PowerOffPeriod]]:
+        """Parse the periods of every group out of the dated menu items, reusing the unchanged ones.
 
-                merged_periods = []
-                current = raw_periods[0]
+        Items taken only for their date are ignored when dated before today in
+        the configured zone, so days left over in the menu do not pull the
+        schedule back.
+        """
+        span = self.instrumentation.span
+        with span("loe.parse"):
+            parsed_items: list[tuple[bool, ParsedMenuItem]] = []
+            changed: list[tuple[bool, bytes, str]] = []
+            for item in items_to_process:
+                named = item.get("name") in MENU_ITEM_NAMES
+                key = self._item_cache.key(item["rawHtml"])
+                parsed = self._item_cache.get(key)
+                if parsed is None:
+                    changed.append((named, key, item["rawHtml"]))
+                else:
+                    parsed_items.append((named, parsed))
+            self.cache_stats.items_reused += len(parsed_items)
+            self.cache_stats.items_parsed += len(changed)
 
-                for i in range(1, len(raw_periods)):
-                    nxt = raw_periods[i]
-                    # Якщо кінець поточного періоду збігається з початком наступного — зливаємо
-                    if current.end_datetime == nxt.start_datetime:
-                        current.end_datetime = nxt.end_datetime
-                    else:
-                        merged_periods.append(current)
-                        current = nxt
+            if changed:
+                with span("loe.extract_text"):
+                    texts = [self.extract_text(raw_html) for _, _, raw_html in changed]
+                with span("loe.regex"):
+                    for (named, key, _), text in zip(changed, texts):
+                        parsed = self._parse_day(text)
+                        self._item_cache.put(key, parsed)
+                        parsed_items.append((named, parsed))
 
-                merged_periods.append(current)
+            today = self.time_base.today()
+            raw_periods: dict[str, list[PowerOffPeriod]] = {group: [] for group in PowerOffGroup}
+            schedule_days = set()
+            listed_days = set()
+            for named, parsed in parsed_items:
+                if parsed.day is None:
+                    continue
+                listed_days.add(parsed.day)
+                if not named and parsed.day < today:
+                    continue
+                schedule_days.add(parsed.day)
+                for group, periods in parsed.periods.items():
+                    if group in raw_periods:
+                        raw_periods[group].extend(periods)
 
-                return merged_periods
+            self.schedule_days = frozenset(schedule_days)
+            if listed_days:
+                # Дні, що вже зникли з меню, більше не повернуться, а минулі дні в меню не розбираємо знову
+                self._item_cache.evict_before(min(listed_days))
+            with span("loe.merge"):
+                # Сортуємо та об'єднуємо суміжні й перекриті періоди, зокрема через північ
+                return {group: normalize_periods(periods) for group, periods in raw_periods.items()}
 
-        except Exception as err:  # pylint: disable=broad-except
-            _LOGGER.exception("Error fetching power off periods: %s", err)
-            return []
+    def _parse_day(self, text: str) -> ParsedMenuItem:
+        """Parse the periods of every group out of the text of one menu item."""
+        # Витягуємо дату з тексту (наприклад, 09.02.2026)
+        date_match = DATE_PATTERN.search(text)
+        if not date_match:
+            return ParsedMenuItem(None, {})
+        day = date(int(date_match.group(3)), int(date_match.group(2)), int(date_match.group(1)))
+        return ParsedMenuItem(day, extract_day_periods(day, text, self.time_base))
@@ -0,0 +1,194 @@
+"""Provides the MenuItemsScanner class picking LOE menu items out of a streamed JSON body."""
+
+from collections.abc import AsyncIterable
+import hashlib
+import json
+import re
+from typing import Any
+
+# Структурний символ, літерал або пробіли; рядки шукаються окремо через find
+TOKEN_PATTERN = re.compile(rb"[{}\[\]:,]|[^{}\[\]:,\"\s]+|\s+")
+# Довші рядки не можуть бути ключем чи назвою блоку, тож не копіюються
+MAX_KEY_TOKEN = 64
+# Шаблон дати шукається лише в заголовку, на початку сирого рядка rawHtml
+RAW_HTML_PREFIX = 384
+
+MEMBERS_KEY = b'"hydra:member"'
+MENU_ITEMS_KEY = b'"menuItems"'
+NAME_KEY = b'"name"'
+RAW_HTML_KEY = b'"rawHtml"'
+
+# Ролі контейнерів на шляху hydra:member[0].menuItems[i]
+ROOT, MEMBERS, MENU, ITEMS, ITEM = "root", "members", "menu", "items", "item"
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when the first LOE menu exceeds the configured maximum size."""
+
+
+class MenuItemsScanner:
+    """Incremental scanner for the menu items of the first Hydra member.
+
+    Bytes are fed as they arrive. Only the structure is tracked, a single menu
+    item is buffered at a time and only items with a wanted name, or with the
+    optional ``dated`` pattern in the first RAW_HTML_PREFIX bytes of their raw
+    rawHtml string, are decoded and kept, so memory does not grow with the rest
+    of the collection. Both the ``{"hydra:member": [menu, ...]}`` and the plain
+    ``[menu, ...]`` shapes are supported.
+    """
+
+    def __init__(self, names: frozenset[str], dated: re.Pattern[bytes] | None = None) -> None:
+        """Initialize the scanner for the menu items with the given names or a matching rawHtml."""
+        self.names = names
+        self.dated = dated
+        self._name_tokens = frozenset(json.dumps(name).encode() for name in names)
+        self.items: list[dict[str, Any]] = []
+        self.menu_found = False
+        self.done = False
+        self._digest = hashlib.blake2b(digest_size=16)
+        self._buffer = bytearray()
+        # [роль, тип, ключ або індекс, чекаємо ключ]
+        self._stack: list[list[Any]] = []
+        self._item_start: int | None = None
+        self._item_wanted = False
+        self._item_dated = False
+        self._pos = 0
+
+    @property
+    def digest(self) -> bytes:
+        """Digest of the raw JSON of the kept items."""
+        return self._digest.digest()
+
+    def feed(self, chunk: bytes) -> bool:
+        """Scan the next chunk of the body, returns True once the first menu is complete."""
+        if self.done:
+            return True
+        buffer = self._buffer
+        buffer += chunk
+        pos = self._pos
+        match = TOKEN_PATTERN.match
+        while not self.done and pos < len(buffer):
+            start = pos
+            if buffer[start] == 0x22:
+                end = _string_end(buffer, start)
+                if end is None:
+                    # Незавершений рядок, чекаємо наступний фрагмент
+                    break
+                pos = end
+                token = bytes(buffer[start:end]) if end - start <= MAX_KEY_TOKEN else b'"'
+            else:
+                token_match = match(buffer, start)
+                if token_match is None:
+                    raise ValueError("Unexpected character in the LOE response")
+                pos = token_match.end()
+                token = bytes(buffer[start:pos])
+            self._handle(buffer, token, start, pos)
+
+        if self.done:
+            buffer.clear()
+            return True
+        # Зберігаємо лише незавершений токен і поточний блок меню
+        keep_from = self._item_start if self._item_start is not None else pos
+        del buffer[:keep_from]
+        self._pos = pos - keep_from
+        if self._item_start is not None:
+            self._item_start = 0
+        return False
+
+    def _handle(self, buffer: bytearray, token: bytes, start: int, end: int) -> None:
+        stack = self._stack
+        char = token[:1]
+        if char in (b"{", b"["):
+            role = self._child_role(char)
+            if role == MENU:
+                self.menu_found = True
+            elif role == ITEM:
+                self._item_start = start
+                self._item_wanted = self._item_dated = False
+            stack.append([role, char, None if char == b"{" else 0, char == b"{"])
+        elif char in (b"}", b"]"):
+            if not stack:
+                raise ValueError("Unbalanced JSON in the LOE response")
+            role = stack.pop()[0]
+            if role == ITEM:
+                if self._item_wanted or self._item_dated:
+                    self._keep_item(bytes(buffer[self._item_start : end]))
+                self._item_start = None
+            elif role == MENU:
+                self.done = True
+        elif char == b",":
+            if stack:
+                frame = stack[-1]
+                if frame[1] == b"[":
+                    frame[2] += 1
+                else:
+                    frame[3] = True
+        elif char == b":":
+            if stack:
+                stack[-1][3] = False
+        elif char == b'"' and stack:
+            frame = stack[-1]
+            if frame[3]:
+                frame[2] = token
+            elif frame[0] == ITEM:
+                if frame[2] == NAME_KEY:
+                    # Назву перевіряємо до декодування, непотрібні блоки не декодуються
+                    self._item_wanted = token in self._name_tokens or b"\\" in token
+                elif frame[2] == RAW_HTML_KEY and self.dated is not None:
+                    # Початок rawHtml перевіряється прямо в буфері, без копіювання рядка
+                    self._item_dated = self.dated.search(buffer, start, min(end, start + RAW_HTML_PREFIX)) is not None
+
+    def _child_role(self, char: bytes) -> str | None:
+        if not self._stack:
+            return ROOT if char == b"{" else MEMBERS
+        role, _, position, _ = self._stack[-1]
+        if role == ROOT and char == b"[" and position == MEMBERS_KEY:
+            return MEMBERS
+        if role == MEMBERS and char == b"{" and position == 0:
+            return MENU
+        if role == MENU and char == b"[" and position == MENU_ITEMS_KEY:
+            return ITEMS
+        if role == ITEMS and char == b"{":
+            return ITEM
+        return None
+
+    def _keep_item(self, raw: bytes) -> None:
+        item = json.loads(raw)
+        if self._item_dated or item.get("name") in self.names:
+            self.items.append(item)
+            self._digest.update(raw)
+
+
+def _string_end(buffer: bytearray, start: int) -> int | None:
+    """Get the position after the closing quote of the string starting at `start`."""
+    i = start + 1
+    while (i := buffer.find(b'"', i)) >= 0:
+        # Лапка екранована, якщо перед нею непарна кількість зворотних скісних рисок
+        j = i
+        while buffer[j - 1] == 0x5C:
+            j -= 1
+        if (i - j) % 2 == 0:
+            return i + 1
+        i += 1
+    return None
+
+
+async def scan_menu_items(
+    chunks: AsyncIterable[bytes], names: frozenset[str], max_size: int, dated: re.Pattern[bytes] | None = None
+) -> tuple[MenuItemsScanner, int]:
+    """Scan a streamed body, returns the scanner and the number of bytes read.
+
+    Reading stops once the first menu is complete, the rest of the body is
+    left unread for the caller to close. Only the bytes read count towards
+    max_size, so later menus of any size do not matter.
+    """
+    scanner = MenuItemsScanner(names, dated)
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if scanner.feed(chunk):
+            break
+        if size > max_size:
+            msg = f"LOE menu is larger than {max_size} bytes"
+            raise ResponseTooLargeError(msg)
+    return scanner, size
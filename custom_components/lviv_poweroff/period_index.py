@@ -0,0 +1,72 @@
+"""Provides the PowerOffPeriodIndex class for fast lookups of power off periods."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import datetime
+
+from .entities import PowerOffPeriod
+from .intervals import normalize_periods
+
+
+class PowerOffPeriodIndex:
+    """Immutable sorted index of power off periods.
+
+    Overlapping and adjacent periods are merged on build, so both the start and
+    the end arrays are sorted and every query is a binary search.
+    """
+
+    __slots__ = ("periods", "starts", "ends")
+
+    def __init__(self, periods: Iterable[PowerOffPeriod]) -> None:
+        """Build the index from periods in any order."""
+        merged = normalize_periods(periods)
+        self.periods: tuple[PowerOffPeriod, ...] = tuple(merged)
+        self.starts: tuple[datetime, ...] = tuple(period.start_datetime for period in merged)
+        self.ends: tuple[datetime, ...] = tuple(period.end_datetime for period in merged)
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    def position_at(self, at: datetime) -> int | None:
+        """Get the position of the period containing the given moment, bounds included."""
+        i = bisect_right(self.starts, at) - 1
+        if i >= 0 and at <= self.ends[i]:
+            return i
+        return None
+
+    def period_at(self, at: datetime) -> PowerOffPeriod | None:
+        """Get the period containing the given moment, bounds included."""
+        i = self.position_at(at)
+        return None if i is None else self.periods[i]
+
+    def positions_between(self, start_date: datetime, end_date: datetime) -> slice:
+        """Get the positions of the periods overlapping the given range, bounds included."""
+        return slice(bisect_left(self.ends, start_date), bisect_right(self.starts, end_date))
+
+    def periods_between(self, start_date: datetime, end_date: datetime) -> tuple[PowerOffPeriod, ...]:
+        """Get the periods overlapping the given range, bounds included."""
+        return self.periods[self.positions_between(start_date, end_date)]
+
+    def next_start(self, after: datetime, until: datetime) -> datetime | None:
+        """Get the first period start strictly after `after` and not later than `until`."""
+        i = bisect_right(self.starts, after)
+        if i < len(self.starts) and self.starts[i] <= until:
+            return self.starts[i]
+        return None
+
+    def next_end(self, after: datetime, until: datetime) -> datetime | None:
+        """Get the first period end strictly after `after` of a period starting not later than `until`."""
+        i = bisect_right(self.ends, after)
+        if i < len(self.ends) and self.starts[i] <= until:
+            return self.ends[i]
+        return None
+
+    def next_transition(self, after: datetime) -> datetime | None:
+        """Get the first period start or end strictly after the given moment."""
+        i = bisect_right(self.starts, after)
+        j = bisect_right(self.ends, after)
+        next_start = self.starts[i] if i < len(self.starts) else None
+        next_end = self.ends[j] if j < len(self.ends) else None
+        if next_start is None or next_end is None:
+            return next_start or next_end
+        return min(next_start, next_end)
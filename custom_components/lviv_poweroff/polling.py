@@ -0,0 +1,73 @@
+"""Provides the AdaptivePollScheduler class choosing when to poll the LOE API next."""
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import random
+
+from .const import (
+    POLL_INTERVAL_AWAITING,
+    POLL_INTERVAL_MAX,
+    POLL_INTERVAL_MIN,
+    POLL_JITTER,
+    PUBLICATION_START_HOUR,
+    UPDATE_INTERVAL,
+)
+
+DECISIONS_TO_KEEP = 200
+
+
+@dataclass(frozen=True)
+class PollDecision:
+    """Record of a single poll interval decision."""
+
+    at: datetime
+    interval: timedelta
+    reason: str
+
+
+class AdaptivePollScheduler:
+    """Chooses the poll interval from the publication pattern of the schedules.
+
+    Polls fast right after a change and more often while tomorrow's schedule is
+    expected, otherwise backs off exponentially. Every interval gets a random jitter so
+    pollers do not fire in lockstep.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = POLL_INTERVAL_MIN,
+        awaiting_interval: float = POLL_INTERVAL_AWAITING,
+        max_interval: float = POLL_INTERVAL_MAX,
+        jitter: float = POLL_JITTER,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.min_interval = min_interval
+        self.awaiting_interval = awaiting_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self._interval: float = UPDATE_INTERVAL
+        self.decisions: deque[PollDecision] = deque(maxlen=DECISIONS_TO_KEEP)
+
+    def next_interval(self, now: datetime, changed: bool, tomorrow_published: bool) -> timedelta:
+        """Get the delay until the next poll after a successful one."""
+        publication_start = now.replace(hour=PUBLICATION_START_HOUR, minute=0, second=0, microsecond=0)
+
+        if changed:
+            interval, reason = self.min_interval, "changed"
+        elif not tomorrow_published and now >= publication_start:
+            interval, reason = self.awaiting_interval, "awaiting tomorrow"
+        else:
+            interval, reason = min(self._interval * 2, self.max_interval), "stable"
+            if not tomorrow_published:
+                # Do not sleep through the start of the publication window
+                until_publication = (publication_start - now).total_seconds()
+                if until_publication < interval:
+                    interval, reason = max(until_publication, self.min_interval), "publication window"
+
+        self._interval = interval
+        jittered = timedelta(seconds=interval * (1 + self._rng.uniform(-self.jitter, self.jitter)))
+        self.decisions.append(PollDecision(now, jittered, reason))
+        return jittered
@@ -0,0 +1,221 @@
+"""Provides the profile_refresh service capturing a cProfile and tracemalloc snapshot of a refresh."""
+
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    PROFILE_FILE_PREFIX,
+    PROFILE_TOP_DEFAULT,
+    SERVICE_PROFILE_REFRESH,
+    TRACEMALLOC_FRAMES,
+    PowerOffGroup,
+)
+from .coordinator import LvivPowerOffCoordinator
+
+LOGGER = logging.getLogger(__name__)
+
+ATTR_GROUP = "group"
+ATTR_TOP = "top"
+ATTR_TRACEMALLOC = "tracemalloc"
+ATTR_FORCE_PARSE = "force_parse"
+
+# Entries of the service response, the report files hold the full top N
+SUMMARY_TOP = 10
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_GROUP): vol.In([group.value for group in PowerOffGroup]),
+        vol.Optional(ATTR_TOP, default=PROFILE_TOP_DEFAULT): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
+        vol.Optional(ATTR_TRACEMALLOC, default=False): cv.boolean,
+        vol.Optional(ATTR_FORCE_PARSE, default=True): cv.boolean,
+    }
+)
+
+_profile_lock = asyncio.Lock()
+
+
+def top_functions(stats: pstats.Stats, top: int) -> list[dict[str, Any]]:
+    """Get the functions that spent the most time in their own code, the hotspots of the profile."""
+    stats.sort_stats(pstats.SortKey.TIME)
+    result = []
+    for func in stats.fcn_list[:top]:  # type: ignore[attr-defined]
+        _, calls, total, cumulative, _ = stats.stats[func]  # type: ignore[attr-defined]
+        result.append(
+            {
+                "function": pstats.func_std_string(func),  # type: ignore[attr-defined]
+                "calls": calls,
+                "total_ms": round(total * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3),
+            }
+        )
+    return result
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, top: int) -> list[dict[str, Any]]:
+    """Get the source lines holding most of the memory traced in the snapshot."""
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        )
+    )
+    return [
+        {"location": str(stat.traceback), "size_kib": round(stat.size / 1024, 1), "count": stat.count}
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+
+
+def write_report(
+    profile: cProfile.Profile,
+    snapshot: tracemalloc.Snapshot | None,
+    path_prefix: str,
+    top: int,
+) -> dict[str, Any]:
+    """Write the stats file and the top N summary next to it, returns the summary."""
+    stats_file, summary_file = f"{path_prefix}.prof", f"{path_prefix}.txt"
+    profile.dump_stats(stats_file)
+
+    text = io.StringIO()
+    stats = pstats.Stats(profile, stream=text)
+    # The event loop tops the cumulative times, the own times point at the hotspots
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    summary: dict[str, Any] = {
+        "stats_file": stats_file,
+        "summary_file": summary_file,
+        "top_functions": top_functions(stats, top),
+    }
+    if snapshot is not None:
+        allocations = top_allocations(snapshot, top)
+        text.write(f"\nTop {top} allocations still held after the refresh\n\n")
+        for allocation in allocations:
+            text.write(f"{allocation['size_kib']:>10} KiB {allocation['count']:>8} blocks  {allocation['location']}\n")
+        summary["top_allocations"] = allocations
+
+    with open(summary_file, "w", encoding="utf-8") as file:
+        file.write(text.getvalue())
+    return summary
+
+
+def _get_coordinator(hass: HomeAssistant, group: str | None) -> LvivPowerOffCoordinator:
+    """Get the coordinator of the group, or of the first loaded entry."""
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.state is not ConfigEntryState.LOADED:
+            continue
+        coordinator: LvivPowerOffCoordinator = entry.runtime_data
+        if group is None or coordinator.group == group:
+            return coordinator
+    msg = f"No loaded {DOMAIN} entry for group {group}" if group else f"No loaded {DOMAIN} entry"
+    raise HomeAssistantError(msg)
+
+
+async def async_profile_refresh(
+    hass: HomeAssistant,
+    coordinator: LvivPowerOffCoordinator,
+    top: int = PROFILE_TOP_DEFAULT,
+    trace_memory: bool = False,
+    force_parse: bool = True,
+) -> dict[str, Any]:
+    """Refresh the hub and the coordinator under cProfile and write the report to the config directory.
+
+    The profiler sees everything running in the event loop meanwhile, work done
+    in the executor is not included. Unless force_parse is False, the LOE
+    response is parsed even if it did not change since the last poll.
+    """
+    if _profile_lock.locked():
+        msg = "A refresh is already being profiled"
+        raise HomeAssistantError(msg)
+
+    async with _profile_lock:
+        hub = coordinator.hub
+        if force_parse:
+            hub.api.invalidate_cache()
+
+        trace_started = trace_memory and not tracemalloc.is_tracing()
+        if trace_started:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        elif trace_memory:
+            tracemalloc.reset_peak()
+
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        try:
+            profile.enable()
+        except ValueError as err:
+            # Another profiler, e.g. the one of the profiler integration, is running
+            if trace_started:
+                tracemalloc.stop()
+            msg = f"Cannot profile the refresh: {err}"
+            raise HomeAssistantError(msg) from err
+        try:
+            await hub.async_refresh()
+            await coordinator.async_refresh()
+        finally:
+            profile.disable()
+            duration = time.perf_counter() - started
+            snapshot = peak = None
+            if trace_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                snapshot = tracemalloc.take_snapshot()
+            if trace_started:
+                tracemalloc.stop()
+
+        path_prefix = hass.config.path(f"{PROFILE_FILE_PREFIX}_{dt_util.now().strftime('%Y%m%d_%H%M%S')}")
+        report = await hass.async_add_executor_job(write_report, profile, snapshot, path_prefix, top)
+
+    LOGGER.info("Profiled a refresh of group %s in %.1f ms: %s", coordinator.group, duration * 1000, path_prefix)
+    summary = {
+        "group": coordinator.group,
+        "duration_ms": round(duration * 1000, 3),
+        "hub_update_success": hub.last_update_success,
+        "stats_file": report["stats_file"],
+        "summary_file": report["summary_file"],
+        "top_functions": report["top_functions"][:SUMMARY_TOP],
+    }
+    if peak is not None:
+        summary["peak_memory_kib"] = round(peak / 1024, 1)
+        summary["top_allocations"] = report["top_allocations"][:SUMMARY_TOP]
+    return summary
+
+
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_handle_profile_refresh(call: ServiceCall) -> ServiceResponse:
+        coordinator = _get_coordinator(hass, call.data.get(ATTR_GROUP))
+        return await async_profile_refresh(
+            hass,
+            coordinator,
+            call.data[ATTR_TOP],
+            call.data[ATTR_TRACEMALLOC],
+            call.data[ATTR_FORCE_PARSE],
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        async_handle_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def async_unregister_services(hass: HomeAssistant) -> None:
+    """Remove the services of the integration."""
+    hass.services.async_remove(DOMAIN, SERVICE_PROFILE_REFRESH)
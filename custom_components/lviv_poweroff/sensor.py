@@ -7,14 +7,18 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import STATE_OFF, STATE_ON
 from .coordinator import LvivPowerOffCoordinator
+from .hub import LvivPowerOffHub
+from .instrumentation import Instrumentation
 
 LOGGER = logging.getLogger(__name__)
 
@@ -52,6 +56,59 @@ SENSOR_TYPES: tuple[LvivPowerOffSensorDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class LvivPowerOffDiagnosticSensorDescription(SensorEntityDescription):
+    """Lviv PowerOff refresh instrumentation entity description."""
+
+    val_func: Callable[[Instrumentation], Any]
+
+
+def _last_ms(phase: str) -> Callable[[Instrumentation], float | None]:
+    def value(instrumentation: Instrumentation) -> float | None:
+        last = instrumentation.last.get(phase)
+        return round(last, 1) if last is not None else None
+
+    return value
+
+
+# Disabled by default, enabling any of them turns the instrumentation on
+DIAGNOSTIC_SENSOR_TYPES: tuple[LvivPowerOffDiagnosticSensorDescription, ...] = (
+    LvivPowerOffDiagnosticSensorDescription(
+        key="last_fetch_ms",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        name="Last fetch time",
+        val_func=_last_ms("loe.network"),
+    ),
+    LvivPowerOffDiagnosticSensorDescription(
+        key="last_parse_ms",
+        icon="mdi:timer-cog-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        name="Last parse time",
+        val_func=_last_ms("loe.parse"),
+    ),
+    LvivPowerOffDiagnosticSensorDescription(
+        key="bytes_downloaded",
+        icon="mdi:download-network-outline",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        name="Bytes downloaded",
+        val_func=lambda instrumentation: instrumentation.last.get("loe.bytes"),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001
     config_entry: ConfigEntry,
@@ -61,6 +118,9 @@ async def async_setup_entry(
     LOGGER.debug("Setup new entry: %s", config_entry)
     coordinator: LvivPowerOffCoordinator = config_entry.runtime_data
     async_add_entities(LvivPowerOffSensor(coordinator, description) for description in SENSOR_TYPES)
+    async_add_entities(
+        LvivPowerOffDiagnosticSensor(coordinator, description) for description in DIAGNOSTIC_SENSOR_TYPES
+    )
 
 
 class LvivPowerOffSensor(CoordinatorEntity[LvivPowerOffCoordinator], SensorEntity):
@@ -73,11 +133,33 @@ class LvivPowerOffSensor(CoordinatorEntity[LvivPowerOffCoordinator], SensorEntit
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.entity_description = entity_description
-        self._attr_unique_id = (
-            f"{coordinator.config_entry.entry_id}-" f"{coordinator.group}-" f"{self.entity_description.key}"
-        )
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{coordinator.group}-{self.entity_description.key}"
 
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
         return self.entity_description.val_func(self.coordinator)  # type: ignore
+
+
+class LvivPowerOffDiagnosticSensor(CoordinatorEntity[LvivPowerOffHub], SensorEntity):
+    """Refresh instrumentation of the shared hub, updated after every poll."""
+
+    def __init__(
+        self,
+        coordinator: LvivPowerOffCoordinator,
+        entity_description: LvivPowerOffDiagnosticSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator.hub)
+        self.entity_description = entity_description
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}-{coordinator.group}-{self.entity_description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Collect the instrumentation while the sensor is enabled."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.instrumentation.enable())
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the state of the sensor."""
+        return self.entity_description.val_func(self.coordinator.instrumentation)
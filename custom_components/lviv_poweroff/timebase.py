@@ -0,0 +1,92 @@
+"""Provides the TimeBase class turning wall clock times of a day into aware datetimes."""
+
+from datetime import UTC, date, datetime, timedelta, tzinfo as TzInfo
+
+MINUTES_PER_DAY = 24 * 60
+DAYS_TO_KEEP = 8
+
+
+class _Day:
+    """Local midnight of a day and the moments already built for it."""
+
+    __slots__ = ("midnight", "shifts", "moments")
+
+    def __init__(self, day: date, tzinfo: TzInfo) -> None:
+        self.midnight = _resolve(datetime(day.year, day.month, day.day, tzinfo=tzinfo), 0)
+        next_day = day + timedelta(days=1)
+        next_midnight = datetime(next_day.year, next_day.month, next_day.day, tzinfo=tzinfo)
+        # Лише в дні переходу на літній чи зимовий час потрібна нормалізація
+        self.shifts = self.midnight.utcoffset() != next_midnight.utcoffset()
+        self.moments: tuple[dict[int | str, datetime], dict[int | str, datetime]] = (
+            ({}, {}) if self.shifts else ({},) * 2
+        )
+
+
+class TimeBase:
+    """Cached aware datetimes of "HH:MM" times of the days in one time zone.
+
+    The schedules give wall clock times, so a time skipped by the switch to
+    summer time is moved forward by the gap, like the clocks are. A time
+    repeated by the switch to winter time is the first occurrence by default,
+    fold=1 picks the second one. Moments are built once per day and time and
+    only the last DAYS_TO_KEEP days are kept.
+    """
+
+    def __init__(self, tzinfo: TzInfo, days_to_keep: int = DAYS_TO_KEEP) -> None:
+        """Initialize the time base for the time zone."""
+        self.tzinfo = tzinfo
+        self.days_to_keep = days_to_keep
+        self._days: dict[date, _Day] = {}
+
+    def today(self, now: datetime | None = None) -> date:
+        """Get the current date in the time zone."""
+        return (now or datetime.now(UTC)).astimezone(self.tzinfo).date()
+
+    def midnight(self, day: date) -> datetime:
+        """Get the start of the day."""
+        return self._day(day).midnight
+
+    def at(self, day: date, hhmm: str, fold: int = 0) -> datetime:
+        """Get the moment of an "HH:MM" time of the day, "24:00" being the next midnight."""
+        entry = self._days.get(day) or self._day(day)
+        moments = entry.moments[fold]
+        # Кешується і за текстом часу, щоб не розбирати його повторно
+        moment = moments.get(hhmm)
+        if moment is None:
+            moment = moments[hhmm] = self.at_minutes(day, int(hhmm[:2]) * 60 + int(hhmm[3:5]), fold)
+        return moment
+
+    def at_minutes(self, day: date, minutes: int, fold: int = 0) -> datetime:
+        """Get the moment `minutes` of wall clock time after the midnight of the day."""
+        entry = self._days.get(day) or self._day(day)
+        moments = entry.moments[fold]
+        moment = moments.get(minutes)
+        if moment is None:
+            if minutes == 0:
+                moment = entry.midnight
+            elif minutes >= MINUTES_PER_DAY:
+                days, minutes_left = divmod(minutes, MINUTES_PER_DAY)
+                moment = self.at_minutes(day + timedelta(days=days), minutes_left, fold)
+            else:
+                local = datetime(day.year, day.month, day.day, minutes // 60, minutes % 60, tzinfo=self.tzinfo)
+                moment = _resolve(local, fold) if entry.shifts else local
+            moments[minutes] = moment
+        return moment
+
+    def _day(self, day: date) -> _Day:
+        entry = self._days.get(day)
+        if entry is None:
+            if len(self._days) >= self.days_to_keep:
+                del self._days[min(self._days)]
+            entry = self._days[day] = _Day(day, self.tzinfo)
+        return entry
+
+
+def _resolve(local: datetime, fold: int) -> datetime:
+    """Normalize a wall clock time that may be skipped or repeated in its zone."""
+    tzinfo = local.tzinfo
+    resolved = local.astimezone(UTC).astimezone(tzinfo)
+    if fold and resolved.replace(tzinfo=None) == local.replace(tzinfo=None):
+        # Час існує, тож fold обирає його друге входження, якщо воно є
+        resolved = local.replace(fold=1).astimezone(UTC).astimezone(tzinfo)
+    return resolved
@@ -1,48 +1,173 @@
-import asyncio
-import logging
-import aiohttp
-
-from homeassistant.util import dt as dt_util
-from custom_components.lviv_poweroff.loe_scrapper import LoeScrapper  # Замініть на правильний шлях
-from custom_components.lviv_poweroff.const import PowerOffGroup
-# from your_module.entities import PowerOffPeriod
-
-original_init = aiohttp.ClientSession.__init__
-
+"""Command line scrapper printing the LOE power off schedule as JSON or NDJSON.
 
-def new_init(self, *args, **kwargs):
-    if "connector" not in kwargs:
-        # Force fail-safe SSL context
-        kwargs["connector"] = aiohttp.TCPConnector(ssl=False)
-    original_init(self, *args, **kwargs)
+Fetch the schedule of every group once:
 
+    python run_scrapper.py
 
-aiohttp.ClientSession.__init__ = new_init
+Keep polling two groups and print only what changes, one JSON object per line:
 
-# Налаштування логування
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    python run_scrapper.py -g 1.1 -g 2.2 --format ndjson --watch
 
+Logs go to stderr, so stdout can be piped into other tools.
+"""
 
-async def main():
-    """Головна функція."""
-
-    # Виберіть вашу групу
-    group = PowerOffGroup.OneOne  # Змініть на вашу групу
-
-    scraper = LoeScrapper(group=group.value, time_zone=dt_util.get_time_zone("Europe/Kyiv"))
-
-    # Перевірка API
-    if await scraper.validate():
-        print("✓ API доступне")
+import argparse
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+import json
+import logging
+import sys
+from typing import Any, TextIO
+from zoneinfo import ZoneInfo
 
-        # Отримання графіків
-        periods = await scraper.get_power_off_periods()
+import aiohttp
 
-        for i, period in enumerate(periods, 1):
-            print(f"{i}. {period.start_datetime} → {period.end_datetime}")
+from custom_components.lviv_poweroff.const import KEEPALIVE_TIMEOUT, POLL_INTERVAL_MIN, PowerOffGroup
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.loe_scrapper import LoeScrapper
+from custom_components.lviv_poweroff.polling import AdaptivePollScheduler
+
+_LOGGER = logging.getLogger("run_scrapper")
+
+Schedule = dict[str, list[PowerOffPeriod]]
+
+
+def period_to_dict(period: PowerOffPeriod) -> dict[str, str]:
+    return {"start": period.start_datetime.isoformat(), "end": period.end_datetime.isoformat()}
+
+
+def schedule_records(schedule: Schedule, groups: Iterable[str], fetched_at: datetime) -> list[dict[str, Any]]:
+    """One record per group with all of its periods."""
+    return [
+        {"fetched_at": fetched_at.isoformat(), "group": group, "periods": list(map(period_to_dict, schedule[group]))}
+        for group in groups
+    ]
+
+
+def diff_records(old: Schedule, new: Schedule, groups: Iterable[str], fetched_at: datetime) -> list[dict[str, Any]]:
+    """One record per period that appeared or disappeared, in group and time order."""
+    records = []
+    for group in groups:
+        before = {(p.start_datetime, p.end_datetime) for p in old.get(group, [])}
+        after = {(p.start_datetime, p.end_datetime) for p in new.get(group, [])}
+        changes = [(key, "removed") for key in before - after] + [(key, "added") for key in after - before]
+        for (start, end), change in sorted(changes):
+            records.append(
+                {
+                    "fetched_at": fetched_at.isoformat(),
+                    "group": group,
+                    "change": change,
+                    "start": start.isoformat(),
+                    "end": end.isoformat(),
+                }
+            )
+    return records
+
+
+def emit(records: list[dict[str, Any]], output_format: str, out: TextIO) -> None:
+    """Write the records as one JSON array or as one JSON object per line."""
+    if output_format == "json":
+        json.dump(records, out, ensure_ascii=False, indent=2)
+        out.write("\n")
     else:
-        print("✗ Помилка підключення")
+        out.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    out.flush()
+
+
+async def fetch_schedule(scrapper: LoeScrapper, groups: list[str]) -> Schedule | None:
+    """Fetch the schedule of the groups, None when the API could not be read."""
+    try:
+        periods = await scrapper.get_all_power_off_periods()
+    except Exception as err:  # pylint: disable=broad-except
+        _LOGGER.warning("Cannot read the LOE API: %s", err)
+        return None
+    return {group: periods[group] for group in groups}
+
+
+async def watch(
+    scrapper: LoeScrapper, groups: list[str], args: argparse.Namespace, out: TextIO, stop: asyncio.Event
+) -> None:
+    """Poll at the integration's adaptive pace and emit the changes.
+
+    The first successful fetch is emitted in full, later ones only when they
+    differ. Unchanged responses are answered from the scrapper's cache.
+    """
+    scheduler = AdaptivePollScheduler()
+    current: Schedule | None = None
+    while not stop.is_set():
+        now = datetime.now(scrapper.tzinfo)
+        schedule = await fetch_schedule(scrapper, groups)
+        if schedule is None:
+            _LOGGER.warning("Cannot fetch the schedule, retrying in %s s", POLL_INTERVAL_MIN)
+            delay = float(POLL_INTERVAL_MIN)
+        else:
+            changed = current is not None and schedule != current
+            if current is None:
+                emit(schedule_records(schedule, groups, now), args.format, out)
+            elif changed:
+                emit(diff_records(current, schedule, groups, now), args.format, out)
+            current = schedule
+            tomorrow_published = now.date() + timedelta(days=1) in scrapper.schedule_days
+            delay = scheduler.next_interval(now, changed, tomorrow_published).total_seconds()
+            _LOGGER.info("Next poll in %.0f s (%s)", delay, scheduler.decisions[-1].reason)
+        if args.interval is not None:
+            delay = args.interval
+        try:
+            await asyncio.wait_for(stop.wait(), delay)
+        except TimeoutError:
+            pass
+
+
+async def run(args: argparse.Namespace, out: TextIO = sys.stdout, stop: asyncio.Event | None = None) -> int:
+    """Run the scrapper with parsed arguments, returns the exit status."""
+    groups = args.group or [group.value for group in PowerOffGroup]
+    tzinfo = ZoneInfo(args.timezone)
+    connector = aiohttp.TCPConnector(keepalive_timeout=KEEPALIVE_TIMEOUT, ssl=not args.insecure)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        scrapper = LoeScrapper(None, tzinfo, session)
+        if args.watch:
+            await watch(scrapper, groups, args, out, stop or asyncio.Event())
+            return 0
+
+        now = datetime.now(tzinfo)
+        schedule = await fetch_schedule(scrapper, groups)
+        if schedule is None:
+            _LOGGER.error("Cannot fetch the schedule from the LOE API")
+            return 1
+        emit(schedule_records(schedule, groups, now), args.format, out)
+        return 0
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "-g",
+        "--group",
+        action="append",
+        choices=[group.value for group in PowerOffGroup],
+        help="group to print, can be repeated, all groups by default",
+    )
+    parser.add_argument("-f", "--format", choices=("json", "ndjson"), default="json", help="output format")
+    parser.add_argument("-w", "--watch", action="store_true", help="keep polling and print only the changes")
+    parser.add_argument(
+        "--interval", type=float, help="fixed seconds between polls in watch mode instead of the adaptive pace"
+    )
+    parser.add_argument("--timezone", default="Europe/Kyiv", help="time zone of the printed times")
+    parser.add_argument("--insecure", action="store_true", help="do not verify the TLS certificate of the API")
+    parser.add_argument("-v", "--verbose", action="count", default=0, help="log more, can be repeated")
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    args = parse_args()
+    level = (logging.WARNING, logging.INFO, logging.DEBUG)[min(args.verbose, 2)]
+    logging.basicConfig(level=level, stream=sys.stderr, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    try:
+        sys.exit(asyncio.run(run(args)))
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
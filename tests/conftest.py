@@ -0,0 +1,50 @@
+from collections.abc import AsyncIterator
+from zoneinfo import ZoneInfo
+
+import aiohttp
+import pytest_asyncio
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.lviv_poweroff import energyua_scrapper, loe_scrapper
+from custom_components.lviv_poweroff.const import DOMAIN
+from custom_components.lviv_poweroff.hub import LvivPowerOffHub
+from tests.hass_standin import HassStandIn, patch_hub
+from tests.standin_server import StandInServer
+
+TZ = ZoneInfo("Europe/Kyiv")
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path) -> AsyncIterator[HassStandIn]:
+    previous = dt_util.get_default_time_zone()
+    dt_util.set_default_time_zone(TZ)
+    async with aiohttp.ClientSession() as session:
+        hass = HassStandIn(str(tmp_path), session)
+        yield hass
+        await hass.async_block_till_done()
+    dt_util.set_default_time_zone(previous)
+
+
+@pytest_asyncio.fixture
+async def hub(hass: HassStandIn) -> AsyncIterator[LvivPowerOffHub]:
+    with patch_hub():
+        hub = LvivPowerOffHub(hass)  # type: ignore[arg-type]
+        hass.data[DOMAIN] = hub
+        yield hub
+        await hass.async_block_till_done()
+        await hub.async_shutdown()
+
+
+@pytest_asyncio.fixture
+async def standin_server(request, monkeypatch) -> AsyncIterator[StandInServer]:
+    """Serve the stand-in LOE API and Energy UA in place of the real ones.
+
+    Pass a StandInConfig by indirect parametrization to change its behaviour.
+    """
+    server = StandInServer(getattr(request, "param", None))
+    await server.start()
+    monkeypatch.setattr(loe_scrapper, "URL", server.loe_url)
+    monkeypatch.setattr(energyua_scrapper, "URL", server.energyua_url)
+    yield server
+    await server.close()
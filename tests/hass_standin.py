@@ -0,0 +1,163 @@
+"""Provides HassStandIn, just enough of Home Assistant to run the hub and the coordinators."""
+
+import asyncio
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import os
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.lviv_poweroff.const import DOMAIN, POWEROFF_GROUP_CONF
+from custom_components.lviv_poweroff.coordinator import LvivPowerOffCoordinator
+from custom_components.lviv_poweroff.hub import LvivPowerOffHub
+
+HUB_MODULE = "custom_components.lviv_poweroff.hub"
+
+
+class MemoryStore:
+    """Store keeping the saved data in memory and counting the saves."""
+
+    def __init__(self, hass: Any, version: int, key: str, *args: Any, **kwargs: Any) -> None:
+        self.data: Any = None
+        self.saves = 0
+
+    async def async_load(self) -> Any:
+        return self.data
+
+    async def async_save(self, data: Any) -> None:
+        self.data = data
+        self.saves += 1
+
+    def async_delay_save(self, data_func: Callable[[], Any], delay: float = 0) -> None:
+        self.data = data_func()
+        self.saves += 1
+
+
+class StandInConfigEntry:
+    """Loaded config entry of a group."""
+
+    def __init__(self, group: str) -> None:
+        self.entry_id = f"entry_{group}"
+        self.domain = DOMAIN
+        self.data = {POWEROFF_GROUP_CONF: group}
+        self.state = ConfigEntryState.LOADED
+        self.pref_disable_polling = False
+        self.runtime_data: Any = None
+        self.on_unload: list[Callable[[], Any]] = []
+
+    def async_on_unload(self, func: Callable[[], Any]) -> None:
+        self.on_unload.append(func)
+
+
+class StandInServices:
+    """Service registry calling the handlers with the validated data."""
+
+    def __init__(self) -> None:
+        self.handlers: dict[tuple[str, str], tuple[Callable, Any]] = {}
+
+    def async_register(
+        self, domain: str, service: str, handler: Callable, schema: Any = None, supports_response: Any = None
+    ) -> None:
+        self.handlers[(domain, service)] = (handler, schema)
+
+    def async_remove(self, domain: str, service: str) -> None:
+        self.handlers.pop((domain, service), None)
+
+    def has_service(self, domain: str, service: str) -> bool:
+        return (domain, service) in self.handlers
+
+    async def async_call(self, domain: str, service: str, data: dict | None = None, **kwargs: Any) -> Any:
+        handler, schema = self.handlers[(domain, service)]
+        data = data or {}
+        return await handler(SimpleNamespace(domain=domain, service=service, data=schema(data) if schema else data))
+
+
+class StandInConfigEntries:
+    """Config entries of the integration, forwarding to and unloading the platforms always succeeds."""
+
+    def __init__(self, entries: list[StandInConfigEntry]) -> None:
+        self.entries = entries
+        self.platforms: dict[str, list[Any]] = {}
+
+    def async_entries(self, domain: str | None = None) -> list[StandInConfigEntry]:
+        return list(self.entries)
+
+    async def async_forward_entry_setups(self, entry: StandInConfigEntry, platforms: list[Any]) -> None:
+        self.platforms[entry.entry_id] = list(platforms)
+
+    async def async_unload_platforms(self, entry: StandInConfigEntry, platforms: list[Any]) -> bool:
+        return self.platforms.pop(entry.entry_id, None) == list(platforms)
+
+
+class HassStandIn:
+    """The parts of HomeAssistant used by the hub, the coordinators and DataUpdateCoordinator.
+
+    Background tasks and executor jobs run on the current event loop, config
+    entries are added to `entries` and the hub gets `session` from patch_hub().
+    """
+
+    def __init__(
+        self, config_dir: str, session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop | None = None
+    ) -> None:
+        self.loop = loop or asyncio.get_running_loop()
+        self.session = session
+        self.data: dict[str, Any] = {}
+        self.config = SimpleNamespace(config_dir=config_dir, path=lambda *parts: os.path.join(config_dir, *parts))
+        self.is_running = True
+        self.is_stopping = False
+        self.bus = SimpleNamespace(async_listen_once=lambda *args: lambda: None)
+        self.services = StandInServices()
+        self.entries: list[StandInConfigEntry] = []
+        self.config_entries = StandInConfigEntries(self.entries)
+        self._tasks: set[asyncio.Future] = set()
+
+    def _track(self, task: asyncio.Future) -> asyncio.Future:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def async_create_task(self, target: Any, name: str | None = None, eager_start: bool = True) -> asyncio.Future:
+        return self._track(self.loop.create_task(target, name=name))
+
+    def async_create_background_task(self, target: Any, name: str, eager_start: bool = True) -> asyncio.Future:
+        return self._track(self.loop.create_task(target, name=name))
+
+    def async_add_executor_job(self, target: Callable, *args: Any) -> asyncio.Future:
+        return self._track(self.loop.run_in_executor(None, target, *args))
+
+    def async_run_hass_job(self, job: Any, *args: Any, **kwargs: Any) -> asyncio.Future | None:
+        result = job.target(*args)
+        return self.async_create_task(result) if asyncio.iscoroutine(result) else None
+
+    def verify_event_loop_thread(self, what: str) -> None:
+        pass
+
+    async def async_block_till_done(self) -> None:
+        """Wait for the background tasks and executor jobs, including the ones they start."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+@contextmanager
+def patch_hub() -> Iterator[None]:
+    """Give hubs the session of their HassStandIn and a MemoryStore instead of the Home Assistant ones."""
+    with (
+        patch(f"{HUB_MODULE}.async_get_clientsession", side_effect=lambda hass: hass.session),
+        patch(f"{HUB_MODULE}.Store", MemoryStore),
+    ):
+        yield
+
+
+def add_coordinator(hass: HassStandIn, hub: LvivPowerOffHub, group: str) -> LvivPowerOffCoordinator:
+    """Set up the coordinator of a group like async_setup_entry, without the first refresh."""
+    entry = StandInConfigEntry(group)
+    coordinator = LvivPowerOffCoordinator(hass, entry, hub)  # type: ignore[arg-type]
+    coordinator.async_subscribe_to_hub()
+    entry.runtime_data = coordinator
+    hass.entries.append(entry)
+    return coordinator
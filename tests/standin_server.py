@@ -0,0 +1,208 @@
+"""Provides the StandInServer class, a local aiohttp stand-in for the LOE API and Energy UA."""
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+import json
+import random
+import time
+from zoneinfo import ZoneInfo
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.lviv_poweroff.const import PowerOffGroup
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+
+TZ = ZoneInfo("Europe/Kyiv")
+MENUS_PATH = "/api/menus"
+ENERGYUA_PATH = "/grupa/{group}"
+
+
+@dataclass
+class StandInConfig:
+    """Behaviour of the stand-in upstreams."""
+
+    # Response latency of the LOE API and Energy UA, uniformly spread by the jitter
+    loe_latency: float = 0.0
+    energyua_latency: float = 0.0
+    latency_jitter: float = 0.0
+    # Share of requests answered with 503
+    error_rate: float = 0.0
+    # Archive items of `history_html_size` bytes added to the menus response
+    history_items: int = 0
+    history_html_size: int = 20 * 1024
+    # Seconds between schedule changes, None keeps the schedule fixed
+    change_every: float | None = None
+    publish_tomorrow: bool = True
+    seed: int = 0
+
+
+def day_schedule(seed: str) -> dict[str, list[tuple[int, int]]]:
+    """Generate the outages of every group for a day as half hour aligned minute ranges."""
+    rng = random.Random(seed)
+    schedule = {}
+    for group in PowerOffGroup:
+        ranges: list[tuple[int, int]] = []
+        minute = rng.randrange(0, 8) * 30
+        while len(ranges) < 3 and minute < 22 * 60:
+            length = rng.choice((120, 180, 210, 240))
+            ranges.append((minute, min(minute + length, 23 * 60)))
+            minute += length + rng.randrange(4, 16) * 30
+        schedule[group.value] = ranges[: rng.randrange(0, 4)]
+    return schedule
+
+
+def format_minute(minute: int) -> str:
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+class StandInServer:
+    """Serves generated LOE menus JSON and Energy UA pages with configurable faults.
+
+    The schedule is derived from the seed, the current day and the schedule
+    version, which advances every `change_every` seconds. The LOE endpoint
+    supports ETag revalidation like the real API. Every request is counted.
+    """
+
+    def __init__(self, config: StandInConfig | None = None) -> None:
+        """Initialize the stand-in, call start() to serve it."""
+        self.config = config or StandInConfig()
+        self.requests: Counter[str] = Counter()
+        self.responses: Counter[int] = Counter()
+        self._rng = random.Random(self.config.seed)
+        self._started = time.monotonic()
+        self._bodies: dict[tuple[date, int], tuple[bytes, str]] = {}
+        self._server: TestServer | None = None
+
+    @property
+    def version(self) -> int:
+        """Current schedule version."""
+        if not self.config.change_every:
+            return 0
+        return int((time.monotonic() - self._started) / self.config.change_every)
+
+    def schedule(self, day: date) -> dict[str, list[tuple[int, int]]]:
+        """Get the published schedule of a day."""
+        return day_schedule(f"{self.config.seed}-{day.isoformat()}-{self.version}")
+
+    def published_days(self) -> list[date]:
+        today = datetime.now(TZ).date()
+        return [today, today + timedelta(days=1)] if self.config.publish_tomorrow else [today]
+
+    def expected_periods(self, group: str) -> list[PowerOffPeriod]:
+        """Get the periods LoeScrapper should parse out of the current schedule."""
+        periods: list[PowerOffPeriod] = []
+        for day in self.published_days():
+            midnight = datetime(day.year, day.month, day.day, tzinfo=TZ)
+            periods.extend(
+                PowerOffPeriod(midnight + timedelta(minutes=start), midnight + timedelta(minutes=end))
+                for start, end in self.schedule(day)[group]
+            )
+        return periods
+
+    def url(self, path: str) -> str:
+        """Get the URL of a path on the running stand-in."""
+        assert self._server is not None
+        return str(self._server.make_url(path))
+
+    @property
+    def loe_url(self) -> str:
+        """URL to use as loe_scrapper.URL."""
+        return self.url(MENUS_PATH)
+
+    @property
+    def energyua_url(self) -> str:
+        """URL template to use as energyua_scrapper.URL."""
+        return self.url("/grupa/") + "{}"
+
+    async def start(self) -> None:
+        """Start serving on a free local port."""
+        app = web.Application()
+        app.router.add_get(MENUS_PATH, self._handle_menus)
+        app.router.add_get(ENERGYUA_PATH, self._handle_energyua)
+        self._server = TestServer(app)
+        await self._server.start_server()
+
+    async def close(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    async def _delay(self, latency: float) -> bool:
+        """Wait for the configured latency, returns False when the request should fail."""
+        delay = latency + self._rng.uniform(-1, 1) * self.config.latency_jitter
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._rng.random() >= self.config.error_rate
+
+    async def _handle_menus(self, request: web.Request) -> web.Response:
+        self.requests["loe"] += 1
+        if not await self._delay(self.config.loe_latency):
+            return self._respond(web.Response(status=503))
+
+        body, etag = self._menus_body()
+        if request.headers.get("If-None-Match") == etag:
+            return self._respond(web.Response(status=304, headers={"ETag": etag}))
+        return self._respond(web.Response(body=body, content_type="application/ld+json", headers={"ETag": etag}))
+
+    async def _handle_energyua(self, request: web.Request) -> web.Response:
+        self.requests["energy_ua"] += 1
+        if not await self._delay(self.config.energyua_latency):
+            return self._respond(web.Response(status=503))
+
+        html = self.energyua_page(request.match_info["group"])
+        return self._respond(web.Response(text=html, content_type="text/html"))
+
+    def energyua_page(self, group: str) -> str:
+        """Render the Energy UA page of a group for the current schedule."""
+        blocks = []
+        for day in self.published_days():
+            ranges = self.schedule(day).get(group, [])
+            # Energy UA shows whole hours, the last one ending at 00:00
+            cells = []
+            for hour in range(24):
+                active = any(start < (hour + 1) * 60 and end > hour * 60 for start, end in ranges)
+                cells.append(
+                    '<div class="scale_hours_el">'
+                    + ('<span class="hour_active"></span>' if active else "")
+                    + f'<i class="hour_info_from">{hour:02d}:00</i><i class="hour_info_to">{(hour + 1) % 24:02d}:00</i></div>'
+                )
+            blocks.append(f'<div class="scale_hours">{"".join(cells)}</div>')
+        return f"<html><body><h1>Група {group}</h1>{''.join(blocks)}</body></html>"
+
+    def _respond(self, response: web.Response) -> web.Response:
+        self.responses[response.status] += 1
+        return response
+
+    def _menus_body(self) -> tuple[bytes, str]:
+        today = datetime.now(TZ).date()
+        key = (today, self.version)
+        if key not in self._bodies:
+            self._bodies.clear()
+            self._bodies[key] = (self._build_menus_body(), f'"{today.isoformat()}-{self.version}"')
+        return self._bodies[key]
+
+    def _build_menus_body(self) -> bytes:
+        items: list[dict[str, str]] = []
+        for day, name in zip(self.published_days(), ("Today", "Tomorrow")):
+            lines = []
+            for group, ranges in self.schedule(day).items():
+                if ranges:
+                    times = ", ".join(f"з {format_minute(start)} до {format_minute(end)}" for start, end in ranges)
+                    lines.append(f"<p>Група {group}. Електроенергії немає {times}.</p>")
+                else:
+                    lines.append(f"<p>Група {group}. Електроенергія є.</p>")
+            html = f"<div><p><b>Графік погодинних відключень на {day:%d.%m.%Y}</b></p>{''.join(lines)}</div>"
+            items.append({"@id": f"/api/menu_items/{len(items) + 1}", "name": name, "rawHtml": html})
+
+        history_html = "<p>Архів графіків</p>" * (self.config.history_html_size // 40)
+        archive = [
+            {"@id": f"/api/menu_items/{i + 100}", "name": "Archive", "rawHtml": history_html}
+            for i in range(self.config.history_items)
+        ]
+        members = [{"@id": "/api/menus/12", "name": "Графік погодинних відключень", "menuItems": items + archive}]
+        data = {"@context": "/api/contexts/Menu", "hydra:member": members, "hydra:totalItems": len(members)}
+        return json.dumps(data, ensure_ascii=False).encode()
@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from custom_components.lviv_poweroff.archive import ScheduleArchive
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+
+TZ = ZoneInfo("Europe/Kyiv")
+DAY = datetime(2026, 2, 9, tzinfo=TZ)
+
+
+def period(day: int, start_hour: float, end_hour: float) -> PowerOffPeriod:
+    base = DAY + timedelta(days=day)
+    return PowerOffPeriod(base + timedelta(hours=start_hour), base + timedelta(hours=end_hour))
+
+
+def test_archive_serves_latest_version_per_day(tmp_path) -> None:
+    # Given an archive with a schedule for two days, later corrected for the first one
+    archive = ScheduleArchive(str(tmp_path / "archive.db"), retention_days=30, compact_after_days=7)
+    first = {"1.1": [period(0, 9, 12), period(1, 13, 16.5)], "1.2": [period(0, 0, 2)]}
+    corrected = {"1.1": [period(0, 9, 11), period(1, 13, 16.5)], "1.2": [period(0, 0, 2)]}
+    assert archive.record(first, DAY, DAY + timedelta(days=2), DAY) == 2
+    assert archive.record(first, DAY, DAY + timedelta(days=2), DAY + timedelta(hours=1)) == 0
+    assert archive.record(corrected, DAY, DAY + timedelta(days=2), DAY + timedelta(hours=2)) == 1
+
+    # And the next day, only its own and the following day are published
+    next_day = {"1.1": [period(1, 13, 16.5), period(2, 19.5, 24)], "1.2": []}
+    archive.record(next_day, DAY + timedelta(days=1), DAY + timedelta(days=3), DAY + timedelta(days=1))
+
+    # Then a range query returns the newest version of every day
+    periods = archive.periods_between("1.1", DAY - timedelta(days=30), DAY + timedelta(days=30), TZ)
+    assert periods == [period(0, 9, 11), period(1, 13, 16.5), period(2, 19.5, 24)]
+    assert archive.periods_between("1.2", DAY, DAY + timedelta(days=3), TZ) == [period(0, 0, 2)]
+
+    # And a period started before the range is still returned
+    assert archive.periods_between("1.1", DAY + timedelta(hours=10), DAY + timedelta(hours=10), TZ) == [
+        period(0, 9, 11)
+    ]
+    archive.close()
+
+
+def test_archive_compaction_and_retention(tmp_path) -> None:
+    # Given an archive with superseded and expired versions
+    archive = ScheduleArchive(str(tmp_path / "archive.db"), retention_days=30, compact_after_days=7)
+    archive.record({"1.1": [period(0, 9, 12)]}, DAY, DAY + timedelta(days=1), DAY)
+    archive.record({"1.1": [period(0, 9, 11)]}, DAY, DAY + timedelta(days=1), DAY + timedelta(hours=1))
+    archive.record({"1.1": [period(60, 1, 2)]}, DAY + timedelta(days=60), DAY + timedelta(days=61), DAY)
+
+    # When the archive is compacted two months later
+    removed = archive.compact(DAY + timedelta(days=61))
+
+    # Then only the live version is kept
+    assert removed == 2
+    assert archive.periods_between("1.1", DAY, DAY + timedelta(days=62), TZ) == [period(60, 1, 2)]
+    archive.close()
@@ -0,0 +1,110 @@
+from datetime import UTC, date, datetime, timedelta
+import random
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.lviv_poweroff.bitmap_schedule import DaySchedule, GroupSchedule
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.period_index import PowerOffPeriodIndex
+from custom_components.lviv_poweroff.timebase import TimeBase
+
+TZ = ZoneInfo("Europe/Kyiv")
+START = datetime(2026, 2, 9, tzinfo=TZ)
+# Europe/Kyiv switches at 03:00 to 04:00 in spring and at 04:00 back to 03:00 in autumn
+SPRING_FORWARD = date(2026, 3, 29)
+FALL_BACK = date(2026, 10, 25)
+
+
+def random_periods(seed: int, start: datetime) -> list[PowerOffPeriod]:
+    rnd = random.Random(seed)
+    periods = []
+    for _ in range(40):
+        # Built in UTC, so the repeated hour of the autumn switch is ordered correctly too
+        period_start = start.astimezone(UTC) + timedelta(minutes=rnd.randrange(0, 60 * 24 * 10))
+        periods.append(PowerOffPeriod(period_start, period_start + timedelta(minutes=rnd.randrange(1, 60 * 30))))
+    return periods
+
+
+def as_utc(periods) -> list[tuple[datetime, datetime]]:
+    return [(p.start_datetime.astimezone(UTC), p.end_datetime.astimezone(UTC)) for p in periods]
+
+
+@pytest.mark.parametrize("start", [START, datetime(2026, 3, 24, tzinfo=TZ), datetime(2026, 10, 20, tzinfo=TZ)])
+@pytest.mark.parametrize("seed", range(5))
+def test_group_schedule_matches_periods(seed, start) -> None:
+    # Given random minute aligned periods, some crossing midnight or a switch of the clocks
+    periods = random_periods(seed, start)
+    merged = PowerOffPeriodIndex(periods)
+    schedule = GroupSchedule.from_periods(periods, TimeBase(TZ))
+
+    # Then converting back is lossless up to merging
+    assert as_utc(schedule.to_periods()) == as_utc(merged.periods)
+
+    for minutes in range(-30, 60 * 24 * 12, 47):
+        at = start.astimezone(UTC) + timedelta(minutes=minutes)
+
+        # And point and transition queries agree with the periods
+        assert schedule.is_off(at) == any(p.start_datetime <= at < p.end_datetime for p in merged.periods)
+        assert schedule.next_transition(at) == merged.next_transition(at)
+
+        # And window sums count every minute without power
+        end = at + timedelta(hours=7)
+        expected = sum(
+            max((min(p.end_datetime, end) - max(p.start_datetime, at)) // timedelta(minutes=1), 0)
+            for p in merged.periods
+        )
+        assert schedule.minutes_off(at, end) == expected
+
+
+def test_day_schedule_queries() -> None:
+    # Given a day without power 00:00-02:30 and 19:30-24:00
+    day = START.date()
+    schedule = DaySchedule(day, TimeBase(TZ), ((1 << 150) - 1) | (((1 << 270) - 1) << 1170))
+
+    # Then minutes, sums and transitions are answered from the bit mask
+    assert schedule.is_off(0) and schedule.is_off(149) and not schedule.is_off(150)
+    assert schedule.minutes_off() == 420
+    assert schedule.minutes_off(120, 1200) == 60
+    assert schedule.next_transition(-1) == 0
+    assert schedule.next_transition(0) == 150
+    assert schedule.next_transition(150) == 1170
+    assert schedule.next_transition(1170) == 1440
+    assert schedule.next_transition(1440) is None
+    assert DaySchedule.from_periods(day, schedule.to_periods(), TimeBase(TZ)) == schedule
+
+
+def test_fall_back_day_counts_the_repeated_hour() -> None:
+    # Given the day Europe/Kyiv switches back to winter time
+    time_base = TimeBase(TZ)
+    repeated = PowerOffPeriod(time_base.at(FALL_BACK, "03:30", fold=1), time_base.at(FALL_BACK, "05:00"))
+    night = PowerOffPeriod(time_base.at(FALL_BACK, "00:00"), time_base.at(FALL_BACK, "06:00"))
+
+    # When schedules are built from outages in and around the repeated hour
+    schedule = GroupSchedule.from_periods([repeated], time_base)
+    night_schedule = GroupSchedule.from_periods([night], time_base)
+
+    # Then the day has 25 hours and the second 03:30 is kept
+    assert schedule.days[FALL_BACK].length == 25 * 60
+    assert as_utc(schedule.to_periods()) == [
+        (datetime(2026, 10, 25, 1, 30, tzinfo=UTC), datetime(2026, 10, 25, 3, 0, tzinfo=UTC))
+    ]
+    # And the outage from 00:00 to 06:00 lasts seven real hours
+    assert night_schedule.minutes_off(night.start_datetime, night.end_datetime) == 420
+    assert night_schedule.minutes_off_on(FALL_BACK) == 420
+    assert night_schedule.is_off(datetime(2026, 10, 25, 3, 59, tzinfo=UTC))
+
+
+def test_spring_forward_day_skips_the_missing_hour() -> None:
+    # Given the day Europe/Kyiv switches to summer time
+    time_base = TimeBase(TZ)
+    night = PowerOffPeriod(time_base.at(SPRING_FORWARD, "02:00"), time_base.at(SPRING_FORWARD, "05:00"))
+
+    # When a schedule is built from an outage over the skipped hour
+    schedule = GroupSchedule.from_periods([night], time_base)
+
+    # Then the day has 23 hours and the outage lasts two real hours
+    assert schedule.days[SPRING_FORWARD].length == 23 * 60
+    assert schedule.minutes_off_on(SPRING_FORWARD) == 120
+    assert as_utc(schedule.to_periods()) == as_utc([night])
+    assert schedule.next_transition(night.start_datetime) == night.end_datetime
@@ -0,0 +1,95 @@
+import random
+
+from custom_components.lviv_poweroff.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock, jitter: float = 0.0) -> CircuitBreaker:
+    return CircuitBreaker(min_backoff=60, max_backoff=1800, jitter=jitter, rng=random.Random(1), clock=clock)
+
+
+def test_backoff_grows_exponentially_up_to_the_maximum() -> None:
+    # Given a closed breaker without jitter
+    breaker = make_breaker(FakeClock())
+    assert breaker.state == CLOSED
+
+    # When the sources keep failing
+    backoffs = [breaker.record_failure() for _ in range(7)]
+
+    # Then the backoff doubles until it reaches the maximum
+    assert backoffs == [60, 120, 240, 480, 960, 1800, 1800]
+    assert breaker.state == OPEN
+
+
+def test_backoff_is_jittered_within_bounds() -> None:
+    # Given a breaker with 20% jitter
+    breaker = make_breaker(FakeClock(), jitter=0.2)
+
+    # When it opens many times from the first failure
+    backoffs = set()
+    for _ in range(50):
+        backoffs.add(breaker.record_failure())
+        breaker.record_success()
+
+    # Then the backoffs are spread around the minimum
+    assert all(48 <= backoff <= 72 for backoff in backoffs)
+    assert len(backoffs) > 1
+
+
+def test_single_probe_when_half_open() -> None:
+    # Given a breaker opened by a failure
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    breaker.record_failure()
+
+    # When callers arrive before and after the backoff has passed
+    assert not breaker.acquire()
+    clock.now = 61
+    assert breaker.state == HALF_OPEN
+    probes = [breaker.acquire() for _ in range(12)]
+
+    # Then only the first caller after the backoff probes the sources
+    assert probes == [True] + [False] * 11
+    assert breaker.rejected == 12
+
+
+def test_probe_result_closes_or_reopens() -> None:
+    # Given a half open breaker whose probe failed
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    breaker.record_failure()
+    clock.now = 61
+    assert breaker.acquire()
+    assert breaker.record_failure() == 120
+
+    # When the next probe succeeds
+    clock.now = 200
+    assert breaker.acquire()
+    breaker.record_success()
+
+    # Then the breaker is closed and lets every request through
+    assert breaker.state == CLOSED
+    assert breaker.retry_in() == 0
+    assert breaker.acquire() and breaker.acquire()
+
+
+def test_released_probe_can_be_retried() -> None:
+    # Given a half open breaker whose probe was cancelled
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    breaker.record_failure()
+    clock.now = 61
+    assert breaker.acquire()
+
+    # When the probe is released
+    breaker.release()
+
+    # Then another caller may probe
+    assert breaker.acquire()
@@ -0,0 +1,103 @@
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+
+from custom_components.lviv_poweroff.coordinator import periods_fingerprint
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from tests.hass_standin import add_coordinator
+
+TZ = ZoneInfo("Europe/Kyiv")
+
+
+def test_periods_fingerprint_is_structural() -> None:
+    # Given the same schedule parsed twice, once converted to UTC
+    periods = [
+        PowerOffPeriod(datetime(2026, 2, 9, 9, 0, tzinfo=TZ), datetime(2026, 2, 9, 12, 0, tzinfo=TZ)),
+        PowerOffPeriod(datetime(2026, 2, 9, 19, 30, tzinfo=TZ), datetime(2026, 2, 10, 1, 0, tzinfo=TZ)),
+    ]
+    reparsed = [
+        PowerOffPeriod(p.start_datetime.astimezone(timezone.utc), p.end_datetime.astimezone(timezone.utc))
+        for p in periods
+    ]
+    moved = [periods[0], PowerOffPeriod(periods[1].start_datetime, datetime(2026, 2, 10, 2, 0, tzinfo=TZ))]
+
+    # Then only an actual schedule change changes the fingerprint
+    assert periods_fingerprint(reparsed) == periods_fingerprint(periods)
+    assert periods_fingerprint(moved) != periods_fingerprint(periods)
+    assert periods_fingerprint([]) != periods_fingerprint(periods)
+
+
+@pytest.mark.asyncio
+async def test_events_are_shared_until_the_schedule_changes(hass, hub) -> None:
+    # Given a published schedule
+    coordinator = add_coordinator(hass, hub, "1.1")
+    periods = [
+        PowerOffPeriod(datetime(2026, 2, 10, 1, 0, tzinfo=TZ), datetime(2026, 2, 10, 4, 0, tzinfo=TZ)),
+        PowerOffPeriod(datetime(2026, 2, 10, 12, 0, tzinfo=TZ), datetime(2026, 2, 10, 15, 0, tzinfo=TZ)),
+    ]
+    hub.async_set_updated_data({"1.1": periods})
+    at = datetime(2026, 2, 10, 13, 0, tzinfo=TZ)
+    day = (datetime(2026, 2, 10, tzinfo=TZ), datetime(2026, 2, 11, tzinfo=TZ))
+    event = coordinator.get_event_at(at)
+    events = coordinator.get_events_between(*day)
+
+    # When the same schedule is published again
+    hub.async_set_updated_data({"1.1": list(periods)})
+
+    # Then every reader gets the same event instances
+    assert event is not None
+    assert coordinator.get_event_at(at) is event
+    assert events[1] is event
+    assert all(a is b for a, b in zip(coordinator.get_events_between(*day), events, strict=True))
+    assert coordinator.get_event_at(datetime(2026, 2, 10, 8, 0, tzinfo=TZ)) is None
+
+    # And a changed schedule builds new ones
+    hub.async_set_updated_data({"1.1": periods[1:]})
+    assert coordinator.get_event_at(at) is not event
+    assert coordinator.get_event_at(at) == event
+    assert len(coordinator.get_events_between(*day)) == 1
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_archived_history_is_clipped_and_kept_until_the_schedule_changes(hass, hub) -> None:
+    # Given a schedule of 10 and 11 February and an archived version of 9 and 10 February
+    coordinator = add_coordinator(hass, hub, "1.1")
+    current = PowerOffPeriod(datetime(2026, 2, 10, 1, 0, tzinfo=TZ), datetime(2026, 2, 10, 4, 0, tzinfo=TZ))
+    archived = [
+        PowerOffPeriod(datetime(2026, 2, 9, 10, 0, tzinfo=TZ), datetime(2026, 2, 9, 12, 0, tzinfo=TZ)),
+        PowerOffPeriod(datetime(2026, 2, 9, 22, 0, tzinfo=TZ), datetime(2026, 2, 10, 3, 0, tzinfo=TZ)),
+        PowerOffPeriod(datetime(2026, 2, 10, 8, 0, tzinfo=TZ), datetime(2026, 2, 10, 9, 0, tzinfo=TZ)),
+    ]
+    await hass.async_add_executor_job(
+        hub.archive.record,
+        {"1.1": archived},
+        datetime(2026, 2, 9, tzinfo=TZ),
+        datetime(2026, 2, 11, tzinfo=TZ),
+        datetime(2026, 2, 9, 8, 0, tzinfo=TZ),
+    )
+    hub.schedule_days = frozenset({date(2026, 2, 10), date(2026, 2, 11)})
+    hub.async_set_updated_data({"1.1": [current]})
+    days = (datetime(2026, 2, 9, tzinfo=TZ), datetime(2026, 2, 11, tzinfo=TZ))
+
+    # When the calendar reads the range twice
+    events = await coordinator.async_get_events_between(*days)
+    again = await coordinator.async_get_events_between(*days)
+
+    # Then the history ends where the current schedule starts, which supersedes the archive
+    assert [(event.start, event.end) for event in events] == [
+        (archived[0].start_datetime, archived[0].end_datetime),
+        (archived[1].start_datetime, datetime(2026, 2, 10, tzinfo=TZ)),
+        (current.start_datetime, current.end_datetime),
+    ]
+    # And the archive is read once per range, the same events are returned
+    assert all(a is b for a, b in zip(again, events, strict=True))
+
+    # And a schedule change drops the cached history
+    hub.async_set_updated_data({"1.1": []})
+    changed = await coordinator.async_get_events_between(*days)
+    assert changed == events[:2]
+    assert changed[0] is not events[0]
+    await coordinator.async_shutdown()
@@ -1,6 +1,8 @@
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
 
+import aiohttp
 from aioresponses import aioresponses
 import pytest
 
@@ -100,3 +102,47 @@ async def test_energyua_scrapper(group, test_page, expected_result) -> None:
     assert poweroffs is not None
     assert len(poweroffs) == len(expected_result)
     assert poweroffs == expected_result
+
+
+@pytest.mark.asyncio
+async def test_energyua_error_page_is_a_failure() -> None:
+    # Given Energy UA answering with an error page
+    with aioresponses() as mock:
+        mock.get("https://lviv.energy-ua.info/grupa/1.1", status=503, body="<html>Service Unavailable</html>")
+        # When scrapper is called for power-off periods
+        scrapper = EnergyUaScrapper("1.1", dt_util.get_default_time_zone())
+
+        # Then it fails instead of reporting a day without outages
+        with pytest.raises(aiohttp.ClientResponseError):
+            await scrapper.get_power_off_periods()
+        await scrapper.close()
+
+
+def scale_hours_block(active_hours: set[int]) -> str:
+    cells = "".join(
+        '<div class="scale_hours_el">'
+        + ('<span class="hour_active"></span>' if hour in active_hours else "")
+        + f'<i class="hour_info_from">{hour:02d}:00</i><i class="hour_info_to">{(hour + 1) % 24:02d}:00</i></div>'
+        for hour in range(24)
+    )
+    return f'<div class="scale_hours">{cells}</div>'
+
+
+def test_energyua_parses_only_today_and_tomorrow_blocks() -> None:
+    # Given a page with hour cells outside the schedule and a third day block
+    tz = ZoneInfo("Europe/Kyiv")
+    page = (
+        '<html><body><div class="scale_hours_el"><span class="hour_active"></span>'
+        '<i class="hour_info_from">05:00</i><i class="hour_info_to">06:00</i></div>'
+        f"{scale_hours_block({0, 1, 22, 23})}{scale_hours_block({0, 10})}{scale_hours_block({12})}</body></html>"
+    )
+
+    # When the page is parsed
+    periods = EnergyUaScrapper("1.1", tz).parse_page(page, date(2024, 2, 9))
+
+    # Then only the two schedule blocks count and cells are joined across midnight
+    assert periods == [
+        PowerOffPeriod(datetime(2024, 2, 9, 0, 0, tzinfo=tz), datetime(2024, 2, 9, 2, 0, tzinfo=tz)),
+        PowerOffPeriod(datetime(2024, 2, 9, 22, 0, tzinfo=tz), datetime(2024, 2, 10, 1, 0, tzinfo=tz)),
+        PowerOffPeriod(datetime(2024, 2, 10, 10, 0, tzinfo=tz), datetime(2024, 2, 10, 11, 0, tzinfo=tz)),
+    ]
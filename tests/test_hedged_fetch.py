@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.hedged_fetch import HedgedFetcher, ScheduleFetchError
+
+TZ = ZoneInfo("Europe/Kyiv")
+START = datetime(2026, 2, 9, 9, 0, tzinfo=TZ)
+LOE = {"1.1": [PowerOffPeriod(START, START + timedelta(hours=3))]}
+ENERGY_UA = {"1.1": [PowerOffPeriod(START, START + timedelta(hours=4))]}
+
+
+def source(result, delay: float = 0.0, error: Exception | None = None):
+    calls = []
+
+    async def fetch():
+        calls.append(delay)
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return result
+
+    return fetch, calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "loe_delay,loe_error,expected,energy_ua_started",
+    [
+        (0.0, None, LOE, False),
+        (0.5, None, ENERGY_UA, True),
+        (0.0, RuntimeError("LOE is down"), ENERGY_UA, True),
+    ],
+)
+async def test_hedged_fetch(loe_delay, loe_error, expected, energy_ua_started) -> None:
+    # Given the LOE API with the given latency and Energy UA as a backup
+    loe, _ = source(LOE, loe_delay, loe_error)
+    energy_ua, energy_ua_calls = source(ENERGY_UA, 0.05)
+    fetcher = HedgedFetcher(("loe", loe), ("energy_ua", energy_ua), hedge_delay=0.1)
+
+    # When the schedule is fetched
+    result = await fetcher.fetch()
+
+    # Then the first valid schedule wins and statistics are recorded
+    assert result == expected
+    assert bool(energy_ua_calls) == energy_ua_started
+    winner = "loe" if expected is LOE else "energy_ua"
+    assert fetcher.stats[winner].wins == 1
+    assert fetcher.stats[winner].last_latency_ms is not None
+    if loe_delay > 0.1:
+        assert fetcher.stats["loe"].cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_fetch_all_sources_failed() -> None:
+    # Given both sources returning nothing usable
+    loe, _ = source({})
+    energy_ua, _ = source(None, error=RuntimeError("Energy UA is down"))
+    fetcher = HedgedFetcher(("loe", loe), ("energy_ua", energy_ua), hedge_delay=0.1)
+
+    # Then the fetch fails naming the failure of each source
+    with pytest.raises(ScheduleFetchError, match="loe: no usable schedule returned; energy_ua: Energy UA is down"):
+        await fetcher.fetch()
+    assert fetcher.stats["loe"].failures == 1
+    assert fetcher.stats["energy_ua"].failures == 1
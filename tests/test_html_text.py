@@ -0,0 +1,35 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from custom_components.lviv_poweroff.html_text import TEXT_EXTRACTORS, extract_text_bs4, get_text_extractor
+
+SNIPPETS = [
+    "",
+    "<p>Група&nbsp;1.1. Електроенергії немає з 00:00 до 02:30.</p>",
+    "<div><!-- коментар --><b>Графік</b> на <i>09.02.2026</i><br>Група 2.1.</div>",
+    "<p>A &amp; B &lt;c&gt;</p><script>var x = '<p>';</script><style>p {}</style>tail",
+    "text <unclosed> and <p>para",
+]
+
+
+def loe_raw_html() -> list[str]:
+    data = json.loads((Path(__file__).parent / "loe_menus_page.json").read_text(encoding="utf-8"))
+    return [item["rawHtml"] for item in data["hydra:member"][0]["menuItems"]]
+
+
+@pytest.mark.parametrize("name", TEXT_EXTRACTORS)
+@pytest.mark.parametrize("html", SNIPPETS + loe_raw_html())
+def test_extractors_match_beautifulsoup(name, html) -> None:
+    # Given any installed text extraction backend
+    extractor = get_text_extractor(name)
+
+    # Then it extracts the same text as BeautifulSoup
+    assert extractor(html) == extract_text_bs4(html)
+
+
+def test_unknown_extractor_falls_back_to_beautifulsoup() -> None:
+    # Given a backend name that is not known
+    # Then BeautifulSoup is used instead
+    assert get_text_extractor("html5lib") is extract_text_bs4
@@ -0,0 +1,49 @@
+import aiohttp
+from aioresponses import aioresponses
+import pytest
+
+from custom_components.lviv_poweroff.http_client import USER_AGENT, HttpScrapper
+
+URL = "https://example.invalid/page"
+
+
+@pytest.mark.asyncio
+async def test_owned_session_is_closed_and_shared_one_is_kept() -> None:
+    # Given a scrapper owning its session and one given a shared session
+    async with aiohttp.ClientSession() as shared:
+        owning, sharing = HttpScrapper(), HttpScrapper(shared)
+        owned = owning._get_session()
+
+        # When both are closed
+        await owning.close()
+        await sharing.close()
+
+        # Then only the owned session is closed
+        assert owned.closed
+        assert not shared.closed
+        assert sharing._get_session() is shared
+
+
+@pytest.mark.asyncio
+async def test_requests_send_the_user_agent_and_reject_error_pages() -> None:
+    # Given a server answering with a page, an error page and an empty success
+    scrapper = HttpScrapper()
+    with aioresponses() as mock:
+        mock.get(URL, body="ok")
+        mock.get(URL, status=503)
+        mock.get(URL, status=204)
+
+        # Then only the page passes the status check
+        async with scrapper._get(URL, {"If-None-Match": '"v1"'}) as response:
+            scrapper._check_status(response)
+        with pytest.raises(aiohttp.ClientResponseError):
+            async with scrapper._get(URL) as response:
+                scrapper._check_status(response)
+        with pytest.raises(ValueError, match="status 204"):
+            async with scrapper._get(URL) as response:
+                scrapper._check_status(response)
+        headers = list(mock.requests.values())[0][0].kwargs["headers"]
+    await scrapper.close()
+
+    # And the extra headers are sent along with the User-Agent
+    assert headers == {"User-Agent": USER_AGENT, "If-None-Match": '"v1"'}
@@ -0,0 +1,175 @@
+import asyncio
+from datetime import datetime, timedelta
+import time
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from custom_components.lviv_poweroff.const import PowerOffGroup
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.hedged_fetch import ScheduleFetchError
+from custom_components.lviv_poweroff.hub import deserialize_periods, hourly_periods, serialize_periods
+from tests.hass_standin import add_coordinator
+from tests.standin_server import StandInConfig
+
+TZ = ZoneInfo("Europe/Kyiv")
+
+
+def test_persisted_schedule_roundtrip() -> None:
+    # Given parsed periods of several groups, including a DST change day
+    periods = {
+        "1.1": [
+            PowerOffPeriod(datetime(2026, 3, 29, 2, 0, tzinfo=TZ), datetime(2026, 3, 29, 5, 30, tzinfo=TZ)),
+            PowerOffPeriod(datetime(2026, 3, 29, 19, 30, tzinfo=TZ), datetime(2026, 3, 30, 0, 0, tzinfo=TZ)),
+        ],
+        "3.2": [],
+    }
+
+    # When they are serialized and restored
+    restored = deserialize_periods(serialize_periods(periods), TZ)
+
+    # Then the same moments come back in the configured zone
+    assert restored == periods
+    assert all(p.start_datetime.tzinfo is TZ for p in restored["1.1"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("standin_server", [StandInConfig(seed=3)], indirect=True)
+async def test_hub_keeps_the_loe_schedule_while_energy_ua_agrees(hass, hub, standin_server) -> None:
+    # Given the LOE schedule of the subscribed groups, with half hour outages
+    coordinators = [add_coordinator(hass, hub, group.value) for group in PowerOffGroup]
+    hub.fetcher.hedge_delay = 0.05
+    await hub.async_refresh()
+    schedule, days = hub.data, hub.schedule_days
+
+    # When LOE is slow every other poll and Energy UA wins with the same schedule in whole hours
+    for loe_latency in (0.3, 0.0, 0.3, 0.0):
+        standin_server.config.loe_latency = loe_latency
+        await hub.async_refresh()
+
+        # Then the LOE schedule is kept and nothing is saved or pushed to the entities
+        assert hub.data == schedule
+        assert hub.schedule_days == days
+    await hass.async_block_till_done()
+
+    assert hub.fetcher.stats["energy_ua"].wins == 2
+    assert hub._store.saves == 1
+    for coordinator in coordinators:
+        assert coordinator.update_stats.notified == 1
+        await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("standin_server", [StandInConfig(seed=3)], indirect=True)
+async def test_hub_merges_a_change_reported_by_energy_ua(hass, hub, standin_server) -> None:
+    # Given the LOE schedule of two groups, one of them subscribed
+    coordinator = add_coordinator(hass, hub, "1.1")
+    hub.fetcher.hedge_delay = 0.05
+    await hub.async_refresh()
+    schedule = hub.data
+
+    # When the schedule changes while LOE is slow
+    standin_server.config.seed = 4
+    standin_server.config.loe_latency = 0.3
+    await hub.async_refresh()
+
+    # Then the subscribed group takes the Energy UA schedule and the other groups keep the LOE one
+    expected = hourly_periods(standin_server.expected_periods("1.1"), *days_window(hub))
+    assert hub.data["1.1"] == expected
+    assert hub.data["1.2"] == schedule["1.2"]
+    assert hub.fetcher.winner == "energy_ua"
+    assert coordinator.periods == expected
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("standin_server", [StandInConfig(seed=3, loe_latency=0.3)], indirect=True)
+async def test_hub_drops_past_days_while_energy_ua_wins(hass, hub, standin_server) -> None:
+    # Given a schedule kept from Energy UA since a few days ago
+    coordinator = add_coordinator(hass, hub, "1.1")
+    hub.fetcher.hedge_delay = 0.05
+    await hub.async_refresh()
+    today = hub.api.time_base.today()
+    hub.schedule_days |= {today - timedelta(days=day) for day in range(1, 4)}
+
+    # When Energy UA wins again
+    await hub.async_refresh()
+
+    # Then only today and the days after it are kept
+    assert hub.fetcher.winner == "energy_ua"
+    assert min(hub.schedule_days) == today
+    assert hub.schedule_start(dt_util.now()) == hub.api.time_base.midnight(today)
+    await coordinator.async_shutdown()
+
+
+def days_window(hub) -> tuple[datetime, datetime]:
+    time_base = hub.api.time_base
+    return time_base.midnight(min(hub.schedule_days)), time_base.midnight(max(hub.schedule_days) + timedelta(days=1))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("standin_server", [StandInConfig(seed=3)], indirect=True)
+async def test_hub_keeps_the_last_good_schedule_when_the_sources_fail(hass, hub, standin_server) -> None:
+    # Given a schedule fetched from LOE
+    coordinator = add_coordinator(hass, hub, "1.1")
+    await coordinator.async_refresh()
+    schedule, periods = hub.data, coordinator.periods
+
+    # When both LOE and Energy UA start failing
+    standin_server.config.error_rate = 1.0
+    await hub.async_refresh()
+
+    # Then the hub reports the cause but keeps the schedule, and the entities stay available
+    assert not hub.last_update_success
+    assert isinstance(hub.last_exception, UpdateFailed)
+    assert isinstance(hub.last_exception.__cause__, ScheduleFetchError)
+    assert "503" in str(hub.last_exception.__cause__.errors["loe"])
+    assert hub.data == schedule
+    assert coordinator.last_update_success
+    assert coordinator.periods == periods
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("standin_server", [StandInConfig(error_rate=1.0)], indirect=True)
+async def test_entries_set_up_together_share_one_failed_probe(hass, hub, standin_server) -> None:
+    # Given every group configured while both sources are failing
+    coordinators = [add_coordinator(hass, hub, group.value) for group in PowerOffGroup]
+
+    # When their first refreshes run at once
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+    # Then LOE is probed once and every entry fails with the cause
+    assert standin_server.requests["loe"] == 1
+    assert hub.fetcher.stats["loe"].requests == 1
+    assert hub.breaker.failures == 1
+    for coordinator in coordinators:
+        assert not coordinator.last_update_success
+        assert "retrying in" in str(coordinator.last_exception)
+        await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_waits_for_the_archive_record(hass, hub, standin_server, monkeypatch) -> None:
+    # Given a new schedule still being recorded into the archive
+    record = hub.archive.record
+
+    def slow_record(*args):
+        time.sleep(0.2)
+        return record(*args)
+
+    monkeypatch.setattr(hub.archive, "record", slow_record)
+    coordinator = add_coordinator(hass, hub, "1.1")
+    await hub.async_refresh()
+    await coordinator.async_shutdown()
+
+    # When the hub is shut down meanwhile
+    await hub.async_shutdown()
+
+    # Then the version is recorded before the archive is closed, and it stays closed
+    assert hub.archive._conn is None
+    assert hub.archive.periods_between("1.1", *days_window(hub), TZ) == hub.data["1.1"]
+    hub.archive.close()
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+from benchmarks.bench_import_time import IMPORT_BUDGET_MS, measure_best, measure_import
+
+# Wall clock budgets depend on the machine, so they are only checked on request
+BUDGET_ENV = "LVIV_POWEROFF_IMPORT_BUDGET"
+
+
+def test_integration_import_defers_dependencies() -> None:
+    # Given a fresh interpreter with the modules Home Assistant preloads
+
+    # When the integration and its platforms are imported
+    report = measure_import()
+
+    # Then the parsing and storage dependencies are not imported yet
+    assert report.deferred_loaded == []
+
+
+@pytest.mark.skipif(not os.environ.get(BUDGET_ENV), reason=f"set {BUDGET_ENV}=1 to check the import time budget")
+def test_integration_import_stays_within_budget() -> None:
+    # Given a fresh interpreter with the modules Home Assistant preloads
+
+    # When the integration and its platforms are imported
+    report = measure_best(runs=3)
+
+    # Then the import cost is within the recorded budget
+    assert report.total_ms <= IMPORT_BUDGET_MS, report.modules_ms
@@ -0,0 +1,69 @@
+import pytest
+
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from custom_components.lviv_poweroff import (
+    PLATFORMS,
+    async_setup_entry,
+    async_unload_entry,
+)
+from custom_components.lviv_poweroff.const import DOMAIN, SERVICE_PROFILE_REFRESH
+from tests.hass_standin import StandInConfigEntry, patch_hub
+from tests.standin_server import StandInConfig
+
+
+@pytest.mark.asyncio
+async def test_entries_share_the_hub_and_the_services(hass, standin_server) -> None:
+    # Given two groups set up one after the other
+    entries = [StandInConfigEntry(group) for group in ("1.1", "2.1")]
+    with patch_hub():
+        for entry in entries:
+            hass.entries.append(entry)
+            assert await async_setup_entry(hass, entry)  # type: ignore[arg-type]
+
+        # Then the first one started the hub and registered the services for both
+        hub = hass.data[DOMAIN]
+        assert all(entry.runtime_data.hub is hub for entry in entries)
+        assert hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH)
+        assert hass.config_entries.platforms == {entry.entry_id: PLATFORMS for entry in entries}
+        assert standin_server.requests["loe"] == 1
+
+        # When the first one is unloaded
+        assert await async_unload_entry(hass, entries[0])  # type: ignore[arg-type]
+
+        # Then the hub and the services stay for the other one
+        assert hass.data[DOMAIN] is hub
+        assert hub.has_subscribers
+        assert hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH)
+
+        # When the last one is unloaded
+        assert await async_unload_entry(hass, entries[1])  # type: ignore[arg-type]
+
+        # Then the hub is stopped and the services are removed
+        assert DOMAIN not in hass.data
+        assert not hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH)
+        await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("standin_server", [StandInConfig(error_rate=1.0)], indirect=True)
+async def test_failed_first_setup_releases_the_hub_and_the_services(hass, standin_server) -> None:
+    # Given the first group set up while both sources are failing
+    entry = StandInConfigEntry("1.1")
+    hass.entries.append(entry)
+    with patch_hub():
+        # When its first refresh fails
+        with pytest.raises(ConfigEntryNotReady):
+            await async_setup_entry(hass, entry)  # type: ignore[arg-type]
+
+        # Then no hub or service is left behind without an entry
+        assert DOMAIN not in hass.data
+        assert not hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH)
+        await hass.async_block_till_done()
+
+        # And the next attempt starts over once the sources are back
+        standin_server.config.error_rate = 0.0
+        assert await async_setup_entry(hass, entry)  # type: ignore[arg-type]
+        assert hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH)
+        assert await async_unload_entry(hass, entry)  # type: ignore[arg-type]
+        await hass.async_block_till_done()
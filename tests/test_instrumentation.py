@@ -0,0 +1,71 @@
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from aioresponses import aioresponses
+import pytest
+
+from custom_components.lviv_poweroff.instrumentation import Instrumentation, RollingHistogram
+from custom_components.lviv_poweroff.loe_scrapper import URL, LoeScrapper
+
+TZ = ZoneInfo("Europe/Kyiv")
+BODY = (Path(__file__).parent / "loe_menus_page.json").read_text(encoding="utf-8")
+
+
+def test_rolling_histogram_keeps_recent_samples() -> None:
+    # Given a histogram fed more samples than it keeps
+    histogram = RollingHistogram(size=100)
+    for value in range(1, 201):
+        histogram.add(float(value))
+
+    # Then its summary describes the last samples only
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["min"] == 101
+    assert summary["last"] == summary["max"] == 200
+    assert 150 <= summary["p50"] <= 151
+    assert summary["buckets"] == {"<=200": 100}
+
+
+def test_disabled_instrumentation_records_nothing() -> None:
+    # Given disabled instrumentation
+    instrumentation = Instrumentation()
+
+    # When phases are timed and counted
+    with instrumentation.span("phase"):
+        pass
+    instrumentation.count("bytes", 10)
+
+    # Then nothing is collected until a user enables it
+    assert instrumentation.as_dict() == {"enabled": False, "phases_ms": {}, "counters": {}}
+    release = instrumentation.enable()
+    with instrumentation.span("phase"):
+        pass
+    release()
+    release()
+    with instrumentation.span("phase"):
+        pass
+    assert not instrumentation.enabled
+    assert instrumentation.histograms["phase"].summary()["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_loe_scrapper_records_refresh_phases() -> None:
+    # Given a scrapper with enabled instrumentation
+    instrumentation = Instrumentation(enabled=True)
+    scrapper = LoeScrapper(None, TZ, instrumentation=instrumentation)
+
+    # When it fetches the schedule
+    with aioresponses() as mock:
+        mock.get(URL, body=BODY, content_type="application/ld+json")
+        assert await scrapper.get_all_power_off_periods()
+    await scrapper.close()
+
+    # Then every phase is timed and the downloaded bytes are counted
+    assert set(instrumentation.histograms) == {
+        "loe.network",
+        "loe.parse",
+        "loe.extract_text",
+        "loe.regex",
+        "loe.merge",
+    }
+    assert instrumentation.counters["loe.bytes"] == len(BODY.encode())
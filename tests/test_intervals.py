@@ -0,0 +1,85 @@
+import copy
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from hypothesis import given, settings, strategies as st
+
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.intervals import normalize_periods
+
+TZ = ZoneInfo("Europe/Kyiv")
+BASE = datetime(2026, 2, 9, tzinfo=TZ)
+DOMAIN_MINUTES = 4 * 24 * 60
+
+minute_ranges = st.lists(
+    st.tuples(st.integers(0, DOMAIN_MINUTES), st.integers(-30, 600)).map(lambda r: (r[0], r[0] + r[1])),
+    max_size=2000,
+)
+
+
+def to_periods(ranges: list[tuple[int, int]]) -> list[PowerOffPeriod]:
+    return [PowerOffPeriod(BASE + timedelta(minutes=start), BASE + timedelta(minutes=end)) for start, end in ranges]
+
+
+def covered_minutes(ranges, lo: int = 0, hi: int = DOMAIN_MINUTES + 600) -> list[bool]:
+    covered = [False] * (DOMAIN_MINUTES + 600)
+    for start, end in ranges:
+        for minute in range(max(start, lo), min(end, hi)):
+            covered[minute] = True
+    return covered
+
+
+def to_minutes(periods: list[PowerOffPeriod]) -> list[tuple[int, int]]:
+    return [
+        (int((p.start_datetime - BASE).total_seconds() // 60), int((p.end_datetime - BASE).total_seconds() // 60))
+        for p in periods
+    ]
+
+
+@settings(max_examples=60, deadline=None)
+@given(minute_ranges)
+def test_normalized_periods_are_disjoint_and_cover_the_input(ranges) -> None:
+    # Given periods in any order, overlapping, adjacent or empty
+    periods = to_periods(ranges)
+    original = copy.deepcopy(periods)
+
+    # When they are normalized
+    normalized = normalize_periods(periods)
+
+    # Then the result is sorted, separated by gaps and covers the same minutes
+    result = to_minutes(normalized)
+    assert all(start < end for start, end in result)
+    assert all(prev_end < start for (_, prev_end), (start, _) in zip(result, result[1:]))
+    assert covered_minutes(result) == covered_minutes(ranges)
+
+    # And the input is left untouched and normalizing again changes nothing
+    assert periods == original
+    assert not {id(p) for p in normalized} & {id(p) for p in periods}
+    assert normalize_periods(normalized) == normalized
+
+
+@settings(max_examples=60, deadline=None)
+@given(minute_ranges, st.integers(0, DOMAIN_MINUTES), st.integers(0, DOMAIN_MINUTES))
+def test_normalized_periods_are_clipped_to_the_window(ranges, lo, length) -> None:
+    # Given a window over the periods
+    hi = lo + length
+    window = (BASE + timedelta(minutes=lo), BASE + timedelta(minutes=hi))
+
+    # When they are normalized within it
+    result = to_minutes(normalize_periods(to_periods(ranges), *window))
+
+    # Then only the covered minutes inside the window are left
+    assert all(lo <= start < end <= hi for start, end in result)
+    assert covered_minutes(result) == covered_minutes(ranges, lo, hi)
+
+
+def test_outage_split_at_midnight_is_joined() -> None:
+    # Given an outage published as 20:00-24:00 today and 00:00-02:00 tomorrow, out of order
+    tomorrow = datetime(2026, 2, 10, tzinfo=TZ)
+    periods = [
+        PowerOffPeriod(tomorrow, tomorrow + timedelta(hours=2)),
+        PowerOffPeriod(tomorrow - timedelta(hours=4), tomorrow),
+    ]
+
+    # Then it is a single period
+    assert normalize_periods(periods) == [PowerOffPeriod(tomorrow - timedelta(hours=4), tomorrow + timedelta(hours=2))]
@@ -0,0 +1,248 @@
+from pathlib import Path
+from datetime import date, datetime
+import json
+from unittest.mock import patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aioresponses import aioresponses
+import pytest
+
+from custom_components.lviv_poweroff import loe_scrapper
+from custom_components.lviv_poweroff.const import PowerOffGroup
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.instrumentation import Instrumentation
+from custom_components.lviv_poweroff.loe_scrapper import URL, LoeScrapper
+
+from homeassistant.util import dt as dt_util
+
+TZ = dt_util.get_time_zone("Europe/Kyiv")
+
+
+def load_loe_page(test_page: str) -> str:
+    test_file = Path(__file__).parent / test_page
+
+    with open(test_file, encoding="utf-8") as file:
+        return file.read()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "group,expected_result",
+    [
+        (
+            "1.1",
+            [
+                PowerOffPeriod(datetime(2026, 2, 9, 0, 0, tzinfo=TZ), datetime(2026, 2, 9, 2, 30, tzinfo=TZ)),
+                PowerOffPeriod(datetime(2026, 2, 9, 9, 0, tzinfo=TZ), datetime(2026, 2, 9, 12, 0, tzinfo=TZ)),
+                PowerOffPeriod(datetime(2026, 2, 9, 19, 30, tzinfo=TZ), datetime(2026, 2, 10, 1, 0, tzinfo=TZ)),
+                PowerOffPeriod(datetime(2026, 2, 10, 13, 0, tzinfo=TZ), datetime(2026, 2, 10, 16, 30, tzinfo=TZ)),
+            ],
+        ),
+        (
+            "1.2",
+            [
+                PowerOffPeriod(datetime(2026, 2, 9, 2, 30, tzinfo=TZ), datetime(2026, 2, 9, 9, 0, tzinfo=TZ)),
+                PowerOffPeriod(datetime(2026, 2, 10, 16, 30, tzinfo=TZ), datetime(2026, 2, 10, 20, 0, tzinfo=TZ)),
+            ],
+        ),
+        (
+            "3.2",
+            [
+                PowerOffPeriod(datetime(2026, 2, 10, 7, 0, tzinfo=TZ), datetime(2026, 2, 10, 10, 30, tzinfo=TZ)),
+            ],
+        ),
+    ],
+)
+async def test_loe_scrapper(group, expected_result) -> None:
+    # Given a response from the LOE API
+    with aioresponses() as mock:
+        mock.get(URL, body=load_loe_page("loe_menus_page.json"), content_type="application/ld+json")
+        # When scrapper is called for power-off periods
+        scrapper = LoeScrapper(group, TZ)
+        poweroffs = await scrapper.get_power_off_periods()
+        await scrapper.close()
+
+    # Then the power-off periods are extracted correctly
+    assert poweroffs == expected_result
+
+
+@pytest.mark.asyncio
+async def test_loe_scrapper_without_group_rejects_group_query() -> None:
+    # Given a scrapper shared by all groups
+    scrapper = LoeScrapper(None, TZ)
+
+    # Then it cannot answer for a single group
+    with pytest.raises(ValueError, match="No group"):
+        await scrapper.get_power_off_periods()
+
+
+@pytest.mark.asyncio
+async def test_loe_scrapper_all_groups_single_request() -> None:
+    # Given a response from the LOE API
+    with aioresponses() as mock:
+        mock.get(URL, body=load_loe_page("loe_menus_page.json"), content_type="application/ld+json")
+        # When scrapper is called for all groups at once
+        scrapper = LoeScrapper(None, TZ)
+        poweroffs = await scrapper.get_all_power_off_periods()
+        requests_made = sum(len(calls) for calls in mock.requests.values())
+        await scrapper.close()
+
+    # Then every group is parsed out of a single upstream request
+    assert requests_made == 1
+    assert set(poweroffs) == set(PowerOffGroup)
+    assert poweroffs[PowerOffGroup.FourOne] == [
+        PowerOffPeriod(datetime(2026, 2, 9, 9, 30, tzinfo=TZ), datetime(2026, 2, 9, 13, 0, tzinfo=TZ)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_loe_scrapper_reuses_connection(monkeypatch) -> None:
+    # Given a local LOE API that records the client connection of every request
+    peers = []
+
+    async def menus(request: web.Request) -> web.Response:
+        assert request.transport is not None
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.Response(text=load_loe_page("loe_menus_page.json"), content_type="application/ld+json")
+
+    app = web.Application()
+    app.router.add_get("/api/menus", menus)
+    async with TestServer(app) as server:
+        monkeypatch.setattr(loe_scrapper, "URL", str(server.make_url("/api/menus")))
+
+        # When the scrapper polls several times
+        scrapper = LoeScrapper("1.1", TZ)
+        for _ in range(3):
+            assert await scrapper.get_power_off_periods()
+        await scrapper.close()
+
+    # Then all polls are served over one pooled connection
+    assert len(peers) == 3
+    assert len(set(peers)) == 1
+
+
+@pytest.mark.asyncio
+async def test_loe_scrapper_reads_only_the_first_menu(monkeypatch) -> None:
+    # Given a local LOE API whose later menus are far larger than the size limit
+    page = load_loe_page("loe_menus_page.json")
+    data = json.loads(page)
+    data["hydra:member"].append({"menuItems": [{"name": "Archive", "rawHtml": "x" * 4 * 1024 * 1024}]})
+
+    async def menus(request: web.Request) -> web.Response:
+        return web.Response(text=json.dumps(data, ensure_ascii=False), content_type="application/ld+json")
+
+    app = web.Application()
+    app.router.add_get("/api/menus", menus)
+    async with TestServer(app) as server:
+        monkeypatch.setattr(loe_scrapper, "URL", str(server.make_url("/api/menus")))
+
+        # When the scrapper polls it with a limit just above the first menu
+        scrapper = LoeScrapper(
+            "1.1", TZ, max_response_size=len(page.encode()), instrumentation=Instrumentation(enabled=True)
+        )
+        periods = await scrapper.get_all_power_off_periods()
+        await scrapper.close()
+
+    # Then the schedule is parsed and the rest of the body is not read
+    assert periods["1.1"]
+    assert 0 < scrapper.instrumentation.counters["loe.bytes"] < 1024 * 1024
+
+
+@pytest.mark.asyncio
+async def test_loe_scrapper_skips_unchanged_schedule() -> None:
+    # Given an LOE API that supports ETags only on the first response
+    body = load_loe_page("loe_menus_page.json")
+    with aioresponses() as mock:
+        mock.get(URL, body=body, headers={"ETag": '"v1"'}, content_type="application/ld+json")
+        mock.get(URL, status=304)
+        mock.get(URL, body=body, content_type="application/ld+json")
+        scrapper = LoeScrapper("1.1", TZ)
+
+        # When the schedule is polled three times
+        first = await scrapper.get_power_off_periods()
+        second = await scrapper.get_power_off_periods()
+        third = await scrapper.get_power_off_periods()
+        conditional_request = list(mock.requests.values())[0][1]
+        await scrapper.close()
+
+    # Then the validator is sent back and only the first response is parsed
+    assert conditional_request.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert first == second == third
+    assert scrapper.cache_stats.parsed == 1
+    assert scrapper.cache_stats.not_modified == 1
+    assert scrapper.cache_stats.unchanged_body == 1
+
+
+def menus_body(*items: tuple[str, str, str]) -> str:
+    menu_items = [
+        {"name": name, "rawHtml": f"<div><p><b>Графік погодинних відключень на {day}</b></p>{html}</div>"}
+        for name, day, html in items
+    ]
+    return json.dumps({"hydra:member": [{"menuItems": menu_items}]}, ensure_ascii=False)
+
+
+@pytest.mark.asyncio
+async def test_loe_scrapper_parses_only_changed_items() -> None:
+    # Given an LOE API publishing tomorrow's schedule on the second poll and rolling the day on the third
+    first_day = ("09.02.2026", "<p>Група 1.1. Електроенергії немає з 09:00 до 12:00.</p>")
+    second_day = ("10.02.2026", "<p>Група 1.1. Електроенергії немає з 13:00 до 16:30.</p>")
+    third_day = ("11.02.2026", "<p>Група 1.1. Електроенергії немає з 00:00 до 02:00.</p>")
+    fourth_day = ("12.02.2026", "<p>Група 1.1. Електроенергії немає з 22:00 до 24:00.</p>")
+    with aioresponses() as mock:
+        for body in (
+            menus_body(("Today", *first_day)),
+            menus_body(("Today", *first_day), ("Tomorrow", *second_day)),
+            menus_body(("Today", *second_day), ("Tomorrow", *third_day), ("In two days", *fourth_day)),
+        ):
+            mock.get(URL, body=body, content_type="application/ld+json")
+        scrapper = LoeScrapper("1.1", TZ)
+
+        # When the schedule is polled three times on 10 February
+        with patch.object(scrapper.time_base, "today", return_value=date(2026, 2, 10)):
+            await scrapper.get_power_off_periods()
+            await scrapper.get_power_off_periods()
+            item_stats = (scrapper.cache_stats.items_parsed, scrapper.cache_stats.items_reused)
+            periods = await scrapper.get_power_off_periods()
+        await scrapper.close()
+
+    # Then only the new items are parsed, even when an item was renamed, and the day that rolled off is evicted
+    assert item_stats == (2, 1)
+    assert (scrapper.cache_stats.items_parsed, scrapper.cache_stats.items_reused) == (4, 2)
+    assert len(scrapper._item_cache) == 3
+    # And any number of dated items is accepted, whatever their names
+    assert scrapper.schedule_days == {date(2026, 2, 10), date(2026, 2, 11), date(2026, 2, 12)}
+    assert periods == [
+        PowerOffPeriod(datetime(2026, 2, 10, 13, tzinfo=TZ), datetime(2026, 2, 10, 16, 30, tzinfo=TZ)),
+        PowerOffPeriod(datetime(2026, 2, 11, 0, tzinfo=TZ), datetime(2026, 2, 11, 2, tzinfo=TZ)),
+        PowerOffPeriod(datetime(2026, 2, 12, 22, tzinfo=TZ), datetime(2026, 2, 13, 0, tzinfo=TZ)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_loe_scrapper_ignores_past_dated_items() -> None:
+    # Given a menu still listing yesterday's schedule under another name, republished with a new "as of" time
+    yesterday = ("09.02.2026", "<p>Група 1.1. Електроенергії немає з 09:00 до 12:00.</p>")
+    today = ("10.02.2026", "<p>Група 1.1. Електроенергії немає з 13:00 до 16:30.</p>")
+    tomorrow = ("11.02.2026", "<p>Група 1.1. Електроенергії немає з 00:00 до 02:00.</p>")
+    with aioresponses() as mock:
+        for html in ("", "<p>Оновлено о 19:40.</p>"):
+            body = menus_body(("Archive", *yesterday), ("Today", *today), ("Tomorrow", tomorrow[0], tomorrow[1] + html))
+            mock.get(URL, body=body, content_type="application/ld+json")
+        scrapper = LoeScrapper("1.1", TZ)
+
+        # When the schedule is polled twice on 10 February
+        with patch.object(scrapper.time_base, "today", return_value=date(2026, 2, 10)):
+            await scrapper.get_power_off_periods()
+            periods = await scrapper.get_power_off_periods()
+        await scrapper.close()
+
+    # Then the past day is left out of the schedule and its days
+    assert scrapper.schedule_days == {date(2026, 2, 10), date(2026, 2, 11)}
+    assert periods == [
+        PowerOffPeriod(datetime(2026, 2, 10, 13, tzinfo=TZ), datetime(2026, 2, 10, 16, 30, tzinfo=TZ)),
+        PowerOffPeriod(datetime(2026, 2, 11, 0, tzinfo=TZ), datetime(2026, 2, 11, 2, tzinfo=TZ)),
+    ]
+    # And while it is listed it is not parsed again
+    assert (scrapper.cache_stats.items_parsed, scrapper.cache_stats.items_reused) == (4, 2)
+    assert len(scrapper._item_cache) == 4
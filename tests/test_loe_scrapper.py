@@ -7,17 +7,20 @@ from unittest.mock import MagicMock
 # Add the project root to the python path BEFORE importing custom_components
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-# Mock homeassistant module because it is imported by __init__.py
-sys.modules["homeassistant"] = MagicMock()
-sys.modules["homeassistant.config_entries"] = MagicMock()
-sys.modules["homeassistant.core"] = MagicMock()
-sys.modules["homeassistant.exceptions"] = MagicMock()
-sys.modules["homeassistant.helpers"] = MagicMock()
-sys.modules["homeassistant.helpers.update_coordinator"] = MagicMock()
-sys.modules["homeassistant.util"] = MagicMock()
-sys.modules["homeassistant.const"] = MagicMock()
-sys.modules["homeassistant.components"] = MagicMock()
-sys.modules["homeassistant.components.calendar"] = MagicMock()
+# Mock homeassistant module because it is imported by __init__.py, unless it is installed
+try:
+    import homeassistant  # noqa: F401
+except ImportError:
+    sys.modules["homeassistant"] = MagicMock()
+    sys.modules["homeassistant.config_entries"] = MagicMock()
+    sys.modules["homeassistant.core"] = MagicMock()
+    sys.modules["homeassistant.exceptions"] = MagicMock()
+    sys.modules["homeassistant.helpers"] = MagicMock()
+    sys.modules["homeassistant.helpers.update_coordinator"] = MagicMock()
+    sys.modules["homeassistant.util"] = MagicMock()
+    sys.modules["homeassistant.const"] = MagicMock()
+    sys.modules["homeassistant.components"] = MagicMock()
+    sys.modules["homeassistant.components.calendar"] = MagicMock()
 
 from custom_components.lviv_poweroff.loe_scrapper import LoeScrapper  # noqa: E402
 from custom_components.lviv_poweroff.const import PowerOffGroup  # noqa: E402
@@ -0,0 +1,106 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from custom_components.lviv_poweroff.loe_scrapper import DATED_ITEM_PATTERN
+from custom_components.lviv_poweroff.menu_stream import MenuItemsScanner, ResponseTooLargeError, scan_menu_items
+
+NAMES = frozenset({"Today", "Tomorrow"})
+BODY = (Path(__file__).parent / "loe_menus_page.json").read_bytes()
+
+
+def expected_items(data) -> list:
+    menu = data["hydra:member"][0] if isinstance(data, dict) else data[0]
+    return [item for item in menu["menuItems"] if item["name"] in NAMES]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 4096, len(BODY)])
+def test_scanner_matches_full_decode_for_any_chunking(chunk_size) -> None:
+    # Given the LOE response split into chunks of a given size
+    scanner = MenuItemsScanner(NAMES)
+
+    # When it is fed chunk by chunk
+    for i in range(0, len(BODY), chunk_size):
+        scanner.feed(BODY[i : i + chunk_size])
+
+    # Then the kept items equal the ones of the fully decoded document
+    assert scanner.done
+    assert scanner.items == expected_items(json.loads(BODY))
+
+
+def test_scanner_stops_after_first_menu_and_supports_plain_list() -> None:
+    # Given a plain list of menus where later members are huge and malformed
+    first = json.loads(BODY)["hydra:member"][0]
+    body = json.dumps([first]).encode()[:-1] + b', {"menuItems": [{"name": "Today", "rawHtml": "' + b"x" * 10000
+
+    # When it is scanned
+    scanner = MenuItemsScanner(NAMES)
+    scanner.feed(body)
+
+    # Then only the first menu is read and nothing after it is buffered
+    assert scanner.done
+    assert scanner.items == expected_items([first])
+    assert len(scanner._buffer) < 100
+
+
+@pytest.mark.asyncio
+async def test_scan_menu_items_enforces_max_size_on_the_first_menu() -> None:
+    # Given the first menu followed by a later one far larger than the limit
+    data = json.loads(BODY)
+    data["hydra:member"].append({"menuItems": [{"name": "Archive", "rawHtml": "x" * 100_000}]})
+    body = json.dumps(data, ensure_ascii=False).encode()
+    read = []
+
+    async def chunks():
+        for i in range(0, len(body), 1024):
+            read.append(i)
+            yield body[i : i + 1024]
+
+    # Then a limit below the first menu rejects the body
+    with pytest.raises(ResponseTooLargeError):
+        await scan_menu_items(chunks(), NAMES, 1024)
+
+    # And a limit above it accepts the body and stops reading once the menu is complete
+    read.clear()
+    scanner, size = await scan_menu_items(chunks(), NAMES, len(BODY))
+    assert scanner.done
+    assert len(scanner.items) == 2
+    assert size == len(read) * 1024 <= len(BODY) + 1024
+
+
+def test_scanner_handles_escapes_split_anywhere() -> None:
+    # Given items with escaped quotes and backslashes in their strings
+    items = [
+        {"name": "Archive", "rawHtml": 'a "quoted" \\ ] } value\\'},
+        {"name": "Today", "rawHtml": '<p class="x">Група 1.1. \\"</p>'},
+    ]
+    body = json.dumps({"hydra:member": [{"menuItems": items}, {"menuItems": []}]}).encode()
+
+    # When the body is split at every possible position
+    for split in range(1, len(body)):
+        scanner = MenuItemsScanner(NAMES)
+        scanner.feed(body[:split])
+        scanner.feed(body[split:])
+
+        # Then the wanted item is decoded intact
+        assert scanner.done
+        assert scanner.items == [items[1]]
+
+
+@pytest.mark.parametrize("ensure_ascii", [False, True])
+def test_scanner_keeps_dated_items_of_any_name(ensure_ascii) -> None:
+    # Given a menu with a dated item of an unknown name next to an undated archive
+    items = [
+        {"name": "Today", "rawHtml": "<div><p><b>Графік погодинних відключень на 09.02.2026</b></p></div>"},
+        {"name": "In two days", "rawHtml": "<div><p><b>Графік погодинних відключень на 11.02.2026</b></p></div>"},
+        {"name": "Archive", "rawHtml": "<p>Архів графіків</p>" * 100 + "<p>на 01.01.2026</p>"},
+    ]
+    body = json.dumps({"hydra:member": [{"menuItems": items}]}, ensure_ascii=ensure_ascii).encode()
+
+    # When it is scanned for the named and the dated items
+    scanner = MenuItemsScanner(NAMES, DATED_ITEM_PATTERN)
+    scanner.feed(body)
+
+    # Then the items dated in their title are kept, whether the JSON escapes them or not
+    assert scanner.items == items[:2]
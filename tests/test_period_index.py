@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+import random
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.lviv_poweroff.entities import PowerOffPeriod
+from custom_components.lviv_poweroff.period_index import PowerOffPeriodIndex
+
+TZ = ZoneInfo("Europe/Kyiv")
+START = datetime(2026, 2, 9, tzinfo=TZ)
+
+
+def random_periods(seed: int, count: int) -> list[PowerOffPeriod]:
+    rnd = random.Random(seed)
+    periods = []
+    for _ in range(count):
+        start = START + timedelta(minutes=30 * rnd.randrange(0, 48 * 14))
+        periods.append(PowerOffPeriod(start, start + timedelta(minutes=30 * rnd.randrange(1, 8))))
+    return periods
+
+
+def covered(periods: list[PowerOffPeriod], at: datetime) -> bool:
+    return any(period.start_datetime <= at <= period.end_datetime for period in periods)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_index_matches_linear_scan(seed) -> None:
+    # Given random, possibly overlapping periods over two weeks
+    periods = random_periods(seed, 60)
+    index = PowerOffPeriodIndex(periods)
+
+    # Then the indexed periods are disjoint and sorted
+    assert all(a.end_datetime < b.start_datetime for a, b in zip(index.periods, index.periods[1:]))
+
+    for minutes in range(-60, 60 * 24 * 15, 15):
+        at = START + timedelta(minutes=minutes)
+        until = at + timedelta(hours=24)
+
+        # And point lookups agree with a linear scan
+        assert (index.period_at(at) is not None) == covered(periods, at)
+        position = index.position_at(at)
+        assert (position is not None) == covered(periods, at)
+        assert position is None or index.periods[position] is index.period_at(at)
+
+        # And next transitions are the first bounds after the moment
+        starts = sorted(p.start_datetime for p in index.periods if at < p.start_datetime <= until)
+        ends = sorted(p.end_datetime for p in index.periods if p.end_datetime > at and p.start_datetime <= until)
+        assert index.next_start(at, until) == (starts[0] if starts else None)
+        assert index.next_end(at, until) == (ends[0] if ends else None)
+
+        # And range lookups return every overlapping period
+        expected = [p for p in index.periods if p.start_datetime <= until and p.end_datetime >= at]
+        assert list(index.periods_between(at, until)) == expected
+        assert list(index.periods[index.positions_between(at, until)]) == expected
+
+        # And the next transition is the closest bound of any period
+        bounds = sorted(b for p in index.periods for b in (p.start_datetime, p.end_datetime) if b > at)
+        assert index.next_transition(at) == (bounds[0] if bounds else None)
+
+
+def test_positions_include_the_bounds() -> None:
+    # Given periods 01:00-02:00, 04:00-05:00 and 08:00-09:00
+    index = PowerOffPeriodIndex(
+        [PowerOffPeriod(START + timedelta(hours=h), START + timedelta(hours=h + 1)) for h in (4, 1, 8)]
+    )
+
+    # Then a moment maps to the position of its sorted period, bounds included
+    assert index.position_at(START) is None
+    assert index.position_at(START + timedelta(hours=1)) == 0
+    assert index.position_at(START + timedelta(hours=5)) == 1
+    assert index.position_at(START + timedelta(hours=6)) is None
+    assert index.position_at(START + timedelta(hours=9)) == 2
+
+    # And a range maps to the slice of periods touching it
+    assert index.positions_between(START + timedelta(hours=2), START + timedelta(hours=4)) == slice(0, 2)
+    assert index.positions_between(START + timedelta(hours=5, minutes=1), START + timedelta(hours=7)) == slice(2, 2)
+    assert index.positions_between(START + timedelta(hours=10), START + timedelta(hours=12)) == slice(3, 3)
+    assert index.positions_between(START - timedelta(hours=1), START + timedelta(hours=24)) == slice(0, 3)
@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta
+import random
+from zoneinfo import ZoneInfo
+
+from custom_components.lviv_poweroff.const import POLL_INTERVAL_AWAITING, POLL_JITTER, UPDATE_INTERVAL
+from custom_components.lviv_poweroff.polling import AdaptivePollScheduler
+
+TZ = ZoneInfo("Europe/Kyiv")
+START = datetime(2026, 2, 9, 0, 0, tzinfo=TZ)
+DAYS = 3
+
+
+def publications() -> list[datetime]:
+    """Tomorrow's schedule appears every evening, today's is corrected once at noon."""
+    moments = [START + timedelta(days=day, hours=20, minutes=37) for day in range(DAYS)]
+    moments.append(START + timedelta(days=1, hours=12, minutes=5))
+    return sorted(moments)
+
+
+def test_adaptive_polling_saves_requests_and_detects_faster() -> None:
+    # Given a scheduler polling a source that publishes on the usual pattern
+    scheduler = AdaptivePollScheduler(rng=random.Random(42))
+    pending = publications()
+    detection_delays = []
+    polls = 0
+
+    # When it polls the source for a few days
+    now = START
+    while now < START + timedelta(days=DAYS):
+        polls += 1
+        changed = bool(pending) and pending[0] <= now
+        if changed:
+            detection_delays.append(now - pending.pop(0))
+        tomorrow_published = (now.hour, now.minute) >= (20, 37)
+        now += scheduler.next_interval(now, changed, tomorrow_published)
+
+    # Then it sends fewer requests than the fixed interval would
+    assert polls < DAYS * 24 * 3600 / UPDATE_INTERVAL
+    # And detects every new tomorrow schedule faster than the fixed interval would
+    assert len(detection_delays) == DAYS + 1
+    assert max(detection_delays[:1] + detection_delays[2:]) <= timedelta(
+        seconds=POLL_INTERVAL_AWAITING * (1 + POLL_JITTER)
+    )
+    # And the latest decisions are recorded
+    assert scheduler.decisions.maxlen is not None
+    assert len(scheduler.decisions) == min(polls, scheduler.decisions.maxlen)
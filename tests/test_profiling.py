@@ -0,0 +1,131 @@
+import cProfile
+from pathlib import Path
+import pstats
+import tracemalloc
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.lviv_poweroff import profiling
+from custom_components.lviv_poweroff.const import DOMAIN, SERVICE_PROFILE_REFRESH
+from custom_components.lviv_poweroff.profiling import (
+    _get_coordinator,
+    async_profile_refresh,
+    async_register_services,
+    async_unregister_services,
+    write_report,
+)
+from tests.hass_standin import add_coordinator
+
+BODY = (Path(__file__).parent / "loe_menus_page.json").read_text(encoding="utf-8")
+
+
+def parse_body() -> list[str]:
+    return [BODY.upper() for _ in range(20)]
+
+
+def test_write_report_points_at_the_hotspots(tmp_path) -> None:
+    # Given a profile and a memory snapshot of some parsing work
+    tracemalloc.start()
+    profile = cProfile.Profile()
+    profile.enable()
+    kept = parse_body()
+    profile.disable()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    # When the report is written
+    summary = write_report(profile, snapshot, str(tmp_path / "profile"), 5)
+
+    # Then the stats file can be loaded and the summary lists the hotspots
+    assert pstats.Stats(summary["stats_file"]).total_calls > 0  # type: ignore[attr-defined]
+    assert "parse_body" in Path(summary["summary_file"]).read_text(encoding="utf-8")
+    assert len(summary["top_functions"]) <= 5
+    assert any("upper" in function["function"] for function in summary["top_functions"])
+    # And the memory still held by the work is attributed to its line
+    assert summary["top_allocations"][0]["location"].startswith(__file__)
+    assert summary["top_allocations"][0]["size_kib"] >= len(kept) * len(BODY) / 1024 * 0.9
+
+
+def test_write_report_without_snapshot(tmp_path) -> None:
+    # Given a profile taken without tracemalloc
+    profile = cProfile.Profile()
+    profile.runcall(parse_body)
+
+    # When the report is written
+    summary = write_report(profile, None, str(tmp_path / "profile"), 10)
+
+    # Then only the functions are summarized
+    assert set(summary) == {"stats_file", "summary_file", "top_functions"}
+    assert Path(summary["stats_file"]).exists()
+
+
+@pytest.mark.asyncio
+async def test_profile_refresh_service_reports_the_refresh(hass, hub, tmp_path, standin_server) -> None:
+    # Given two loaded groups and the registered service
+    coordinators = [add_coordinator(hass, hub, group) for group in ("1.1", "2.1")]
+    async_register_services(hass)
+
+    # When a refresh of the second group is profiled with the memory traced
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        {"group": "2.1", "top": "3", "tracemalloc": True},
+        blocking=True,
+        return_response=True,
+    )
+
+    # Then the hub was refreshed and the report was written to the config directory
+    assert response["group"] == "2.1"
+    assert response["hub_update_success"]
+    assert standin_server.requests["loe"] == 1
+    assert Path(response["stats_file"]).parent == tmp_path
+    assert Path(response["summary_file"]).exists()
+    assert 0 < len(response["top_functions"]) <= 3
+    assert response["peak_memory_kib"] > 0
+    assert coordinators[1].periods == hub.get_periods("2.1")
+
+    # And the service is gone once unregistered
+    async_unregister_services(hass)
+    assert not hass.services.has_service(DOMAIN, SERVICE_PROFILE_REFRESH)
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_profile_refresh_rejects_a_concurrent_profile(hass, hub) -> None:
+    # Given a refresh being profiled
+    coordinator = add_coordinator(hass, hub, "1.1")
+
+    async with profiling._profile_lock:
+        # When another one is requested
+        # Then it is rejected without touching the hub
+        with pytest.raises(HomeAssistantError, match="already being profiled"):
+            await async_profile_refresh(hass, coordinator)
+    assert hub.data is None
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_get_coordinator_picks_a_loaded_entry(hass, hub) -> None:
+    # Given no entries
+    # Then there is nothing to profile
+    with pytest.raises(HomeAssistantError, match=f"No loaded {DOMAIN} entry$"):
+        _get_coordinator(hass, None)
+
+    # Given a loaded group and one being unloaded
+    first = add_coordinator(hass, hub, "1.1")
+    second = add_coordinator(hass, hub, "2.1")
+    hass.entries[0].state = ConfigEntryState.NOT_LOADED
+
+    # Then the loaded entry of the group, or the first loaded one is profiled
+    assert _get_coordinator(hass, "2.1") is second
+    assert _get_coordinator(hass, None) is second
+    # And other groups are reported as missing
+    for group in ("1.1", "3.2"):
+        with pytest.raises(HomeAssistantError, match=f"No loaded {DOMAIN} entry for group {group}"):
+            _get_coordinator(hass, group)
+    for coordinator in (first, second):
+        await coordinator.async_shutdown()
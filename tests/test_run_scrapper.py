@@ -0,0 +1,68 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from custom_components.lviv_poweroff.const import PowerOffGroup
+from run_scrapper import parse_args, run
+from tests.standin_server import StandInConfig
+
+
+@pytest.mark.asyncio
+async def test_fetch_once_prints_every_group_as_json(standin_server) -> None:
+    # Given the stand-in LOE API
+    # When the CLI fetches the schedule once
+    out = io.StringIO()
+    status = await run(parse_args([]), out)
+
+    # Then every group is printed with the periods the stand-in published
+    records = json.loads(out.getvalue())
+    assert status == 0
+    assert [record["group"] for record in records] == [group.value for group in PowerOffGroup]
+    for record in records:
+        assert record["periods"] == [
+            {"start": period.start_datetime.isoformat(), "end": period.end_datetime.isoformat()}
+            for period in standin_server.expected_periods(record["group"])
+        ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("standin_server", [StandInConfig(error_rate=1.0)], indirect=True)
+async def test_fetch_once_fails_when_api_is_down(standin_server) -> None:
+    # Given the stand-in LOE API failing every request
+    # When the CLI fetches the schedule once
+    out = io.StringIO()
+    status = await run(parse_args(["-g", "1.1"]), out)
+
+    # Then nothing is printed and the exit status reports the failure
+    assert status == 1
+    assert out.getvalue() == ""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("standin_server", [StandInConfig(change_every=0.3, seed=3)], indirect=True)
+async def test_watch_prints_only_changes_as_ndjson(standin_server) -> None:
+    # Given the stand-in LOE API changing its schedule every 0.3 seconds
+    groups = [group.value for group in PowerOffGroup]
+
+    # When the CLI watches all groups until a change was printed
+    out = io.StringIO()
+    stop = asyncio.Event()
+    task = asyncio.create_task(run(parse_args(["-f", "ndjson", "--watch", "--interval", "0.05"]), out, stop))
+    for _ in range(100):
+        await asyncio.sleep(0.05)
+        if len(out.getvalue().splitlines()) > len(groups):
+            break
+    stop.set()
+    await task
+
+    # Then the full schedule is printed first, then one line per changed period
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [line["group"] for line in lines[: len(groups)]] == groups
+    changes = lines[len(groups) :]
+    assert changes
+    assert {change["change"] for change in changes} <= {"added", "removed"}
+    assert all(set(change) == {"fetched_at", "group", "change", "start", "end"} for change in changes)
+    # And unchanged polls were answered without downloading the body again
+    assert standin_server.responses[304] > 0
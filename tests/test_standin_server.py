@@ -0,0 +1,51 @@
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.lviv_poweroff.const import PowerOffGroup
+from custom_components.lviv_poweroff.energyua_scrapper import EnergyUaScrapper
+from custom_components.lviv_poweroff.hedged_fetch import HedgedFetcher
+from custom_components.lviv_poweroff.loe_scrapper import LoeScrapper
+from tests.standin_server import StandInConfig
+
+TZ = ZoneInfo("Europe/Kyiv")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("standin_server", [StandInConfig(history_items=100)], indirect=True)
+async def test_loe_scrapper_against_standin(standin_server) -> None:
+    # Given the stand-in LOE API serving a large response
+    # When the scrapper polls it twice over real HTTP
+    scrapper = LoeScrapper(None, TZ)
+    first = await scrapper.get_all_power_off_periods()
+    second = await scrapper.get_all_power_off_periods()
+    await scrapper.close()
+
+    # Then every group matches the generated schedule and the second poll is revalidated
+    assert first == {group.value: standin_server.expected_periods(group.value) for group in PowerOffGroup}
+    assert second == first
+    assert standin_server.requests["loe"] == 2
+    assert standin_server.responses[304] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("standin_server", [StandInConfig(error_rate=1.0)], indirect=True)
+async def test_hedged_fetch_against_failing_standin(standin_server) -> None:
+    # Given a stand-in where the LOE API always fails
+    scrapper = LoeScrapper(None, TZ)
+    backup = EnergyUaScrapper("1.1", TZ)
+
+    async def energy_ua():
+        standin_server.config.error_rate = 0.0
+        return {"1.1": await backup.get_power_off_periods()}
+
+    # When the schedule is fetched with Energy UA as a backup
+    fetcher = HedgedFetcher(("loe", scrapper.get_all_power_off_periods), ("energy_ua", energy_ua), 1.0)
+    await fetcher.fetch()
+    await scrapper.close()
+    await backup.close()
+
+    # Then the failure is served over HTTP and Energy UA is asked right away
+    assert standin_server.responses[503] == 1
+    assert standin_server.requests == {"loe": 1, "energy_ua": 1}
+    assert fetcher.stats["loe"].failures == 1
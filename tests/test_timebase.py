@@ -0,0 +1,100 @@
+from datetime import UTC, date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from custom_components.lviv_poweroff.loe_scrapper import extract_day_periods
+from custom_components.lviv_poweroff.timebase import TimeBase
+
+TZ = ZoneInfo("Europe/Kyiv")
+# Europe/Kyiv switches at 03:00 to 04:00 in spring and at 04:00 back to 03:00 in autumn
+SPRING_FORWARD = date(2026, 3, 29)
+FALL_BACK = date(2026, 10, 25)
+
+
+def test_regular_day_matches_wall_clock() -> None:
+    # Given a time base for Europe/Kyiv
+    time_base = TimeBase(TZ)
+
+    # When times of a regular day are built
+    day = date(2026, 2, 9)
+
+    # Then they are the wall clock times of the zone
+    assert time_base.at(day, "09:30") == datetime(2026, 2, 9, 9, 30, tzinfo=TZ)
+    assert time_base.midnight(day) == datetime(2026, 2, 9, tzinfo=TZ)
+    assert time_base.at(day, "24:00") == datetime(2026, 2, 10, tzinfo=TZ)
+    assert time_base.at_minutes(day, 25 * 60) == datetime(2026, 2, 10, 1, tzinfo=TZ)
+
+
+def test_skipped_time_moves_forward_with_the_clocks() -> None:
+    # Given the day Europe/Kyiv switches to summer time
+    time_base = TimeBase(TZ)
+
+    # When the times around the gap are built
+    before = time_base.at(SPRING_FORWARD, "02:00")
+    skipped = time_base.at(SPRING_FORWARD, "03:30")
+    after = time_base.at(SPRING_FORWARD, "05:00")
+
+    # Then the skipped time is moved forward by the hour of the gap
+    assert skipped.utcoffset() == timedelta(hours=3)
+    assert skipped.astimezone(UTC) == datetime(2026, 3, 29, 1, 30, tzinfo=UTC)
+    assert (skipped.hour, skipped.minute) == (4, 30)
+    # And an outage from 02:00 to 05:00 lasts two real hours
+    assert after.astimezone(UTC) - before.astimezone(UTC) == timedelta(hours=2)
+
+
+def test_repeated_time_is_first_occurrence_unless_fold() -> None:
+    # Given the day Europe/Kyiv switches back to winter time
+    time_base = TimeBase(TZ)
+
+    # When a time of the repeated hour is built
+    first = time_base.at(FALL_BACK, "03:30")
+    second = time_base.at(FALL_BACK, "03:30", fold=1)
+
+    # Then the first occurrence is in summer time and fold picks the second one
+    assert first.astimezone(UTC) == datetime(2026, 10, 25, 0, 30, tzinfo=UTC)
+    assert second.astimezone(UTC) == datetime(2026, 10, 25, 1, 30, tzinfo=UTC)
+    assert second.fold == 1
+    # And an outage from 02:00 to 05:00 lasts four real hours
+    before, after = time_base.at(FALL_BACK, "02:00"), time_base.at(FALL_BACK, "05:00")
+    assert after.astimezone(UTC) - before.astimezone(UTC) == timedelta(hours=4)
+
+
+def test_today_is_the_date_in_the_zone() -> None:
+    # Given a time base for Europe/Kyiv
+    time_base = TimeBase(TZ)
+
+    # When it is 23:30 UTC
+    now = datetime(2026, 2, 9, 23, 30, tzinfo=UTC)
+
+    # Then it is already the next day in Kyiv
+    assert time_base.today(now) == date(2026, 2, 10)
+
+
+def test_moments_are_cached_for_the_latest_days() -> None:
+    # Given a time base keeping two days
+    time_base = TimeBase(TZ, days_to_keep=2)
+
+    # When times of three days are built
+    first = time_base.at(date(2026, 2, 9), "09:00")
+    assert time_base.at(date(2026, 2, 9), "09:00") is first
+    time_base.at(date(2026, 2, 10), "09:00")
+    time_base.at(date(2026, 2, 11), "09:00")
+
+    # Then the oldest day is evicted and rebuilt when asked for again
+    assert time_base.at(date(2026, 2, 9), "09:00") is not first
+    assert time_base.at(date(2026, 2, 9), "09:00") == first
+
+
+def test_loe_periods_on_spring_forward_day() -> None:
+    # Given the LOE text of the day Europe/Kyiv switches to summer time
+    text = (
+        "Графік погодинних відключень на 29.03.2026 Група 1.1. Електроенергії немає з 02:00 до 05:00, з 22:00 до 24:00."
+    )
+
+    # When the periods are extracted
+    periods = extract_day_periods(SPRING_FORWARD, text, TimeBase(TZ))["1.1"]
+
+    # Then the bounds are real instants of that day
+    assert [(p.start_datetime.astimezone(UTC), p.end_datetime.astimezone(UTC)) for p in periods] == [
+        (datetime(2026, 3, 29, 0, 0, tzinfo=UTC), datetime(2026, 3, 29, 2, 0, tzinfo=UTC)),
+        (datetime(2026, 3, 29, 19, 0, tzinfo=UTC), datetime(2026, 3, 29, 21, 0, tzinfo=UTC)),
+    ]